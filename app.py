@@ -79,6 +79,47 @@ if 'orchestrator' not in st.session_state:
         st.session_state.active_conversations = {}
         st.session_state.current_conv_id = None
 
+STAGE_LABELS = {
+    'lookup': "📄 Manuscript found",
+    'triage': "🏷️ Query classified",
+    'kb_search': "📚 Similar cases retrieved"
+}
+
+
+def stream_bot_reply(message, conversation):
+    """
+    Process a message and render the bot reply token-by-token
+    
+    Args:
+        message: Customer message
+        conversation: ConversationManager instance
+    
+    Returns:
+        Result dict from the orchestrator
+    """
+    status = st.empty()
+    reply = st.empty()
+    text = ""
+    result = None
+    
+    status.caption("🤖 Processing...")
+    for event in st.session_state.orchestrator.stream_message(message, conversation):
+        if event['type'] == 'stage':
+            status.caption(f"🤖 {STAGE_LABELS.get(event['stage'], event['stage'])}...")
+        elif event['type'] == 'token':
+            text += event['text']
+            reply.markdown(f"""
+            <div class="chat-message bot-message">
+                <div class="message-header bot-header">🤖 Support Bot</div>
+                <div>{text}▌</div>
+            </div>
+            """, unsafe_allow_html=True)
+        elif event['type'] == 'result':
+            result = event['result']
+    
+    status.empty()
+    return result
+
 # Sidebar - Agent Dashboard
 with st.sidebar:
     st.header("🎛️ Agent Dashboard")
@@ -88,6 +129,18 @@ with st.sidebar:
     st.metric("Knowledge Base", f"{stats['knowledge_base']['total_cases']} cases")
     st.metric("Active Chats", len(st.session_state.active_conversations))
     
+    manuscript_stats = stats['manuscripts']
+    if 'error' in manuscript_stats:
+        st.metric("Manuscripts", "Unavailable", help=manuscript_stats['error'])
+        st.warning("⚠️ Manuscript system unavailable - lookups will be escalated")
+    else:
+        avg_review = manuscript_stats.get('average_review_time_days')
+        st.metric(
+            "Manuscripts",
+            f"{manuscript_stats['total_manuscripts']:,}",
+            help=f"Average review time: {avg_review} days" if avg_review is not None else None
+        )
+    
     st.divider()
     
     # Active conversations list
@@ -293,12 +346,7 @@ with tab1:
         for idx, (col, example) in enumerate(zip(example_cols, examples)):
             with col:
                 if st.button(example, key=f"example_{idx}", use_container_width=True):
-                    with st.spinner("🤖 Processing..."):
-                        result = st.session_state.orchestrator.process_message(
-                            example,
-                            conversation,
-                            verbose=False
-                        )
+                    result = stream_bot_reply(example, conversation)
                     st.rerun()
     
     # Input area
@@ -317,12 +365,7 @@ with tab1:
     
     # Process message
     if send_button and user_input and user_input.strip():
-        with st.spinner("🤖 Processing..."):
-            result = st.session_state.orchestrator.process_message(
-                user_input,
-                conversation,
-                verbose=False
-            )
+        result = stream_bot_reply(user_input, conversation)
         st.rerun()
     
     # Agent actions panel (shown when escalated)
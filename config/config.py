@@ -10,13 +10,84 @@ class Config:
     # Claude API Configuration
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
     CLAUDE_MODEL = "claude-sonnet-4-20250514"
+    ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL")  # Set to a local stub for offline testing
+    
+    # LLM Client (shared connection pool, timeouts, retries)
+    LLM_TIMEOUT_SECONDS = 60.0
+    LLM_CONNECT_TIMEOUT_SECONDS = 5.0
+    LLM_MAX_RETRIES = 3
+    LLM_BACKOFF_BASE_SECONDS = 0.5  # Backoff ceiling doubles per retry (full jitter)
+    LLM_BACKOFF_MAX_SECONDS = 8.0
+    LLM_MAX_CONNECTIONS = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS = 20
+    LLM_KEEPALIVE_EXPIRY_SECONDS = 30.0
+    
     # OpenAI Configuration (for embeddings)
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     EMBEDDING_MODEL = "text-embedding-3-small"  # Fast and cost-effective
+    EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "openai")  # "openai" or "local" (hashed n-grams, offline)
+    LOCAL_EMBEDDING_DIM = 512  # Dimensions of the local hashed embeddings
+    EMBEDDING_TIMEOUT_SECONDS = 5.0  # Query embedding timeout before falling back to lexical search
+    
+    # Bulk Embedding Build (knowledge base)
+    EMBEDDING_BUILD_WORKERS = 8  # Concurrent embedding requests
+    EMBEDDING_BUILD_REQUESTS_PER_MINUTE = 3000  # Stay under the API rate limits (None = unlimited)
+    EMBEDDING_BUILD_TOKENS_PER_MINUTE = 1000000
+    EMBEDDING_BUILD_CHECKPOINT_SECONDS = 10  # Progress is saved at most this often
     
     # Agent Configuration
     MAX_TOKENS = 2000
     TEMPERATURE = 0.3  # Lower for consistent outputs
+    PROMPT_CACHING = True  # Mark static system prompts with cache_control
+    MAX_CONCURRENT_MESSAGES = 200  # In-flight messages per event loop (async pipeline)
+    CONCURRENT_PIPELINE = True  # Overlap lookup, triage and KB search within a message
+    PIPELINE_MODE = os.getenv("PIPELINE_MODE", "two_call")  # "two_call" (triage, then response) or "single_call" (one structured call)
+    
+    # Triage Cache
+    TRIAGE_CACHE_ENABLED = True
+    TRIAGE_CACHE_MAX_SIZE = 10000  # In-memory LRU entries
+    TRIAGE_CACHE_TTL_SECONDS = 24 * 3600
+    TRIAGE_CACHE_DB_PATH = os.getenv("TRIAGE_CACHE_DB_PATH")  # SQLite file shared by workers (optional)
+    TRIAGE_CACHE_DB_MAX_ENTRIES = 100000
+    
+    # Local Fast-Path Triage (skips Claude when confident)
+    LOCAL_TRIAGE_ENABLED = True
+    LOCAL_TRIAGE_THRESHOLD = 0.85  # Minimum confidence to skip the Claude call
+    LOCAL_TRIAGE_TEMPERATURE = 0.05  # Softmax temperature over centroid cosine scores
+    LOCAL_TRIAGE_MIN_SIMILARITY = 0.3  # Minimum cosine to the best category centroid (off-topic guard)
+    LOCAL_TRIAGE_MIN_COVERAGE = 0.6  # Minimum share of the query's content words seen in training
+    
+    # Knowledge Base Retrieval
+    KB_SEARCH_MODE = os.getenv("KB_SEARCH_MODE", "vector")  # "vector", "hybrid" (vector + BM25) or "lexical" (BM25 only)
+    KB_HYBRID_FUSION = "rrf"  # "rrf" (reciprocal rank fusion) or "weighted" (score blend)
+    KB_RRF_K = 60  # RRF damping constant
+    KB_HYBRID_LEXICAL_WEIGHT = 0.3  # BM25 share in weighted fusion
+    KB_INDEX = os.getenv("KB_INDEX", "exact")  # "exact" (brute force), "ivf" (approximate, for large KBs) or "int8" (quantized, 4x smaller)
+    KB_IVF_LISTS = None  # IVF clusters (None = about 4 * sqrt(rows))
+    KB_IVF_PROBES = 16  # Clusters scored per query; more = higher recall, slower
+    KB_INT8_RERANK = 4  # int8: rows re-scored at full precision, as a multiple of top_k
+    KB_LEARN_FROM_CONVERSATIONS = os.getenv("KB_LEARN_FROM_CONVERSATIONS", "false").lower() == "true"  # Add closed, non-escalated conversations as cases
+    
+    # Embedding Cache (query and KB-build embeddings)
+    EMBEDDING_CACHE_ENABLED = True
+    EMBEDDING_CACHE_MAX_SIZE = 10000  # In-memory LRU entries
+    EMBEDDING_CACHE_DB_PATH = os.getenv("EMBEDDING_CACHE_DB_PATH")  # SQLite file shared by workers (optional)
+    EMBEDDING_CACHE_DB_MAX_ENTRIES = 1000000
+    
+    # Manuscript Database
+    MANUSCRIPT_BACKEND = os.getenv("MANUSCRIPT_BACKEND", "csv")  # "csv" (loaded into memory), "sqlite" (queried on demand, live updates) or "http" (editorial system API)
+    MANUSCRIPT_DB_PATH = os.getenv("MANUSCRIPT_DB_PATH")  # SQLite file (default: data/manuscripts.db)
+    MANUSCRIPT_DB_POOL_SIZE = 8  # Max open SQLite connections per process
+    MANUSCRIPT_REFRESH_SECONDS = float(os.getenv("MANUSCRIPT_REFRESH_SECONDS", "5"))  # Check the CSV for edits on access at most this often and apply them live (0 = off; CSV backend)
+    MANUSCRIPT_API_URL = os.getenv("MANUSCRIPT_API_URL")  # Editorial system API base URL (http backend)
+    MANUSCRIPT_API_KEY = os.getenv("MANUSCRIPT_API_KEY")  # Bearer token for the editorial system API
+    MANUSCRIPT_API_TIMEOUT_SECONDS = 3.0  # Per-request timeout
+    MANUSCRIPT_API_MAX_RETRIES = 2  # Retries on connection errors and 5xx
+    MANUSCRIPT_API_MAX_CONNECTIONS = 20  # Pooled keep-alive connections per event loop
+    MANUSCRIPT_API_KEEPALIVE_SECONDS = 30.0  # Idle time before a pooled connection is closed
+    MANUSCRIPT_CACHE_TTL_SECONDS = 30  # Reuse an API lookup result this long (status freshness vs load)
+    MANUSCRIPT_CACHE_SIZE = 10000  # Cached API lookup results
+    AUTHOR_SEARCH_MIN_SIMILARITY = 0.5  # Share of query trigrams a typo-tolerant author match must contain (CSV backend)
     
     # Paths
     DATA_DIR = "data"
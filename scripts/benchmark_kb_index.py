@@ -0,0 +1,150 @@
+"""
+Benchmark the knowledge base vector indexes
+
+Builds the exact, IVF and int8 indexes over synthetic clustered embeddings
+and reports build time, resident memory, query latency and recall@k against
+exact float32 search, for several IVF probe counts and int8 re-rank
+shortlists, with and without a category filter. The int8 index re-ranks
+from a memory-mapped copy of the matrix, as in the knowledge base.
+
+Usage:
+    python scripts/benchmark_kb_index.py                       # 100k x 256
+    python scripts/benchmark_kb_index.py --rows 1000000 --dim 1536 --queries 200
+    python scripts/benchmark_kb_index.py --rerank 0,1,4 --probes 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.vector_index import ExactIndex, Int8Index, IVFFlatIndex
+
+
+def synthetic_embeddings(rows, dim, topics, categories, seed):
+    """
+    Clustered unit vectors with a category label per row
+
+    Returns:
+        Tuple of (matrix, labels, queries)
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(topics, dim)).astype(np.float32)
+    topic = rng.integers(topics, size=rows)
+
+    matrix = np.empty((rows, dim), dtype=np.float32)
+    for start in range(0, rows, 100000):
+        end = min(start + 100000, rows)
+        matrix[start:end] = centers[topic[start:end]] + 0.9 * rng.normal(size=(end - start, dim))
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    labels = rng.integers(categories, size=rows).astype(np.int32)
+    return matrix, labels, rng
+
+
+def make_queries(matrix, count, rng):
+    """Perturbed copies of random rows, like unseen customer messages"""
+    queries = matrix[rng.integers(len(matrix), size=count)] + 0.05 * rng.normal(size=(count, matrix.shape[1]))
+    return (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+
+
+def run(index, queries, k, labels):
+    """
+    Search every query
+
+    Returns:
+        Tuple of (list of result row arrays, latencies in ms)
+    """
+    results, latencies = [], []
+    for query, label in zip(queries, labels):
+        start = time.perf_counter()
+        rows, _ = index.search(query, k, label)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(rows)
+    return results, np.array(latencies)
+
+
+def recall(approximate, exact, k):
+    """Mean fraction of the exact top-k found by the approximate search"""
+    return float(np.mean([
+        len(np.intersect1d(a, e)) / min(k, len(e)) if len(e) else 1.0
+        for a, e in zip(approximate, exact)
+    ]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark knowledge base vector indexes")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--lists", type=int, default=None, help="IVF clusters (default about 4 * sqrt(rows))")
+    parser.add_argument("--probes", default="1,4,8,16,32", help="Comma-separated probe counts")
+    parser.add_argument("--rerank", default="0,2,4,10", help="Comma-separated int8 shortlist multiples (0 = no re-rank)")
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("KNOWLEDGE BASE INDEX BENCHMARK")
+    print("=" * 70)
+    print(f"Rows: {args.rows:,}  Dim: {args.dim}  Queries: {args.queries}  k: {args.k}\n")
+
+    matrix, labels, rng = synthetic_embeddings(
+        args.rows, args.dim, topics=max(50, args.rows // 2000), categories=args.categories, seed=args.seed
+    )
+    queries = make_queries(matrix, args.queries, rng)
+    query_labels = rng.integers(args.categories, size=args.queries)
+
+    start = time.perf_counter()
+    exact = ExactIndex().build(matrix, labels)
+    print(f"Exact build: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    ivf = IVFFlatIndex(n_lists=args.lists, seed=args.seed).build(matrix, labels)
+    print(f"IVF build:   {time.perf_counter() - start:.2f}s ({ivf.get_stats()['n_lists']} lists)")
+
+    matrix_path = os.path.join(tempfile.mkdtemp(), "matrix.npy")
+    np.save(matrix_path, matrix)
+    start = time.perf_counter()
+    int8 = Int8Index().build(np.load(matrix_path, mmap_mode='r'), labels)
+    print(f"int8 build:  {time.perf_counter() - start:.2f}s\n")
+
+    megabytes = 1024 ** 2
+    print("Resident memory:")
+    print(f"  {'exact float32':<14} {matrix.nbytes / megabytes:>10.1f} MB")
+    print(f"  {'ivf':<14} {(matrix.nbytes + ivf.order.nbytes + ivf.order_labels.nbytes) / megabytes:>10.1f} MB")
+    print(f"  {'int8':<14} {int8.get_stats()['code_bytes'] / megabytes:>10.1f} MB "
+          f"(+ shortlist rows paged from the {matrix.nbytes / megabytes:.0f} MB memmap)")
+    print(f"  (float64, as np.array of embedding lists produces: {matrix.size * 8 / megabytes:.1f} MB)\n")
+
+    for filtered in (False, True):
+        search_labels = query_labels if filtered else [None] * args.queries
+        truth, latencies = run(exact, queries, args.k, search_labels)
+
+        print(f"{'Category filter' if filtered else 'No filter'}:")
+        print(f"  {'index':<14} | {'p50 ms':>8} | {'p95 ms':>8} | recall@{args.k}")
+        print("  " + "-" * 48)
+        print(f"  {'exact':<14} | {np.percentile(latencies, 50):>8.2f} | {np.percentile(latencies, 95):>8.2f} | 1.000")
+
+        for probes in (int(p) for p in args.probes.split(",")):
+            ivf.n_probe = probes
+            results, latencies = run(ivf, queries, args.k, search_labels)
+            print(f"  {f'ivf probe={probes}':<14} | {np.percentile(latencies, 50):>8.2f} | "
+                  f"{np.percentile(latencies, 95):>8.2f} | {recall(results, truth, args.k):.3f}")
+
+        for rerank in (int(r) for r in args.rerank.split(",")):
+            int8.rerank = rerank
+            results, latencies = run(int8, queries, args.k, search_labels)
+            print(f"  {f'int8 rerank={rerank}':<14} | {np.percentile(latencies, 50):>8.2f} | "
+                  f"{np.percentile(latencies, 95):>8.2f} | {recall(results, truth, args.k):.3f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark the memory footprint of the in-memory manuscript table
+
+Writes a synthetic manuscript CSV (and a Parquet copy when pyarrow is
+installed) and loads it in two layouts:
+
+- row tuples: the previous layout, one tuple of Python objects per row,
+  a dict of IDs and a trigram index over every row's author (pandas
+  read_csv, notes included)
+- columnar: ManuscriptTable, with interned authors and statuses,
+  datetime64 dates and notes left on disk (Parquet: notes packed in memory)
+
+and reports load time, memory retained after loading (and the peak while
+loading), bytes per row and ID lookup latency.
+
+Usage:
+    python scripts/benchmark_manuscript_table.py                 # 200k rows
+    python scripts/benchmark_manuscript_table.py --rows 1000000 --authors 50000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from src.manuscript_table import ManuscriptFile, ManuscriptTable, normalize_id
+from src.trigram_index import TrigramIndex
+
+
+STATUSES = ["Under Review", "Revision Requested", "Accepted", "Rejected", "Decision Pending", "Withdrawn"]
+NOTES = [
+    "Awaiting second reviewer",
+    "Reviewer 2 requested \"minor\" revisions; editor to follow up\nwith the authors next week",
+    "Plagiarism check passed",
+    "Authors asked for an extension, granted until the end of the month"
+]
+
+
+def write_synthetic(path, rows, authors, seed):
+    """
+    Write a manuscript CSV with realistic repetition (authors, statuses) and
+    multi-line quoted notes on a fraction of the rows
+
+    Returns:
+        List of manuscript IDs
+    """
+    rng = np.random.default_rng(seed)
+    ids = [f"MS-{2020 + i % 5}-{i:07d}" for i in range(rows)]
+    submitted = np.datetime64('2022-01-01') + rng.integers(0, 900, size=rows)
+    decided = submitted + rng.integers(20, 200, size=rows)
+    undecided = rng.random(rows) < 0.4
+    with_notes = rng.random(rows) < 0.3
+
+    db = pd.DataFrame({
+        "manuscript_id": ids,
+        "author_name": [f"Dr. Author{i} Surname{i * 7919 % authors}" for i in rng.integers(authors, size=rows)],
+        "submission_date": submitted.astype(str),
+        "current_status": np.array(STATUSES)[rng.integers(len(STATUSES), size=rows)],
+        "reviewer_count": rng.integers(0, 5, size=rows),
+        "decision_date": np.where(undecided, "", decided.astype(str)),
+        "notes": np.where(with_notes, np.array(NOTES, dtype=object)[rng.integers(len(NOTES), size=rows)], "")
+    })
+    db.to_csv(path, index=False)
+    return ids
+
+
+class RowTuples:
+    """The previous layout: a tuple of Python values per row, a dict of IDs, authors indexed per row"""
+
+    def __init__(self, path):
+        db = pd.read_csv(path, dtype={'current_status': 'category'})
+        self.columns = tuple(db.columns)
+        self.rows = list(zip(*(db[column].tolist() for column in self.columns)))
+        self.row_ids = {}
+        for row, record in enumerate(self.rows):
+            self.row_ids.setdefault(normalize_id(record[0]), row)
+        self.author_index = TrigramIndex().build(db['author_name'].tolist())
+
+    def lookup(self, manuscript_id):
+        row = self.row_ids.get(normalize_id(manuscript_id))
+        return None if row is None else dict(zip(self.columns, self.rows[row]))
+
+
+class Columnar:
+    """ManuscriptTable, as CSVManuscriptStore holds it"""
+
+    def __init__(self, path):
+        self.table = ManuscriptTable(ManuscriptFile(path))
+
+    def lookup(self, manuscript_id):
+        row = self.table.find(manuscript_id)
+        return None if row is None else self.table.record(row)
+
+
+def measure(layout, path):
+    """
+    Load a file into a layout, timed, then again under tracemalloc (NumPy
+    buffers are traced too; tracing slows loading down)
+
+    Returns:
+        Tuple of (loaded layout, seconds, retained bytes, peak bytes)
+    """
+    start = time.perf_counter()
+    layout(path)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = layout(path)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return loaded, elapsed, retained, peak
+
+
+def lookup_latency(loaded, ids, count, seed):
+    """Per-lookup latencies in microseconds for random IDs (full records)"""
+    rng = np.random.default_rng(seed)
+    latencies = []
+    for i in rng.integers(len(ids), size=count):
+        start = time.perf_counter()
+        loaded.lookup(ids[i])
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark manuscript table memory")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--authors", type=int, default=20000, help="Distinct authors")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("MANUSCRIPT TABLE MEMORY BENCHMARK")
+    print("=" * 70)
+
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "manuscripts.csv")
+    ids = write_synthetic(csv_path, args.rows, args.authors, args.seed)
+    print(f"Rows: {args.rows:,}  Authors: {args.authors:,}  CSV: {os.path.getsize(csv_path) / 1024 ** 2:.1f} MB\n")
+
+    runs = [("row tuples (csv)", RowTuples, csv_path), ("columnar (csv)", Columnar, csv_path)]
+    try:
+        import pyarrow  # noqa: F401
+
+        parquet_path = os.path.join(directory, "manuscripts.parquet")
+        pd.read_csv(csv_path).to_parquet(parquet_path, row_group_size=65536)
+        runs.append(("columnar (parquet)", Columnar, parquet_path))
+    except ImportError:
+        print("⚠ pyarrow not installed: CSV parsed with pandas, Parquet skipped\n")
+
+    megabytes = 1024 ** 2
+    print(f"  {'layout':<20} | {'load s':>7} | {'retained MB':>11} | {'peak MB':>8} | {'B/row':>6} | "
+          f"{'lookup p50 us':>13} | {'p99 us':>7}")
+    print("  " + "-" * 90)
+    breakdown = None
+    for label, layout, path in runs:
+        loaded, elapsed, retained, peak = measure(layout, path)
+        latencies = lookup_latency(loaded, ids, args.lookups, args.seed)
+        print(f"  {label:<20} | {elapsed:>7.2f} | {retained / megabytes:>11.1f} | {peak / megabytes:>8.1f} | "
+              f"{retained / args.rows:>6.0f} | {np.percentile(latencies, 50):>13.1f} | "
+              f"{np.percentile(latencies, 99):>7.1f}")
+        if isinstance(loaded, Columnar) and breakdown is None:
+            breakdown = loaded.table.memory_usage()
+        del loaded
+        gc.collect()
+
+    print("\nColumnar table (csv) by part:")
+    for part, size in breakdown.items():
+        print(f"  {part:<24} {size / megabytes:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Evaluate the local fast-path triage classifier
+
+Compares local predictions with a reference classification and reports
+agreement and the fraction of Claude calls that would be avoided at each
+confidence threshold.
+
+Usage:
+    python scripts/evaluate_local_triage.py                  # reference = Claude triage
+    python scripts/evaluate_local_triage.py --offline        # reference = CSV labels
+    python scripts/evaluate_local_triage.py --offline --leave-one-out
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from config.config import Config
+from src.local_classifier import LocalTriageClassifier
+
+
+THRESHOLDS = [0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95]
+
+
+def local_predictions(data, leave_one_out):
+    """
+    Predict every row locally
+
+    Args:
+        data: DataFrame with query, category and urgency columns
+        leave_one_out: Train without the row being predicted
+
+    Returns:
+        List of prediction dicts
+    """
+    queries = data['query'].tolist()
+    categories = data['category'].tolist()
+    urgencies = data['urgency'].tolist()
+
+    if not leave_one_out:
+        classifier = LocalTriageClassifier().fit(queries, categories, urgencies)
+        return [classifier.predict(query) for query in queries]
+
+    predictions = []
+    for i, query in enumerate(queries):
+        classifier = LocalTriageClassifier().fit(
+            queries[:i] + queries[i + 1:],
+            categories[:i] + categories[i + 1:],
+            urgencies[:i] + urgencies[i + 1:]
+        )
+        predictions.append(classifier.predict(query))
+    return predictions
+
+
+def reference_labels(data, offline):
+    """
+    Get the reference classification for every row
+
+    Args:
+        data: DataFrame with query, category and urgency columns
+        offline: Use the CSV labels instead of calling Claude
+
+    Returns:
+        List of dicts with category and urgency
+    """
+    if offline:
+        return data[['category', 'urgency']].to_dict('records')
+
+    from src.agents.triage_agent import TriageAgent
+
+    # Reference must come from Claude itself, not from the fast paths
+    agent = TriageAgent()
+    agent.cache = None
+    agent.local_classifier = None
+
+    references = []
+    for idx, query in enumerate(data['query'], 1):
+        references.append(agent.classify(query))
+        print(f"  Claude triage {idx}/{len(data)}", end="\r")
+    print()
+    return references
+
+
+def report(predictions, references):
+    """Print agreement and avoided-call fraction per threshold"""
+    total = len(predictions)
+
+    category_agreement = sum(
+        p['category'] == r.get('category') for p, r in zip(predictions, references)
+    ) / total
+    urgency_agreement = sum(
+        p['urgency'] == r.get('urgency') for p, r in zip(predictions, references)
+    ) / total
+
+    print(f"\nOverall agreement ({total} queries):")
+    print(f"  Category: {category_agreement:.1%}")
+    print(f"  Urgency:  {urgency_agreement:.1%}")
+
+    print("\nThreshold | Calls avoided | Category agree | Urgency agree (on avoided calls)")
+    print("-" * 78)
+    for threshold in THRESHOLDS:
+        confident = [
+            (p, r) for p, r in zip(predictions, references)
+            if p['confidence'] >= threshold
+        ]
+        if confident:
+            category = sum(p['category'] == r.get('category') for p, r in confident) / len(confident)
+            urgency = sum(p['urgency'] == r.get('urgency') for p, r in confident) / len(confident)
+            agreement = f"{category:>14.1%} | {urgency:>13.1%}"
+        else:
+            agreement = f"{'-':>14} | {'-':>13}"
+
+        marker = "  <- configured" if threshold == Config.LOCAL_TRIAGE_THRESHOLD else ""
+        print(f"{threshold:>9.2f} | {len(confident) / total:>13.1%} | {agreement}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate local fast-path triage")
+    parser.add_argument("--data", default=Config.SYNTHETIC_DATA_PATH, help="CSV with labelled queries")
+    parser.add_argument("--offline", action="store_true", help="Compare with CSV labels instead of Claude")
+    parser.add_argument("--leave-one-out", action="store_true", help="Exclude each query from its own training set")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.data)
+
+    print("=" * 70)
+    print("LOCAL TRIAGE EVALUATION")
+    print("=" * 70)
+    print(f"Data: {args.data} ({len(data)} queries)")
+    print(f"Reference: {'CSV labels' if args.offline else 'Claude triage'}")
+    print(f"Leave-one-out: {args.leave_one_out}")
+
+    predictions = local_predictions(data, args.leave_one_out)
+    references = reference_labels(data, args.offline)
+
+    report(predictions, references)
+
+
+if __name__ == "__main__":
+    main()
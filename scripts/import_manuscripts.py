@@ -0,0 +1,59 @@
+"""
+Import the manuscript status CSV into the SQLite manuscript database
+
+Rows are upserted by manuscript_id in chunks, so re-running the import
+applies updates to a live database: running workers see the new rows on
+their next query. Within one CSV the first row of a duplicated ID wins,
+as with the CSV backend.
+
+Usage:
+    python scripts/import_manuscripts.py
+    python scripts/import_manuscripts.py --csv exports/manuscripts.csv --db data/manuscripts.db
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from config.config import Config
+from src.manuscript_store import MANUSCRIPT_COLUMNS, SQLiteManuscriptStore, normalize_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import manuscripts from CSV into SQLite")
+    parser.add_argument("--csv", default=os.path.join(Config.DATA_DIR, "manuscript_status_db.csv"))
+    parser.add_argument("--db", default=Config.MANUSCRIPT_DB_PATH or os.path.join(Config.DATA_DIR, "manuscripts.db"))
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per transaction")
+    args = parser.parse_args()
+
+    store = SQLiteManuscriptStore(args.db)
+    before = store.count()
+
+    start = time.perf_counter()
+    seen = set()
+    written = 0
+    for chunk in pd.read_csv(args.csv, chunksize=args.chunk_size):
+        missing = [column for column in MANUSCRIPT_COLUMNS if column not in chunk.columns]
+        if missing:
+            sys.exit(f"✗ {args.csv} is missing columns: {', '.join(missing)}")
+
+        chunk = chunk[chunk['manuscript_id'].notna()]
+        keys = chunk['manuscript_id'].map(normalize_id)
+        first = ~keys.duplicated() & ~keys.isin(seen)
+        seen.update(keys[first])
+
+        written += store.upsert(chunk[first][list(MANUSCRIPT_COLUMNS)].to_dict('records'))
+        print(f"  {written:,} rows imported")
+
+    print(f"✓ Imported {written:,} manuscripts into {args.db} in {time.perf_counter() - start:.1f}s "
+          f"({store.count() - before:+,} new, {store.count():,} total)")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Local stub of the editorial-management system API for offline testing
+
+Serves the manuscript status CSV through the endpoints the http
+manuscript backend calls (see HTTPManuscriptStore).
+
+Usage:
+    python scripts/stub_editorial_server.py --port 8766 --latency 0.05
+    MANUSCRIPT_BACKEND=http MANUSCRIPT_API_URL=http://127.0.0.1:8766 python src/agents/manuscript_lookup_agent.py
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import Config
+from src.manuscript_store import CSVManuscriptStore
+
+
+class StubState:
+    """Shared, thread-safe request counters for the stub server"""
+
+    def __init__(self, store, fail_first=0, fail_status=503, latency=0.0):
+        self.store = store
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.latency = latency
+        self.requests = 0
+        self.lookups = {}
+        self.connections = set()
+        self.lock = threading.Lock()
+
+    def next_request(self, client_address):
+        """Register a request and return its 1-based sequence number"""
+        with self.lock:
+            self.requests += 1
+            self.connections.add(client_address)
+            return self.requests
+
+    def count_lookup(self, manuscript_id):
+        """Count requests per manuscript ID (to observe caching and coalescing)"""
+        with self.lock:
+            self.lookups[manuscript_id] = self.lookups.get(manuscript_id, 0) + 1
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog large enough for load tests"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # Clients that time out close the connection before the reply
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubEditorialHandler(BaseHTTPRequestHandler):
+    """Handles GET /v1/manuscripts[/{id}] and GET /v1/stats"""
+
+    # HTTP/1.1 keeps connections open so pooling can be observed
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        state = self.server.state
+        url = urlparse(self.path)
+        path = url.path.rstrip("/")
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        sequence = state.next_request(self.client_address)
+
+        if state.latency:
+            time.sleep(state.latency)
+
+        if sequence <= state.fail_first:
+            self._send_json(state.fail_status, {"error": "Stub failure"})
+            return
+
+        store = state.store
+        if path.startswith("/v1/manuscripts/"):
+            manuscript_id = unquote(path[len("/v1/manuscripts/"):])
+            state.count_lookup(manuscript_id)
+            record = store.lookup(manuscript_id)
+            if record is None:
+                self._send_json(404, {"error": f"Manuscript {manuscript_id} not found"})
+            else:
+                self._send_json(200, record)
+        elif path == "/v1/manuscripts" and "author" in query:
+            limit = int(query["limit"]) if "limit" in query else None
+            self._send_json(200, {"manuscripts": store.get_by_author(query["author"], limit)})
+        elif path == "/v1/manuscripts" and "status" in query:
+            self._send_json(200, {"manuscripts": store.get_by_status(query["status"])})
+        elif path == "/v1/stats":
+            self._send_json(200, {
+                "count": store.count(),
+                "status_counts": store.status_counts(),
+                "review_time": store.review_time_stats()
+            })
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _send_json(self, status, body):
+        data = json.dumps(self._json_safe(body)).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @classmethod
+    def _json_safe(cls, value):
+        """Missing CSV fields (NaN) -> null, NumPy scalars -> Python values"""
+        if isinstance(value, dict):
+            return {key: cls._json_safe(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._json_safe(item) for item in value]
+        if hasattr(value, "item"):
+            value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        return value
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start_stub_server(host="127.0.0.1", port=0, csv_path=None, verbose=False, **state_kwargs):
+    """
+    Start the stub server on a background thread
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        csv_path: Manuscript status CSV to serve (default: data/manuscript_status_db.csv)
+        verbose: Log every request
+        **state_kwargs: fail_first, fail_status, latency
+
+    Returns:
+        Tuple of (server, base_url)
+    """
+    store = CSVManuscriptStore(
+        csv_path or os.path.join(Config.DATA_DIR, "manuscript_status_db.csv"),
+        refresh_seconds=Config.MANUSCRIPT_REFRESH_SECONDS
+    )
+
+    server = StubServer((host, port), StubEditorialHandler)
+    server.state = StubState(store, **state_kwargs)
+    server.verbose = verbose
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub editorial-management system API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--csv", default=None, help="Manuscript status CSV to serve")
+    parser.add_argument("--fail-first", type=int, default=0, help="Fail the first N requests")
+    parser.add_argument("--fail-status", type=int, default=503, help="Status code for injected failures")
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial latency per request (seconds)")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        args.host, args.port, csv_path=args.csv, verbose=True,
+        fail_first=args.fail_first, fail_status=args.fail_status, latency=args.latency
+    )
+    print(f"✓ Stub editorial system listening on {base_url}")
+    print(f"  export MANUSCRIPT_BACKEND=http MANUSCRIPT_API_URL={base_url}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
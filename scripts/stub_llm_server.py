@@ -0,0 +1,271 @@
+"""
+Local stub of the Anthropic Messages API for offline testing
+
+Usage:
+    python scripts/stub_llm_server.py --port 8765 --fail-first 2
+    python scripts/stub_llm_server.py --echo   # reply with the request payload
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 python src/agents/triage_agent.py
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    """Shared, thread-safe request counters for the stub server"""
+
+    def __init__(self, fail_first=0, fail_status=529, latency=0.0, reply=None, token_delay=0.0,
+                 echo=False):
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.latency = latency
+        self.reply = reply
+        self.token_delay = token_delay
+        self.echo = echo
+        self.cached_prefixes = set()
+        self.requests = 0
+        self.connections = set()
+        self.lock = threading.Lock()
+
+    def next_request(self, client_address):
+        """Register a request and return its 1-based sequence number"""
+        with self.lock:
+            self.requests += 1
+            self.connections.add(client_address)
+            return self.requests
+
+    def cache_lookup(self, prefix):
+        """Simulate the prompt cache: True if the prefix was written before"""
+        with self.lock:
+            if prefix in self.cached_prefixes:
+                return True
+            self.cached_prefixes.add(prefix)
+            return False
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog large enough for load tests"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class StubMessagesHandler(BaseHTTPRequestHandler):
+    """Handles POST /v1/messages with Anthropic-shaped JSON"""
+
+    # HTTP/1.1 keeps connections open so pooling can be observed
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        state = self.server.state
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if not self.path.rstrip("/").endswith("/v1/messages"):
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        sequence = state.next_request(self.client_address)
+
+        if state.latency:
+            time.sleep(state.latency)
+
+        if sequence <= state.fail_first:
+            self._send_json(
+                state.fail_status,
+                {"type": "error", "error": {"type": "overloaded_error", "message": "Stub failure"}},
+                headers={"retry-after": "0"}
+            )
+            return
+
+        message = self._build_message(payload, sequence)
+        if payload.get("stream"):
+            self._send_stream(message)
+        else:
+            self._send_json(200, message)
+
+    def _build_message(self, payload, sequence):
+        """Build a Messages API response for the request payload"""
+        messages = payload.get("messages") or [{}]
+        prompt = messages[-1].get("content", "")
+        if isinstance(prompt, list):
+            prompt = " ".join(block.get("text", "") for block in prompt)
+
+        if self.server.state.echo:
+            text = json.dumps(payload)
+        else:
+            text = self.server.state.reply or f"Stub reply #{sequence} to: {prompt[:80]}"
+
+        content = [{"type": "text", "text": text}]
+        stop_reason = "end_turn"
+
+        # Forced tool call: answer with an input that satisfies the schema
+        tool_choice = payload.get("tool_choice") or {}
+        if tool_choice.get("type") == "tool":
+            tool = next(t for t in payload.get("tools", []) if t["name"] == tool_choice["name"])
+            content = [{
+                "type": "tool_use",
+                "id": f"toolu_stub_{uuid.uuid4().hex[:12]}",
+                "name": tool["name"],
+                "input": self._tool_input(tool["input_schema"], text)
+            }]
+            stop_reason = "tool_use"
+
+        return {
+            "id": f"msg_stub_{uuid.uuid4().hex[:12]}",
+            "type": "message",
+            "role": "assistant",
+            "model": payload.get("model", "stub"),
+            "content": content,
+            "stop_reason": stop_reason,
+            "stop_sequence": None,
+            "usage": dict(self._input_usage(payload), output_tokens=len(text) // 4)
+        }
+
+    @staticmethod
+    def _tool_input(schema, text):
+        """Fill every property of a tool input schema with a valid placeholder"""
+        values = {}
+        for name, spec in schema.get("properties", {}).items():
+            types = spec.get("type")
+            types = types if isinstance(types, list) else [types]
+            if "enum" in spec:
+                values[name] = spec["enum"][0]
+            elif "boolean" in types:
+                values[name] = True
+            elif "string" in types:
+                values[name] = text
+            else:
+                values[name] = None
+        return values
+
+    def _input_usage(self, payload):
+        """Approximate input token usage, splitting out prompt cache reads/writes"""
+        system = payload.get("system") or ""
+        cached_prefix = ""
+        if isinstance(system, list):
+            marked = [i for i, block in enumerate(system) if block.get("cache_control")]
+            if marked:
+                cached_prefix = "".join(block.get("text", "") for block in system[:marked[-1] + 1])
+
+        total_tokens = len(json.dumps(payload)) // 4
+        cached_tokens = len(cached_prefix) // 4
+        usage = {
+            "input_tokens": total_tokens - cached_tokens,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0
+        }
+        if cached_prefix:
+            field = "cache_read_input_tokens" if self.server.state.cache_lookup(cached_prefix) else "cache_creation_input_tokens"
+            usage[field] = cached_tokens
+        return usage
+
+    def _send_stream(self, message):
+        """Send the message as server-sent events, one word per text delta"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        text = message["content"][0]["text"]
+        start = dict(message, content=[], stop_reason=None)
+        deltas = [word + " " for word in text.split(" ")]
+        deltas[-1] = deltas[-1][:-1]
+
+        self._send_event("message_start", {"type": "message_start", "message": start})
+        self._send_event("content_block_start", {
+            "type": "content_block_start", "index": 0,
+            "content_block": {"type": "text", "text": ""}
+        })
+        for delta in deltas:
+            if self.server.state.token_delay:
+                time.sleep(self.server.state.token_delay)
+            self._send_event("content_block_delta", {
+                "type": "content_block_delta", "index": 0,
+                "delta": {"type": "text_delta", "text": delta}
+            })
+        self._send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._send_event("message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": message["usage"]["output_tokens"]}
+        })
+        self._send_event("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_event(self, event, data):
+        chunk = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start_stub_server(host="127.0.0.1", port=0, verbose=False, **state_kwargs):
+    """
+    Start the stub server on a background thread
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        verbose: Log every request
+        **state_kwargs: fail_first, fail_status, latency, reply, token_delay, echo
+
+    Returns:
+        Tuple of (server, base_url)
+    """
+    server = StubServer((host, port), StubMessagesHandler)
+    server.state = StubState(**state_kwargs)
+    server.verbose = verbose
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Anthropic Messages API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-first", type=int, default=0, help="Fail the first N requests")
+    parser.add_argument("--fail-status", type=int, default=529, help="Status code for injected failures")
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial latency per request (seconds)")
+    parser.add_argument("--reply", default=None, help="Fixed reply text")
+    parser.add_argument("--echo", action="store_true", help="Reply with the JSON request payload")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Delay between streamed deltas (seconds)")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        args.host, args.port, verbose=True,
+        fail_first=args.fail_first, fail_status=args.fail_status,
+        latency=args.latency, reply=args.reply, token_delay=args.token_delay,
+        echo=args.echo
+    )
+    print(f"✓ Stub Messages API listening on {base_url}")
+    print(f"  export ANTHROPIC_BASE_URL={base_url}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
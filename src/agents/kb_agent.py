@@ -1,162 +1,673 @@
 import sys
 sys.path.append('../..')
 
+import asyncio
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: add_cases is serialized within a process only
+    fcntl = None
+
 import pandas as pd
 import numpy as np
-from openai import OpenAI
 from config.config import Config
-import pickle
-import os
+from src.embedding_build import EmbeddingBuilder, RateLimiter
+from src.embedding_cache import EmbeddingCache
+from src.embeddings import get_embedding_provider
+from src.embedding_store import EmbeddingStore
+from src.lexical_index import BM25Index, bm25_candidates, max_normalized, reciprocal_rank_fusion
+from src.vector_index import create_index, top_k as top_k_positions, INDEX_TYPES, Int8Index, IVFFlatIndex
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive advisory lock on path (created if missing)"""
+    with open(path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Closing the file releases the lock
+        yield
 
 
 class KnowledgeBaseAgent:
     """
-    Knowledge Base Agent: Searches for similar past cases using OpenAI embeddings
+    Knowledge Base Agent: Searches for similar past cases using embeddings
+    (OpenAI or local, see Config.EMBEDDING_PROVIDER), BM25 over query and
+    resolution text, or both (Config.KB_SEARCH_MODE)
     """
     
-    def __init__(self, data_path=None):
+    # Case fields returned by search, with the value used when a column is missing
+    RESULT_COLUMNS = {
+        'id': 'N/A',
+        'category': None,
+        'urgency': None,
+        'manuscript_id': 'N/A',
+        'query': None,
+        'resolution': None,
+        'tags': ''
+    }
+    
+    # Similarity scores computed at once by search_many (float32 elements, ~64 MB)
+    SEARCH_MANY_BLOCK_ELEMENTS = 1 << 24
+    
+    def __init__(self, data_path=None, embedder=None):
         """
         Initialize with synthetic data and embeddings
         
         Args:
             data_path: Path to CSV file with historical cases
+            embedder: EmbeddingProvider (default from config)
         """
         if data_path is None:
             data_path = Config.SYNTHETIC_DATA_PATH
         
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.data_path = data_path
+        self.embedder = embedder or get_embedding_provider()
+        
+        # Local embeddings are cheaper to recompute than to look up
+        self.embedding_cache = None
+        if Config.EMBEDDING_CACHE_ENABLED and self.embedder.remote:
+            self.embedding_cache = EmbeddingCache(model=self.embedder.model_id)
+        
+        self.embeddings = None
+        self.store = None
+        self.source_hash = None
         
         try:
             self.data = pd.read_csv(data_path)
             print(f"✓ Loaded {len(self.data)} cases from knowledge base")
+            self.source_hash = EmbeddingStore.file_hash(data_path)
             
-            # Check if embeddings exist, otherwise create them
-            self.embeddings_path = data_path.replace('.csv', '_embeddings.pkl')
-            if os.path.exists(self.embeddings_path):
-                self._load_embeddings()
-            else:
-                print("  Creating embeddings... (this may take a moment)")
-                self._create_embeddings()
+            # Open stored embeddings if they match the CSV, otherwise (re)build them
+            # One store per embedding model, so switching providers keeps both
+            self.store = EmbeddingStore(data_path.replace('.csv', f'_embeddings_{self.embedder.model_id}'))
+            try:
+                if self.store.is_current(self.embedder.model_id, self.source_hash, len(self.data)):
+                    self._load_embeddings()
+                else:
+                    print("  Creating embeddings... (this may take a moment)")
+                    self._create_embeddings(self.source_hash)
+            except Exception as e:
+                # Lexical search still works without embeddings
+                print(f"⚠ Warning: Embeddings unavailable ({e}) - using lexical search only")
+                self.embeddings = None
                 
         except FileNotFoundError:
             print(f"⚠ Warning: Data file not found at {data_path}")
             self.data = pd.DataFrame()
-            self.embeddings = None
+        
+        self.lexical_path = data_path.replace('.csv', '_bm25.npz')
+        self._build_search_index()
+        
+        # Serializes add_cases (searches never wait on it); the lock file
+        # serializes it across processes sharing the knowledge base
+        self._update_lock = threading.Lock()
+        self.lock_path = f"{data_path}.lock"
     
-    def _create_embeddings(self):
-        """Generate embeddings for all cases using OpenAI"""
+    def _create_embeddings(self, source_hash):
+        """
+        Generate embeddings for all cases and store them
+        
+        Rows whose query text is already in the previous store (same model)
+        are copied from it; only new or changed rows are embedded (or taken
+        from the embedding cache). Batches are embedded concurrently under
+        the configured rate limit and streamed into a preallocated on-disk
+        matrix with periodic checkpoints, so an interrupted build resumes
+        where it stopped.
+        
+        Args:
+            source_hash: Content hash of the source CSV
+        """
         queries = self.data['query'].tolist()
+        row_hashes = EmbeddingStore.row_hashes(queries)
+        model = self.embedder.model_id
+        fingerprint = f"{model}:{source_hash}"
+        reused = 0
+        first_batch = []
         
-        # Generate embeddings in batch
-        self.embeddings = []
-        batch_size = 100  # Process 100 at a time
-        
-        for i in range(0, len(queries), batch_size):
-            batch = queries[i:i + batch_size]
-            response = self.client.embeddings.create(
-                model=Config.EMBEDDING_MODEL,
-                input=batch
-            )
-            batch_embeddings = [item.embedding for item in response.data]
-            self.embeddings.extend(batch_embeddings)
+        build = self.store.resume_build(fingerprint, len(queries))
+        if build is not None:
+            matrix, done = build
+            print(f"  Resuming embedding build ({int(done.sum()):,}/{len(done):,} rows done)")
+        else:
+            new_positions, stored_positions = self.store.reusable_rows(row_hashes, model)
+            reused = len(new_positions)
+            
+            previous = self.store.open() if reused else None
+            dim = previous.shape[1] if reused else self.embedder.dimension
+            if dim is None:
+                # Remote models: the first batch tells the dimension (no
+                # rows are reused here, so it is simply the first rows)
+                first_batch = list(range(min(len(queries), self.embedder.batch_size)))
+                first_vectors = np.array(self._embed_texts([queries[i] for i in first_batch]), dtype=np.float32)
+                dim = first_vectors.shape[1]
+            
+            matrix, done = self.store.start_build(len(queries), dim, fingerprint)
+            if reused:
+                matrix[new_positions] = previous[stored_positions]
+                done[new_positions] = True
+                del previous
+            if first_batch:
+                matrix[first_batch] = first_vectors
+                done[first_batch] = True
         
-        self.embeddings = np.array(self.embeddings)
+        rate_limiter = None
+        if self.embedder.remote:
+            rate_limiter = RateLimiter(
+                Config.EMBEDDING_BUILD_REQUESTS_PER_MINUTE, Config.EMBEDDING_BUILD_TOKENS_PER_MINUTE
+            )
+        builder = EmbeddingBuilder(self._embed_texts, self.embedder.batch_size, rate_limiter=rate_limiter)
+        embedded = len(first_batch) + builder.run(
+            queries, matrix, done, checkpoint=lambda: self.store.checkpoint_build(matrix, done, fingerprint)
+        )
         
         # Save embeddings for future use
-        with open(self.embeddings_path, 'wb') as f:
-            pickle.dump(self.embeddings, f)
+        self.store.finish_build(matrix, row_hashes, model, source_hash)
+        del matrix
+        self.embeddings = self.store.open()
+        
+        print(f"  ✓ Created and saved embeddings ({self.embeddings.shape}, "
+              f"{embedded} embedded, {reused} reused)")
+    
+    def _embed_texts(self, texts, timeout=None):
+        """
+        Embed texts in batches, taking what it can from the embedding cache
+        
+        Args:
+            texts: List of strings
+            timeout: Per-request timeout for the provider (None = its default)
+        
+        Returns:
+            List of embedding vectors, one per text
+        """
+        if self.embedding_cache is not None:
+            vectors = self.embedding_cache.get_many(texts)
+        else:
+            vectors = [None] * len(texts)
+        
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        
+        # Generate embeddings in batch
+        batch_size = self.embedder.batch_size
+        
+        for i in range(0, len(missing), batch_size):
+            positions = missing[i:i + batch_size]
+            batch = [texts[j] for j in positions]
+            batch_embeddings = self.embedder.embed(batch, timeout)
+            
+            for j, embedding in zip(positions, batch_embeddings):
+                vectors[j] = embedding
+            if self.embedding_cache is not None:
+                self.embedding_cache.set_many(batch, batch_embeddings)
         
-        print(f"  ✓ Created and saved embeddings ({self.embeddings.shape})")
+        return vectors
     
     def _load_embeddings(self):
-        """Load pre-computed embeddings"""
-        with open(self.embeddings_path, 'rb') as f:
-            self.embeddings = pickle.load(f)
+        """Open pre-computed embeddings (memory-mapped)"""
+        self.embeddings = self.store.open()
         print(f"  ✓ Loaded pre-computed embeddings ({self.embeddings.shape})")
     
-    def search(self, query, category=None, top_k=3):
+    def _build_search_index(self):
+        """
+        Precompute everything search needs that does not depend on the query
+        
+        - columns: result fields as NumPy object arrays, so results are built
+          without going through DataFrame.iloc
+        - labels / category_codes: integer category label per row, for
+          filtered searches
+        - lexical_index: BM25 index over query + resolution text
+        - matrix: the L2-normalized float32 embeddings from the store (still
+          memory-mapped)
+        - index: vector index over the matrix (Config.KB_INDEX); with "int8"
+          only the quantized codes are resident and the matrix pages are
+          read for re-ranked shortlists
+        """
+        self.matrix = None
+        self.labels = None
+        self.category_codes = {}
+        self.index = None
+        self.lexical_index = None
+        self.columns = {}
+        
+        if self.data.empty:
+            return
+        
+        for column, default in self.RESULT_COLUMNS.items():
+            if column in self.data.columns:
+                self.columns[column] = self.data[column].to_numpy(dtype=object)
+            else:
+                self.columns[column] = np.full(len(self.data), default, dtype=object)
+        
+        labels, categories = pd.factorize(self.data['category'])
+        self.labels = labels.astype(np.int32)
+        self.category_codes = {category: code for code, category in enumerate(categories)}
+        
+        self.lexical_index = self._load_or_build_lexical_index()
+        
+        if self.embeddings is None:
+            return
+        
+        # Rows are normalized when the store is written, not on every load
+        self.matrix = np.asarray(self.embeddings, dtype=np.float32)
+        self.index = self._load_or_build_index(self.labels)
+    
+    def _load_or_build_lexical_index(self):
+        """
+        Load the persisted BM25 index, or build and persist it
+        
+        Returns:
+            BM25Index over query + resolution of every case
+        """
+        index = BM25Index.load(self.lexical_path, self.source_hash)
+        if index is None:
+            index = BM25Index().build(self._lexical_documents(self.data))
+            index.save(self.lexical_path, self.source_hash)
+        return index
+    
+    def _load_or_build_index(self, labels):
+        """
+        Create the configured vector index
+        
+        IVF and int8 indexes are persisted next to the embedding store and
+        reused while the source data and build parameters are unchanged.
+        
+        Args:
+            labels: Category code per row
+        
+        Returns:
+            Built VectorIndex
+        """
+        index_type = INDEX_TYPES.get(Config.KB_INDEX)
+        if index_type is None or not index_type.persistent:
+            return create_index(Config.KB_INDEX).build(self.matrix, labels)
+        
+        index = index_type.load(self._index_path(), self.matrix, labels, self._index_fingerprint())
+        if index is None:
+            params = {'n_lists': Config.KB_IVF_LISTS} if index_type is IVFFlatIndex else {}
+            index = create_index(Config.KB_INDEX, **params)
+            index.build(self.matrix, labels)
+            index.save(self._index_path(), self._index_fingerprint())
+            print(f"  ✓ Built {Config.KB_INDEX} index ({len(self.matrix)} rows)")
+        
+        if isinstance(index, IVFFlatIndex):
+            index.n_probe = Config.KB_IVF_PROBES
+        if isinstance(index, Int8Index):
+            index.rerank = Config.KB_INT8_RERANK
+        return index
+    
+    def _index_path(self):
+        return self.store.matrix_path.replace('.npy', f'_{Config.KB_INDEX}.npz')
+    
+    def _index_fingerprint(self):
+        fingerprint = f"{self.source_hash}:{self.embedder.model_id}"
+        return f"{fingerprint}:{Config.KB_IVF_LISTS}" if Config.KB_INDEX == IVFFlatIndex.kind else fingerprint
+    
+    @staticmethod
+    def _lexical_documents(data):
+        """Text indexed by BM25: query + resolution of every case"""
+        return (
+            data['query'].fillna('').astype(str) + ' ' +
+            data['resolution'].fillna('').astype(str)
+        ).tolist()
+    
+    def add_cases(self, cases):
+        """
+        Add resolved cases to the knowledge base without rebuilding it
+        
+        Only the new cases are embedded and tokenized. They are appended to
+        the source CSV and to the embedding store, and inserted into the
+        in-memory columns and indexes (IVF rows join their closest existing
+        cluster). The updated state is built first and swapped in with
+        rows before indexes, so concurrent searches never see an index row
+        that has no case behind it.
+        
+        Writers are serialized by a lock file next to the CSV. A process
+        whose knowledge base is no longer the one on disk (another process
+        added cases since it loaded) is refused, since its indexes would be
+        saved without the other process's cases.
+        
+        Args:
+            cases: List of case dicts (or a DataFrame) with at least query,
+                   category and resolution; missing ids are generated and
+                   tags may be given as lists
+        
+        Returns:
+            Number of cases added
+        
+        Raises:
+            RuntimeError: if the CSV changed on disk since it was loaded
+        """
+        new_cases = pd.DataFrame(cases).reset_index(drop=True)
+        if new_cases.empty:
+            return 0
+        if self.data.empty:
+            raise ValueError(f"No knowledge base loaded from {self.data_path} to add cases to")
+        
+        with self._update_lock, _file_lock(self.lock_path):
+            if EmbeddingStore.file_hash(self.data_path) != self.source_hash:
+                raise RuntimeError(
+                    f"{self.data_path} was changed by another process - reload the knowledge base to add cases"
+                )
+            
+            first_row = len(self.data)
+            if 'id' not in new_cases.columns:
+                new_cases['id'] = None
+            missing_ids = new_cases['id'].isna()
+            new_cases.loc[missing_ids, 'id'] = [
+                f"CASE_{first_row + i + 1:04d}" for i in np.flatnonzero(missing_ids)
+            ]
+            new_cases = new_cases.reindex(columns=self.data.columns)
+            if 'tags' in new_cases.columns:
+                # Stored as pandas writes a list (as generate_data does) and read_csv loads it
+                new_cases['tags'] = [str(list(tags)) if isinstance(tags, (list, tuple)) else tags
+                                     for tags in new_cases['tags']]
+            
+            # Embed before writing anything, so a provider failure changes nothing
+            queries = new_cases['query'].tolist()
+            vectors = None
+            if self.matrix is not None:
+                vectors = np.array(self._embed_texts(queries), dtype=np.float32)
+            
+            # Persist: CSV rows, then embedding rows (store metadata last)
+            new_cases.to_csv(self.data_path, mode='a', header=False, index=False)
+            self.source_hash = EmbeddingStore.file_hash(self.data_path)
+            
+            embeddings = None
+            if vectors is not None:
+                self.store.append(vectors, EmbeddingStore.row_hashes(queries), self.source_hash)
+                embeddings = self.store.open()
+            
+            # Build the updated in-memory state
+            data = pd.concat([self.data, new_cases], ignore_index=True)
+            columns = {
+                column: np.concatenate([
+                    values,
+                    new_cases[column].to_numpy(dtype=object) if column in new_cases.columns
+                    else np.full(len(new_cases), self.RESULT_COLUMNS[column], dtype=object)
+                ])
+                for column, values in self.columns.items()
+            }
+            for category in new_cases['category']:
+                self.category_codes.setdefault(category, len(self.category_codes))
+            new_labels = np.array([self.category_codes[c] for c in new_cases['category']], dtype=np.int32)
+            labels = np.concatenate([self.labels, new_labels])
+            
+            lexical_index = self.lexical_index.add(self._lexical_documents(new_cases))
+            lexical_index.save(self.lexical_path, self.source_hash)
+            
+            matrix = index = None
+            if embeddings is not None:
+                matrix = np.asarray(embeddings, dtype=np.float32)
+                index = self.index.add(matrix, new_labels)
+                if index.persistent:
+                    index.save(self._index_path(), self._index_fingerprint())
+            
+            # Swap in: rows and labels first, then the indexes that point at them
+            self.columns = columns
+            self.labels = labels
+            self.data = data
+            if embeddings is not None:
+                self.embeddings = embeddings
+                self.matrix = matrix
+                self.index = index
+            self.lexical_index = lexical_index
+        
+        print(f"  ✓ Added {len(new_cases)} cases to knowledge base ({len(self.data)} total)")
+        return len(new_cases)
+    
+    def is_ready(self):
+        """Whether cases and embeddings are loaded and searchable"""
+        return not self.data.empty and self.matrix is not None
+    
+    def search(self, query, category=None, top_k=3, mode=None):
         """
-        Search for similar cases using semantic similarity
+        Search for similar cases
+        
+        Falls back to lexical (BM25) search if the query cannot be embedded
+        (no embeddings, or the embedding provider fails or times out).
         
         Args:
             query: Customer query text
             category: Category from triage (optional filter)
             top_k: Number of results to return
+            mode: "vector", "hybrid" or "lexical" (default from config)
         
         Returns:
             List of similar cases (dicts)
         """
-        if self.data.empty or self.embeddings is None:
-            return []
+        mode = mode or Config.KB_SEARCH_MODE
         
-        # Generate embedding for query
-        query_response = self.client.embeddings.create(
-            model=Config.EMBEDDING_MODEL,
-            input=[query]
-        )
-        query_embedding = np.array(query_response.data[0].embedding)
+        if mode != 'lexical' and self.is_ready():
+            try:
+                query_embedding = self.embed_query(query)
+            except Exception as e:
+                print(f"⚠ Embedding failed ({e}) - using lexical search")
+            else:
+                return self.rank(query_embedding, category, top_k, query=query, mode=mode)
         
-        # Filter by category if provided
-        if category and category in Config.CATEGORIES:
-            mask = self.data['category'] == category
-            filtered_indices = self.data[mask].index.tolist()
-            
-            if not filtered_indices:
-                # No cases in this category, search all
-                filtered_indices = list(range(len(self.data)))
-                filtered_embeddings = self.embeddings
+        return self.rank_lexical(query, category, top_k)
+    
+    async def asearch(self, query, category=None, top_k=3, mode=None):
+        """
+        Async variant of search (same arguments and return value)
+        
+        Ranking is CPU-bound and runs in a worker thread.
+        
+        Args:
+            query: Customer query text
+            category: Category from triage (optional filter)
+            top_k: Number of results to return
+            mode: "vector", "hybrid" or "lexical" (default from config)
+        
+        Returns:
+            List of similar cases (dicts)
+        """
+        mode = mode or Config.KB_SEARCH_MODE
+        
+        if mode != 'lexical' and self.is_ready():
+            try:
+                query_embedding = await self.aembed_query(query)
+            except Exception as e:
+                print(f"⚠ Embedding failed ({e}) - using lexical search")
             else:
-                filtered_embeddings = self.embeddings[filtered_indices]
-        else:
-            filtered_indices = list(range(len(self.data)))
-            filtered_embeddings = self.embeddings
+                return await asyncio.to_thread(self.rank, query_embedding, category, top_k, query=query, mode=mode)
         
-        # Calculate cosine similarity
-        similarities = self._cosine_similarity(query_embedding, filtered_embeddings)
+        return await asyncio.to_thread(self.rank_lexical, query, category, top_k)
+    
+    def search_many(self, queries, categories=None, top_k=3, mode=None):
+        """
+        Search for many queries at once (bulk and offline workloads)
         
-        # Get top_k most similar
-        top_indices = np.argsort(similarities)[-top_k:][::-1]
+        Queries are embedded in batches. In vector mode queries are grouped
+        by category filter, all similarities of a block of queries are one
+        matrix-matrix product against that category's rows (exact, whatever
+        Config.KB_INDEX is), and top-k is selected for the whole block with
+        argpartition.
+        
+        Args:
+            queries: List of query texts
+            categories: None, one category for all queries, or one per query
+            top_k: Number of results per query
+            mode: "vector", "hybrid" or "lexical" (default from config)
         
-        # Map back to original indices
-        original_indices = [filtered_indices[i] for i in top_indices]
+        Returns:
+            List with one list of similar cases (as from search) per query
+        """
+        mode = mode or Config.KB_SEARCH_MODE
+        if categories is None or isinstance(categories, str):
+            categories = [categories] * len(queries)
         
-        # Convert to list of dicts
-        results = []
-        for idx, sim_score in zip(original_indices, similarities[top_indices]):
-            row = self.data.iloc[idx]
-            results.append({
-                'id': row.get('id', 'N/A'),
-                'category': row['category'],
-                'urgency': row['urgency'],
-                'manuscript_id': row.get('manuscript_id', 'N/A'),
-                'query': row['query'],
-                'resolution': row['resolution'],
-                'tags': row.get('tags', ''),
-                'relevance_score': float(sim_score)
-            })
+        if mode == 'lexical' or not self.is_ready():
+            return [self.rank_lexical(q, c, top_k) for q, c in zip(queries, categories)]
+        
+        embeddings = np.asarray(self._embed_texts(list(queries)), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
+        
+        if mode == 'hybrid' and self.lexical_index is not None:
+            return [
+                self._rank_hybrid(e, q, c, top_k)
+                for e, q, c in zip(embeddings, queries, categories)
+            ]
+        
+        # Group queries by category filter; each group is scored against
+        # its category's rows only
+        groups = {}
+        for position, category in enumerate(categories):
+            groups.setdefault(self._label(category), []).append(position)
+        
+        results = [None] * len(queries)
+        for label, positions in groups.items():
+            rows = None if label is None else np.flatnonzero(self.labels == label)
+            matrix = self.matrix if rows is None else self.matrix[rows]
+            k = min(top_k, len(matrix))
+            block = max(1, self.SEARCH_MANY_BLOCK_ELEMENTS // max(1, len(matrix)))
+            
+            for start in range(0, len(positions), block):
+                block_positions = positions[start:start + block]
+                scores = embeddings[block_positions] @ matrix.T
+                
+                if k < scores.shape[1]:
+                    top = np.argpartition(scores, -k, axis=1)[:, -k:]
+                else:
+                    top = np.tile(np.arange(scores.shape[1]), (len(scores), 1))
+                top_scores = np.take_along_axis(scores, top, axis=1)
+                order = np.argsort(-top_scores, axis=1)
+                top = np.take_along_axis(top, order, axis=1)
+                top_scores = np.take_along_axis(top_scores, order, axis=1)
+                
+                indices = top if rows is None else rows[top]
+                for position, row_indices, row_scores in zip(block_positions, indices, top_scores):
+                    results[position] = self._results(row_indices, row_scores)
         
         return results
     
-    def _cosine_similarity(self, query_embedding, embeddings):
+    def embed_query(self, query):
+        """Generate the embedding for a single query (cached)"""
+        return np.asarray(
+            self._embed_texts([query], timeout=Config.EMBEDDING_TIMEOUT_SECONDS)[0], dtype=np.float32
+        )
+    
+    async def aembed_query(self, query):
+        """Async variant of embed_query (cache reads and writes run in a worker thread)"""
+        if self.embedding_cache is not None:
+            cached = await asyncio.to_thread(self.embedding_cache.get, query)
+            if cached is not None:
+                return cached
+        
+        embedding = (await self.embedder.aembed([query], timeout=Config.EMBEDDING_TIMEOUT_SECONDS))[0]
+        
+        if self.embedding_cache is not None:
+            await asyncio.to_thread(self.embedding_cache.set, query, embedding)
+        
+        return embedding
+    
+    def rank(self, query_embedding, category=None, top_k=3, query=None, mode=None):
         """
-        Calculate cosine similarity between query and all embeddings
+        Rank knowledge base cases against a query embedding
         
         Args:
-            query_embedding: Single embedding vector
-            embeddings: Matrix of embeddings
+            query_embedding: Embedding vector of the query
+            category: Category from triage (optional filter)
+            top_k: Number of results to return
+            query: Query text (needed for hybrid ranking)
+            mode: "vector", "hybrid" or "lexical" (default from config)
         
         Returns:
-            Array of similarity scores
+            List of similar cases (dicts)
         """
-        # Normalize vectors
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        embeddings_norm = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        mode = mode or Config.KB_SEARCH_MODE
+        if query is not None and self.lexical_index is not None:
+            if mode == 'lexical':
+                return self.rank_lexical(query, category, top_k)
+            if mode == 'hybrid':
+                return self._rank_hybrid(query_embedding, query, category, top_k)
         
-        # Compute cosine similarity
-        similarities = np.dot(embeddings_norm, query_norm)
+        # Get top_k most similar
+        indices, scores = self.index.search(self._normalize_query(query_embedding), top_k, self._label(category))
         
-        return similarities
+        return self._results(indices, scores)
+    
+    def rank_lexical(self, query, category=None, top_k=3):
+        """
+        Rank knowledge base cases by BM25 over query and resolution text
+        
+        relevance_score is the BM25 score scaled by the best match (0-1].
+        
+        Args:
+            query: Query text
+            category: Category from triage (optional filter)
+            top_k: Number of results to return
+        
+        Returns:
+            List of similar cases (dicts)
+        """
+        if self.lexical_index is None:
+            return []
+        
+        scores = self.lexical_index.scores(query)
+        indices, top_scores = bm25_candidates(scores, top_k, self.labels, self._label(category))
+        
+        return self._results(indices, max_normalized(top_scores), lexical_scores=top_scores)
+    
+    def _rank_hybrid(self, query_embedding, query, category, top_k):
+        """
+        Fuse vector and BM25 rankings (Config.KB_HYBRID_FUSION)
+        
+        Candidates are the top results of both rankers; each is scored by
+        both (exact cosine, full BM25), then fused by reciprocal rank or by
+        a weighted blend of cosine and max-normalized BM25.
+        relevance_score stays the cosine similarity.
+        """
+        label = self._label(category)
+        n_candidates = max(50, 10 * top_k)
+        query_vector = self._normalize_query(query_embedding)
+        
+        vector_rows, _ = self.index.search(query_vector, n_candidates, label)
+        lexical_scores = self.lexical_index.scores(query)
+        lexical_rows, _ = bm25_candidates(lexical_scores, n_candidates, self.labels, label)
+        
+        candidates = np.union1d(vector_rows, lexical_rows)
+        cosine = self.matrix[candidates] @ query_vector
+        bm25 = lexical_scores[candidates]
+        
+        if Config.KB_HYBRID_FUSION == 'weighted':
+            weight = Config.KB_HYBRID_LEXICAL_WEIGHT
+            fused = (1 - weight) * cosine + weight * max_normalized(bm25)
+        else:
+            fused = reciprocal_rank_fusion(
+                [cosine, np.where(bm25 > 0, bm25, -np.inf)], k=Config.KB_RRF_K
+            )
+        
+        positions = top_k_positions(fused, top_k)
+        return self._results(candidates[positions], cosine[positions], lexical_scores=bm25[positions])
+    
+    def _label(self, category):
+        """Category filter label (None = search all, also if the category has no cases)"""
+        if category and category in Config.CATEGORIES:
+            return self.category_codes.get(category)
+        return None
+    
+    @staticmethod
+    def _normalize_query(query_embedding):
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+    
+    def _results(self, indices, scores, lexical_scores=None):
+        """Convert row indices and scores to a list of case dicts"""
+        results = []
+        for position, (idx, score) in enumerate(zip(indices, scores)):
+            case = {column: values[idx] for column, values in self.columns.items()}
+            case['relevance_score'] = float(score)
+            if lexical_scores is not None:
+                case['lexical_score'] = float(lexical_scores[position])
+            results.append(case)
+        return results
     
     def get_case_by_id(self, case_id):
         """
@@ -191,7 +702,11 @@ class KnowledgeBaseAgent:
             "total_cases": len(self.data),
             "categories": self.data['category'].value_counts().to_dict(),
             "urgency_distribution": self.data['urgency'].value_counts().to_dict(),
-            "embeddings_ready": self.embeddings is not None
+            "embeddings_ready": self.embeddings is not None,
+            "index": self.index.get_stats() if self.index is not None else None,
+            "lexical_index": self.lexical_index.get_stats() if self.lexical_index is not None else None,
+            "embedder": self.embedder.get_stats(),
+            "embedding_cache": self.embedding_cache.get_stats() if self.embedding_cache else None
         }
 
 
@@ -1,34 +1,47 @@
 import sys
 sys.path.append('../..')
 
-import pandas as pd
 from config.config import Config
+from src.manuscript_store import (
+    create_manuscript_store, CSVManuscriptStore, HTTPManuscriptStore, ManuscriptServiceError, SQLiteManuscriptStore
+)
 import os
 
 
 class ManuscriptLookupAgent:
     """
     Manuscript Lookup Agent: Retrieves REAL manuscript status from database
+    (CSV file, SQLite, or the editorial system API; see Config.MANUSCRIPT_BACKEND)
     """
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, backend=None):
         """
         Initialize with manuscript status database
         
         Args:
-            db_path: Path to manuscript status CSV file
+            db_path: Path to the manuscript status CSV file or SQLite database,
+                     or the editorial system API base URL
+            backend: "csv", "sqlite" or "http" (default from config)
         """
+        backend = backend or Config.MANUSCRIPT_BACKEND
         if db_path is None:
-            db_path = os.path.join(Config.DATA_DIR, "manuscript_status_db.csv")
+            if backend == SQLiteManuscriptStore.name:
+                db_path = Config.MANUSCRIPT_DB_PATH or os.path.join(Config.DATA_DIR, "manuscripts.db")
+            elif backend == HTTPManuscriptStore.name:
+                db_path = Config.MANUSCRIPT_API_URL
+            else:
+                db_path = os.path.join(Config.DATA_DIR, "manuscript_status_db.csv")
         
         self.db_path = db_path
-        
-        try:
-            self.db = pd.read_csv(db_path)
-            print(f"✓ Loaded manuscript database: {len(self.db)} manuscripts")
-        except FileNotFoundError:
-            print(f"⚠ Warning: Manuscript database not found at {db_path}")
-            self.db = pd.DataFrame()
+        if backend == CSVManuscriptStore.name:
+            # One in-memory table per file, however many agents (e.g. one
+            # per app session) are created
+            self.store = CSVManuscriptStore.shared(db_path, refresh_seconds=Config.MANUSCRIPT_REFRESH_SECONDS)
+        else:
+            params = {}
+            if backend == SQLiteManuscriptStore.name:
+                params = {'pool_size': Config.MANUSCRIPT_DB_POOL_SIZE}
+            self.store = create_manuscript_store(backend, db_path, **params)
     
     def lookup(self, manuscript_id):
         """
@@ -40,16 +53,35 @@ class ManuscriptLookupAgent:
         Returns:
             Dict with manuscript details or None if not found
         """
-        if self.db.empty or not manuscript_id:
-            return None
+        return self.store.lookup(manuscript_id)
+    
+    def lookup_many(self, manuscript_ids):
+        """
+        Look up several manuscripts by ID
+        
+        Args:
+            manuscript_ids: List of manuscript identifiers
+        
+        Returns:
+            List with a details dict or None per ID (same order)
+        """
+        return self.store.lookup_many(manuscript_ids)
+    
+    async def alookup(self, manuscript_id):
+        """
+        Async variant of lookup
         
-        # Case-insensitive search
-        result = self.db[self.db['manuscript_id'].str.upper() == manuscript_id.upper()]
+        CSV and SQLite lookups run in a worker thread so the event loop is
+        not blocked; the http backend awaits the editorial system API
+        (cached, with concurrent requests for the same ID coalesced).
         
-        if result.empty:
-            return None
+        Args:
+            manuscript_id: Manuscript identifier (e.g., MS-2024-1234)
         
-        return result.iloc[0].to_dict()
+        Returns:
+            Dict with manuscript details or None if not found
+        """
+        return await self.store.alookup(manuscript_id)
     
     def exists(self, manuscript_id):
         """
@@ -61,24 +93,21 @@ class ManuscriptLookupAgent:
         Returns:
             Boolean
         """
-        return self.lookup(manuscript_id) is not None
+        return self.store.exists(manuscript_id)
     
-    def get_by_author(self, author_name):
+    def get_by_author(self, author_name, limit=None):
         """
         Get all manuscripts by author name
         
         Args:
-            author_name: Author name (partial match)
+            author_name: Author name (partial match; the CSV backend also
+                         tolerates typos)
+            limit: Maximum number of manuscripts (None = all matches)
         
         Returns:
-            List of manuscript dicts
+            List of manuscript dicts, best match first
         """
-        if self.db.empty:
-            return []
-        
-        results = self.db[self.db['author_name'].str.contains(author_name, case=False, na=False)]
-        
-        return results.to_dict('records')
+        return self.store.get_by_author(author_name, limit)
     
     def get_by_status(self, status):
         """
@@ -90,33 +119,54 @@ class ManuscriptLookupAgent:
         Returns:
             List of manuscript dicts
         """
-        if self.db.empty:
-            return []
+        return self.store.get_by_status(status)
+    
+    def refresh(self):
+        """
+        Apply changes made to the database file since it was loaded
         
-        results = self.db[self.db['current_status'].str.contains(status, case=False, na=False)]
+        Runs automatically for the CSV backend, checked on access at most
+        every Config.MANUSCRIPT_REFRESH_SECONDS; SQLite queries always see
+        current data.
         
-        return results.to_dict('records')
+        Returns:
+            Dict describing the applied change, or None if nothing changed
+        """
+        return self.store.refresh()
     
     def get_stats(self):
         """
         Get database statistics
         
+        Counts and review times come from aggregates the store keeps up to
+        date, so this is cheap enough to call on every dashboard refresh.
+        
         Returns:
-            Dict with stats
+            Dict with stats, or with 'error' (plus backend and service
+            counters) if the editorial system API is unavailable
         """
-        if self.db.empty:
-            return {"total_manuscripts": 0, "status_distribution": {}}
+        try:
+            review_times = self.store.review_time_stats()
+            total = self.store.count()
+            status_counts = self.store.status_counts()
+        except ManuscriptServiceError as e:
+            # Report the outage instead of failing the whole dashboard
+            return {
+                "error": str(e),
+                "backend": self.store.name,
+                "service": self.store.get_service_stats()
+            }
+        overall = review_times["overall"]
         
         return {
-            "total_manuscripts": len(self.db),
-            "status_distribution": self.db['current_status'].value_counts().to_dict(),
-            "average_review_time_days": self._calculate_avg_review_time()
+            "total_manuscripts": total,
+            "status_distribution": status_counts,
+            "average_review_time_days": overall["mean_days"] if overall else None,
+            "review_time_days": review_times,
+            "backend": self.store.name,
+            "refresh": self.store.get_refresh_stats(),
+            "service": self.store.get_service_stats()
         }
-    
-    def _calculate_avg_review_time(self):
-        """Calculate average time manuscripts spend in review"""
-        # Simple placeholder - you can enhance this
-        return 45  # days
 
 
 # Test the agent if run directly
@@ -125,8 +175,12 @@ if __name__ == "__main__":
     
     print("\nManuscript Database Statistics:")
     stats = agent.get_stats()
-    print(f"  Total Manuscripts: {stats['total_manuscripts']}")
-    print(f"  Status Distribution: {stats['status_distribution']}")
+    if 'error' in stats:
+        print(f"  ⚠ Unavailable: {stats['error']}")
+    else:
+        print(f"  Total Manuscripts: {stats['total_manuscripts']}")
+        print(f"  Status Distribution: {stats['status_distribution']}")
+        print(f"  Average Review Time: {stats['average_review_time_days']} days")
     
     # Test lookup
     test_id = "MS-2024-1234"
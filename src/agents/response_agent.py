@@ -1,7 +1,10 @@
 import sys
 sys.path.append('../..')
 
-from src.utils import call_claude
+from src.utils import (
+    call_claude, acall_claude, call_claude_stream, call_claude_tool, acall_claude_tool,
+    build_system_blocks
+)
 from config.config import Config
 
 
@@ -66,7 +69,7 @@ Classification:
 
 Generate a helpful, empathetic response to this customer based on the context above."""
 
-        response = call_claude(user_prompt, system_prompt, temperature=0.5)
+        response = call_claude(user_prompt, build_system_blocks(system_prompt), temperature=0.5, stage="response")
         
         return response
     
@@ -132,6 +135,155 @@ Generate a helpful, empathetic response to this customer based on the context ab
         
         Returns:
             Tuple of (response_text, confidence_score, should_escalate)
+        
+        Raises:
+            LLMError: if Claude cannot be reached
+        """
+        system_prompt, user_prompt = self._build_real_data_prompts(
+            customer_query, manuscript_info, triage_result, kb_results, conversation_context
+        )
+        
+        response = call_claude(user_prompt, build_system_blocks(system_prompt), temperature=0.3, stage="response")
+        
+        confidence, should_escalate = self.score_with_real_data(
+            triage_result, kb_results, manuscript_info
+        )
+        
+        return response, confidence, should_escalate
+    
+    async def agenerate_with_real_data(self, customer_query, manuscript_info, triage_result,
+                                       kb_results, conversation_context):
+        """
+        Async variant of generate_with_real_data
+        
+        Args:
+            customer_query: Customer's question
+            manuscript_info: Formatted string with real manuscript data
+            triage_result: Classification from triage
+            kb_results: Similar cases from KB
+            conversation_context: Conversation history string
+        
+        Returns:
+            Tuple of (response_text, confidence_score, should_escalate)
+        
+        Raises:
+            LLMError: if Claude cannot be reached
+        """
+        system_prompt, user_prompt = self._build_real_data_prompts(
+            customer_query, manuscript_info, triage_result, kb_results, conversation_context
+        )
+        
+        response = await acall_claude(user_prompt, build_system_blocks(system_prompt), temperature=0.3, stage="response")
+        
+        confidence, should_escalate = self.score_with_real_data(
+            triage_result, kb_results, manuscript_info
+        )
+        
+        return response, confidence, should_escalate
+    
+    def stream_with_real_data(self, customer_query, manuscript_info, triage_result,
+                              kb_results, conversation_context):
+        """
+        Stream a response grounded in REAL manuscript data
+        
+        Use score_with_real_data for the matching confidence and escalation flag.
+        
+        Args:
+            customer_query: Customer's question
+            manuscript_info: Formatted string with real manuscript data
+            triage_result: Classification from triage
+            kb_results: Similar cases from KB
+            conversation_context: Conversation history string
+        
+        Yields:
+            Text deltas of the response
+        
+        Raises:
+            LLMError: if Claude cannot be reached (possibly mid-stream)
+        """
+        system_prompt, user_prompt = self._build_real_data_prompts(
+            customer_query, manuscript_info, triage_result, kb_results, conversation_context
+        )
+        
+        yield from call_claude_stream(user_prompt, build_system_blocks(system_prompt), temperature=0.3, stage="response")
+    
+    def triage_and_respond(self, customer_query, manuscript_info, kb_results, conversation_context):
+        """
+        Classify the query and write the reply in ONE Claude call
+        
+        Claude is forced to answer through a tool whose input schema holds
+        both the classification and the reply, so no free-text JSON has to
+        be parsed.
+        
+        Args:
+            customer_query: Customer's question
+            manuscript_info: Formatted string with real manuscript data
+            kb_results: Similar cases from KB (not filtered by category)
+            conversation_context: Conversation history string
+        
+        Returns:
+            Tuple of (triage_result, response_text, confidence_score, should_escalate),
+            or None if the call failed
+        """
+        system_prompt, user_prompt = self._build_single_call_prompts(
+            customer_query, manuscript_info, kb_results, conversation_context
+        )
+        
+        structured = call_claude_tool(
+            user_prompt, self._triage_and_respond_tool(), build_system_blocks(system_prompt),
+            temperature=0.3, stage="triage_and_respond"
+        )
+        
+        return self._split_structured_result(structured, kb_results, manuscript_info)
+    
+    async def atriage_and_respond(self, customer_query, manuscript_info, kb_results, conversation_context):
+        """
+        Async variant of triage_and_respond (same arguments and return value)
+        """
+        system_prompt, user_prompt = self._build_single_call_prompts(
+            customer_query, manuscript_info, kb_results, conversation_context
+        )
+        
+        structured = await acall_claude_tool(
+            user_prompt, self._triage_and_respond_tool(), build_system_blocks(system_prompt),
+            temperature=0.3, stage="triage_and_respond"
+        )
+        
+        return self._split_structured_result(structured, kb_results, manuscript_info)
+    
+    def score_with_real_data(self, triage_result, kb_results, manuscript_info):
+        """
+        Calculate confidence and escalation decision for a real-data response
+        
+        Args:
+            triage_result: Classification from triage
+            kb_results: Similar cases from KB
+            manuscript_info: Formatted string with real manuscript data
+        
+        Returns:
+            Tuple of (confidence_score, should_escalate)
+        """
+        # Calculate confidence
+        confidence = self._calculate_confidence_with_data(triage_result, kb_results, manuscript_info)
+        
+        # Escalation logic
+        should_escalate = (
+            confidence < Config.ESCALATION_THRESHOLD or
+            triage_result.get('urgency') == 'high'
+        )
+        
+        return confidence, should_escalate
+    
+    def _build_real_data_prompts(self, customer_query, manuscript_info, triage_result,
+                                 kb_results, conversation_context):
+        """
+        Build the prompts for a response grounded in real manuscript data
+        
+        The system prompt is static (cacheable prefix); manuscript data,
+        conversation context and similar cases go in the user prompt.
+        
+        Returns:
+            Tuple of (system_prompt, user_prompt)
         """
         # Build KB context
         kb_context = self._format_kb_context(kb_results)
@@ -175,19 +327,111 @@ Generate a helpful, empathetic response to this customer based on the context ab
     
     Generate a helpful response based ONLY on the real manuscript data provided above."""
     
-        response = call_claude(user_prompt, system_prompt, temperature=0.3)
+        return system_prompt, user_prompt
+    
+    def _build_single_call_prompts(self, customer_query, manuscript_info, kb_results,
+                                   conversation_context):
+        """
+        Build the prompts for the single-call triage+respond mode
         
-        # Calculate confidence
-        confidence = self._calculate_confidence_with_data(triage_result, kb_results, manuscript_info)
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
+        kb_context = self._format_kb_context(kb_results)
         
-        # Escalation logic
-        should_escalate = (
-            confidence < Config.ESCALATION_THRESHOLD or
-            triage_result.get('urgency') == 'high'
-        )
+        system_prompt = f"""You are a professional customer service agent for an academic journal.
+For every customer message you classify the query AND write the reply, then submit
+both with the triage_and_respond tool.
+
+Classification rules:
+- category is one of: {', '.join(Config.CATEGORIES)}
+- urgency is "high" if: customer is frustrated, mentions delays >8 weeks, needs immediate action
+- urgency is "medium" if: standard timeline concerns, routine follow-ups
+- urgency is "low" if: general questions, no time pressure
+- manuscript_id is the ID in the message (format: MS-YYYY-NNNN) or null
+- issue_summary is under 20 words
+- on_topic is false if the message has nothing to do with manuscripts, submissions,
+  reviews or the journal
+
+CRITICAL RULE: You have access to REAL manuscript data. Use ONLY this information.
+DO NOT make up statuses, dates, or details. If information is missing, say so honestly.
+
+Reply guidelines:
+- Empathetic, professional but warm, clear and specific
+- Answer based on the REAL manuscript data provided
+- Use similar cases only if they match the category you chose
+- Provide actionable next steps
+- Keep the reply concise (2-3 paragraphs)
+- If on_topic is false, reply with a short, polite note that you can only help
+  with manuscript-related questions
+
+DO NOT:
+- Invent information not in the data
+- Make up reviewer names, dates, or decisions
+- Promise things not supported by the data
+"""
         
-        return response, confidence, should_escalate
+        user_prompt = f"""Customer Query: {customer_query}
+
+{manuscript_info}
+
+Conversation Context:
+{conversation_context}
 
+{kb_context}
+
+Classify the query and write the reply based ONLY on the real manuscript data provided above."""
+        
+        return system_prompt, user_prompt
+    
+    @staticmethod
+    def _triage_and_respond_tool():
+        """Tool definition whose input schema is the single-call result"""
+        return {
+            "name": "triage_and_respond",
+            "description": "Submit the classification of the customer query and the reply to send.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "category": {"type": "string", "enum": list(Config.CATEGORIES)},
+                    "urgency": {"type": "string", "enum": list(Config.URGENCY_LEVELS)},
+                    "manuscript_id": {"type": ["string", "null"]},
+                    "issue_summary": {"type": "string"},
+                    "on_topic": {"type": "boolean"},
+                    "response": {"type": "string"}
+                },
+                "required": [
+                    "category", "urgency", "manuscript_id", "issue_summary", "on_topic", "response"
+                ]
+            }
+        }
+    
+    def _split_structured_result(self, structured, kb_results, manuscript_info):
+        """
+        Split the tool input into a triage result and the reply, and score it
+        
+        Returns:
+            Tuple of (triage_result, response_text, confidence_score, should_escalate),
+            or None if the tool input is missing or incomplete
+        """
+        if not structured or not structured.get("response") or not structured.get("category"):
+            return None
+        
+        triage_result = {
+            "category": structured["category"],
+            "urgency": structured.get("urgency", "medium"),
+            "manuscript_id": structured.get("manuscript_id"),
+            "issue_summary": structured.get("issue_summary", ""),
+            "on_topic": structured.get("on_topic", True),
+            "source": "single_call"
+        }
+        
+        confidence, should_escalate = self.score_with_real_data(
+            triage_result, kb_results, manuscript_info
+        )
+        
+        return triage_result, structured["response"], confidence, should_escalate
+    
     def _calculate_confidence_with_data(self, triage_result, kb_results, manuscript_info):
         """Calculate confidence when we have real data"""
         confidence = 0.7  # Higher base because we have real data
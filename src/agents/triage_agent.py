@@ -1,7 +1,12 @@
 import sys
 sys.path.append('../..')
 
-from src.utils import call_claude, extract_json_from_response
+import asyncio
+
+from src.utils import call_claude, acall_claude, extract_json_from_response, build_system_blocks
+from src.triage_cache import TriageCache, triage_fingerprint
+from src.local_classifier import LocalTriageClassifier
+from src.llm_client import LLMError
 from config.config import Config
 
 
@@ -10,9 +15,30 @@ class TriageAgent:
     Triage Agent: Classifies customer queries and extracts key information
     """
     
-    def __init__(self):
+    def __init__(self, cache=None, local_classifier=None):
+        """
+        Args:
+            cache: TriageCache to use (default: a new one if enabled in config)
+            local_classifier: LocalTriageClassifier for the fast path
+                              (default: trained on the KB if enabled in config)
+        """
         self.categories = Config.CATEGORIES
         self.urgency_levels = Config.URGENCY_LEVELS
+        self.stats = {"cache": 0, "local": 0, "claude": 0}
+        
+        if local_classifier is None and Config.LOCAL_TRIAGE_ENABLED:
+            try:
+                local_classifier = LocalTriageClassifier.from_csv()
+            except FileNotFoundError:
+                print("⚠ Warning: Local triage disabled (knowledge base CSV not found)")
+        self.local_classifier = local_classifier
+        
+        if cache is None and Config.TRIAGE_CACHE_ENABLED:
+            cache = TriageCache()
+        self.cache = cache
+        
+        if self.cache is not None:
+            self.cache.purge_stale(self._fingerprint())
     
     def classify(self, query):
         """
@@ -24,7 +50,60 @@ class TriageAgent:
         Returns:
             Dict with category, urgency, manuscript_id, and issue_summary
         """
+        fast_result = self._fast_path(query)
+        if fast_result:
+            return fast_result
+        
+        system_prompt, user_prompt = self._build_prompts(query)
+        
+        self.stats["claude"] += 1
+        try:
+            response = call_claude(user_prompt, build_system_blocks(system_prompt), stage="triage")
+        except LLMError as e:
+            print(f"⚠ Triage call failed: {e}")
+            return self._default_classification()
+        return self._parse_response(query, response)
+    
+    async def aclassify(self, query):
+        """
+        Async variant of classify
+        
+        Args:
+            query: Customer's question/complaint
+        
+        Returns:
+            Dict with category, urgency, manuscript_id, and issue_summary
+        """
+        # The cache (SQLite tier) and the local classifier run in a worker
+        # thread, off the event loop shared by all conversations
+        fast_result = await asyncio.to_thread(self._fast_path, query)
+        if fast_result:
+            return fast_result
+        
+        system_prompt, user_prompt = self._build_prompts(query)
+        
+        self.stats["claude"] += 1
+        try:
+            response = await acall_claude(user_prompt, build_system_blocks(system_prompt), stage="triage")
+        except LLMError as e:
+            print(f"⚠ Triage call failed: {e}")
+            return self._default_classification()
+        # Writes the result to the cache
+        return await asyncio.to_thread(self._parse_response, query, response)
+    
+    def _build_prompts(self, query):
+        """
+        Build the triage prompts
+        
+        The system prompt is identical for every query (cacheable prefix);
+        only the user prompt varies.
         
+        Args:
+            query: Customer's question/complaint
+        
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
         system_prompt = f"""You are a customer service triage specialist for an academic journal. 
 Your job is to analyze customer queries and extract key information.
 
@@ -52,19 +131,85 @@ Rules:
         
         user_prompt = f"Customer Query: {query}"
         
-        response = call_claude(user_prompt, system_prompt)
+        return system_prompt, user_prompt
+    
+    def _fingerprint(self):
+        """Fingerprint of the triage setup; changing it invalidates cached results"""
+        system_prompt, _ = self._build_prompts("")
+        return triage_fingerprint(system_prompt)
+    
+    def _fast_path(self, query):
+        """
+        Classify without calling Claude when possible
+        
+        Tries the triage cache first, then the local classifier if its
+        confidence reaches Config.LOCAL_TRIAGE_THRESHOLD.
+        
+        Args:
+            query: Customer's question/complaint
+        
+        Returns:
+            Classification dict or None if Claude is needed
+        """
+        if self.cache is not None:
+            cached = self.cache.get(query, self._fingerprint())
+            if cached:
+                self.stats["cache"] += 1
+                return cached
+        
+        if self.local_classifier is not None:
+            result = self.local_classifier.predict(query)
+            if result["confidence"] >= Config.LOCAL_TRIAGE_THRESHOLD:
+                self.stats["local"] += 1
+                return result
+        
+        return None
+    
+    def get_stats(self):
+        """
+        Get counts of how each classification was produced
+        
+        Returns:
+            Dict with cache/local/claude counts and the fraction of Claude calls avoided
+        """
+        total = sum(self.stats.values())
+        return {
+            **self.stats,
+            "claude_calls_avoided": round(1 - self.stats["claude"] / total, 3) if total else 0.0
+        }
+    
+    def _parse_response(self, query, response):
+        """
+        Parse Claude's triage response, falling back to a default classification
+        
+        Successfully parsed results are added to the cache.
+        
+        Args:
+            query: Customer's question/complaint
+            response: Raw response text
+        
+        Returns:
+            Dict with category, urgency, manuscript_id, and issue_summary
+        """
         result = extract_json_from_response(response)
         
         if result:
+            if self.cache is not None:
+                self.cache.set(query, result, self._fingerprint())
             return result
         else:
             # Fallback if JSON parsing fails
-            return {
-                "category": "status_inquiry",
-                "urgency": "medium",
-                "manuscript_id": None,
-                "issue_summary": "Unable to classify query"
-            }
+            return self._default_classification()
+    
+    @staticmethod
+    def _default_classification():
+        """Classification used when Claude's answer is missing or unparseable (never cached)"""
+        return {
+            "category": "status_inquiry",
+            "urgency": "medium",
+            "manuscript_id": None,
+            "issue_summary": "Unable to classify query"
+        }
     
     def extract_manuscript_id(self, text):
         """
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import weakref
+
+
+class LoopLocal:
+    """
+    Lazily created per-event-loop resource (async HTTP clients, semaphores)
+
+    asyncio primitives and pooled async clients are bound to the loop they
+    were first used on, so each running loop gets its own instance.
+    """
+
+    def __init__(self, factory):
+        """
+        Args:
+            factory: Zero-argument callable creating the resource
+        """
+        self.factory = factory
+        self._instances = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Get the resource for the currently running loop"""
+        loop = asyncio.get_running_loop()
+        instance = self._instances.get(loop)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(loop)
+                if instance is None:
+                    instance = self.factory()
+                    self._instances[loop] = instance
+        return instance
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded concurrency limiter usable as ``async with limiter:``
+    """
+
+    def __init__(self, limit):
+        """
+        Args:
+            limit: Maximum number of concurrently running blocks per loop
+        """
+        self.limit = limit
+        self._semaphores = LoopLocal(lambda: asyncio.Semaphore(limit))
+        self._active = 0
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        """Wait for a free slot (pair with release, on the same loop)"""
+        await self._semaphores.get().acquire()
+        with self._lock:
+            self._active += 1
+
+    async def release(self):
+        """Free a slot taken with acquire"""
+        with self._lock:
+            self._active -= 1
+        self._semaphores.get().release()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+        return False
+
+    @property
+    def active(self):
+        """Number of blocks currently holding a slot"""
+        return self._active
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop():
+    """
+    Get the long-lived event loop used by the synchronous wrappers
+
+    Keeping one loop alive for the whole process lets the pooled async
+    clients keep their connections between sync calls.
+
+    Returns:
+        Running asyncio event loop on a daemon thread
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="async-runtime",
+                    daemon=True
+                )
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def submit(coro):
+    """
+    Schedule a coroutine on the background loop without waiting
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        concurrent.futures.Future for the result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+
+def run_sync(coro, timeout=None):
+    """
+    Run a coroutine on the background loop and wait for its result
+
+    Must not be called from code running on the background loop itself
+    (it would wait for a result the blocked loop can never produce); await
+    the async variant there instead.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Optional timeout in seconds
+
+    Returns:
+        Result of the coroutine
+
+    Raises:
+        RuntimeError: if called from the background loop
+    """
+    loop = get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            "Synchronous wrapper called from the background event loop (it would deadlock) - "
+            "await the async variant instead"
+        )
+    return submit(coro).result(timeout)
@@ -0,0 +1,281 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with an optional time-to-live
+    """
+
+    def __init__(self, max_size=1000, ttl_seconds=None):
+        """
+        Args:
+            max_size: Maximum number of entries before evicting the least recently used
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Get a value and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = entry
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if full
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, hits, misses, evictions and hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+
+class SQLiteCache:
+    """
+    Persistent key/value cache in SQLite, shared between worker processes
+
+    Values are stored as BLOBs; callers handle serialization. Entries carry a
+    namespace so a configuration change can drop everything written under an
+    older one.
+    """
+
+    def __init__(self, db_path, table="cache", ttl_seconds=None, max_entries=None):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            table: Table name (lets several caches share one file)
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+            max_entries: Size cap; oldest entries are evicted beyond it
+        """
+        self.db_path = db_path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, namespace TEXT, value BLOB, stored_at REAL)"
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table}_stored_at ON {self.table}(stored_at)"
+        )
+        conn.commit()
+
+    def get(self, key):
+        """
+        Get a value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes or None
+        """
+        row = self._connection().execute(
+            f"SELECT value, stored_at FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or (
+            self.ttl_seconds is not None and time.time() - row[1] > self.ttl_seconds
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return row[0]
+
+    def get_many(self, keys):
+        """
+        Get several values in one query
+
+        Args:
+            keys: List of cache keys
+
+        Returns:
+            Dict of key -> stored bytes for the keys that were found
+        """
+        found = {}
+        conn = self._connection()
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value, stored_at FROM {self.table} WHERE key IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for key, value, stored_at in rows:
+                if self.ttl_seconds is None or time.time() - stored_at <= self.ttl_seconds:
+                    found[key] = value
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key, value, namespace=""):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Bytes to store
+            namespace: Namespace tag (see purge_other_namespaces)
+        """
+        self.set_many([(key, value)], namespace)
+
+    def set_many(self, items, namespace=""):
+        """
+        Store several values in one transaction
+
+        Args:
+            items: Iterable of (key, bytes) pairs
+            namespace: Namespace tag (see purge_other_namespaces)
+        """
+        now = time.time()
+        rows = [(key, namespace, sqlite3.Binary(value), now) for key, value in items]
+        if not rows:
+            return
+
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, namespace, value, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+        self._writes += len(rows)
+        if self.max_entries and self._writes >= max(100, self.max_entries // 100):
+            self._writes = 0
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries and the oldest entries beyond max_entries"""
+        conn = self._connection()
+        with conn:
+            if self.ttl_seconds is not None:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE stored_at < ?",
+                    (time.time() - self.ttl_seconds,)
+                )
+            if self.max_entries:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+
+    def purge_other_namespaces(self, namespace):
+        """
+        Delete entries written under any other namespace
+
+        Args:
+            namespace: Namespace to keep
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE namespace != ?", (namespace,))
+
+    def clear(self):
+        """Remove all entries"""
+        conn = self._connection()
+        with conn:
+            conn.execute(f"DELETE FROM {self.table}")
+
+    def __len__(self):
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, hits and misses
+        """
+        return {
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "path": self.db_path
+        }
+
+    def _connection(self):
+        """One connection per thread; WAL lets several processes read while one writes"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -154,6 +154,51 @@ class ConversationManager:
             'last_updated': self.last_updated.isoformat()
         }
     
+    def to_case(self):
+        """
+        Convert a resolved conversation into a knowledge base case
+        
+        The resolution is the last generated answer: a bot turn with triage
+        metadata that did not just acknowledge the customer's thanks. Canned
+        replies (asking for the manuscript ID), escalations and error
+        messages carry no triage metadata and are skipped. The query is the
+        customer's messages since the previous answer, so a question
+        followed by its manuscript ID becomes one query.
+        
+        Returns:
+            Case dict (knowledge base CSV columns), or None unless the
+            conversation is closed, was not escalated, has a category and
+            has a generated answer
+        """
+        if not self.context.get('closed') or self.context['escalated'] or not self.context['category']:
+            return None
+        
+        answers = [position for position, message in enumerate(self.messages)
+                   if message['role'] == 'bot' and message['metadata'].get('triage')]
+        if not answers:
+            return None
+        
+        resolved = [position for position in answers if not self.messages[position]['metadata'].get('closing')]
+        answer = (resolved or answers)[-1]
+        previous = max((position for position in answers if position < answer), default=-1)
+        
+        question = " ".join(message['content'] for message in self.messages[previous + 1:answer]
+                            if message['role'] == 'customer')
+        if not question:
+            return None
+        
+        return {
+            'id': self.conversation_id,
+            'query': question,
+            'category': self.context['category'],
+            'urgency': self.context['urgency'] or 'medium',
+            'manuscript_id': self.context['manuscript_id'] or 'N/A',
+            'resolution': self.messages[answer]['content'],
+            'tags': ['from_conversation'],
+            'created_date': self.created_at.date().isoformat(),
+            'resolution_time_hours': round((self.last_updated - self.created_at).total_seconds() / 3600, 2)
+        }
+    
     def to_dict(self):
         """
         Serialize conversation to dictionary
@@ -0,0 +1,157 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from config.config import Config
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket limiter for requests and tokens per minute
+
+    Each bucket holds up to one minute of budget and refills continuously,
+    so short bursts are allowed but the sustained rate stays under the limit.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None):
+        """
+        Args:
+            requests_per_minute: Request budget (None = unlimited)
+            tokens_per_minute: Token budget (None = unlimited)
+        """
+        self.limits = (requests_per_minute, tokens_per_minute)
+        self._available = [limit or 0.0 for limit in self.limits]
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, tokens=0):
+        """
+        Block until one request of the given size fits the budget
+
+        Args:
+            tokens: Estimated tokens of the request
+        """
+        wanted = (1.0, float(tokens))
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+
+                wait_seconds = 0.0
+                for i, limit in enumerate(self.limits):
+                    if limit is None:
+                        continue
+                    self._available[i] = min(limit, self._available[i] + elapsed * limit / 60)
+                    # A request larger than the whole budget waits for a full bucket
+                    needed = min(wanted[i], limit)
+                    if self._available[i] < needed:
+                        wait_seconds = max(wait_seconds, (needed - self._available[i]) * 60 / limit)
+
+                if wait_seconds == 0.0:
+                    for i, limit in enumerate(self.limits):
+                        if limit is not None:
+                            self._available[i] -= min(wanted[i], limit)
+                    return
+
+                self.waited_seconds += wait_seconds
+            time.sleep(wait_seconds)
+
+
+class EmbeddingBuilder:
+    """
+    Bulk embedding into a preallocated matrix
+
+    Batches are embedded by a bounded pool of worker threads (requests are
+    network-bound) under an optional rate limit. Results are written
+    straight into their rows of the matrix and a done-mask, and a
+    checkpoint callback runs periodically, so an interrupted build can
+    resume from the completed rows.
+    """
+
+    def __init__(self, embed_batch, batch_size, workers=None, rate_limiter=None, checkpoint_seconds=None):
+        """
+        Args:
+            embed_batch: Callable embedding a list of texts into a list of vectors
+            batch_size: Texts per request
+            workers: Concurrent requests (default from config)
+            rate_limiter: Optional RateLimiter acquired before each request
+            checkpoint_seconds: Minimum interval between checkpoints (default from config)
+        """
+        self.embed_batch = embed_batch
+        self.batch_size = batch_size
+        self.workers = workers or Config.EMBEDDING_BUILD_WORKERS
+        self.rate_limiter = rate_limiter
+        self.checkpoint_seconds = (
+            Config.EMBEDDING_BUILD_CHECKPOINT_SECONDS if checkpoint_seconds is None else checkpoint_seconds
+        )
+
+    def run(self, texts, matrix, done, checkpoint=None):
+        """
+        Embed every row that is not done yet
+
+        On failure the batches still queued are cancelled, and every row
+        that was embedded (including batches that finish alongside the
+        failing one) is checkpointed before the error is re-raised.
+
+        Args:
+            texts: List of strings, one per matrix row
+            matrix: Preallocated float32 array (rows x dim), e.g. a memmap
+            done: Boolean array marking rows already embedded (updated in place)
+            checkpoint: Optional zero-argument callable persisting matrix and done
+
+        Returns:
+            Number of rows embedded
+        """
+        pending = np.flatnonzero(~done)
+        batches = (pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size))
+        embedded = 0
+        last_checkpoint = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            in_flight = {}
+            try:
+                while True:
+                    # Keep a bounded number of batches queued
+                    for positions in batches:
+                        in_flight[pool.submit(self._embed, [texts[i] for i in positions])] = positions
+                        if len(in_flight) >= 2 * self.workers:
+                            break
+                    if not in_flight:
+                        break
+
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        positions = in_flight.pop(future)
+                        matrix[positions] = np.asarray(future.result(), dtype=np.float32)
+                        done[positions] = True
+                        embedded += len(positions)
+
+                    if checkpoint is not None and time.monotonic() - last_checkpoint >= self.checkpoint_seconds:
+                        checkpoint()
+                        last_checkpoint = time.monotonic()
+                        print(f"  Embedded {int(done.sum()):,}/{len(done):,} rows")
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                # Batches already running finish anyway (the pool waits for
+                # them on exit), so keep their rows too
+                wait(in_flight)
+                for future, positions in in_flight.items():
+                    if not future.cancelled() and future.exception() is None:
+                        matrix[positions] = np.asarray(future.result(), dtype=np.float32)
+                        done[positions] = True
+                if checkpoint is not None:
+                    checkpoint()
+                raise
+
+        return embedded
+
+    def _embed(self, batch):
+        if self.rate_limiter is not None:
+            # ~4 characters per token
+            self.rate_limiter.acquire(sum(len(str(text)) for text in batch) // 4 + len(batch))
+        return self.embed_batch(batch)
@@ -0,0 +1,133 @@
+import hashlib
+import unicodedata
+
+import numpy as np
+
+from config.config import Config
+from src.cache import LRUCache, SQLiteCache
+
+
+class EmbeddingCache:
+    """
+    Cache of text embeddings keyed on (model, normalized text)
+
+    Two tiers: an in-process LRU of float32 vectors, and an optional SQLite
+    file of packed float32 blobs shared between worker processes. Vectors
+    found only in SQLite are promoted to the LRU.
+    """
+
+    def __init__(self, model=None, max_size=None, db_path=None):
+        """
+        Args:
+            model: Embedding model name (default from config)
+            max_size: In-memory LRU size (default from config)
+            db_path: Optional SQLite file shared between workers (default from config)
+        """
+        self.model = model or Config.EMBEDDING_MODEL
+        self.memory = LRUCache(max_size=max_size or Config.EMBEDDING_CACHE_MAX_SIZE)
+
+        db_path = db_path or Config.EMBEDDING_CACHE_DB_PATH
+        self.persistent = None
+        if db_path:
+            self.persistent = SQLiteCache(
+                db_path,
+                table="embedding_cache",
+                max_entries=Config.EMBEDDING_CACHE_DB_MAX_ENTRIES
+            )
+
+    @staticmethod
+    def normalize(text):
+        """
+        Normalize text for use as a cache key
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            NFKC-normalized, lower-cased text with collapsed whitespace
+        """
+        return " ".join(unicodedata.normalize("NFKC", str(text)).lower().split())
+
+    def get(self, text):
+        """
+        Get a cached embedding
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            float32 vector or None
+        """
+        return self.get_many([text])[0]
+
+    def get_many(self, texts):
+        """
+        Get cached embeddings for several texts (one SQLite query for all misses)
+
+        Args:
+            texts: List of texts
+
+        Returns:
+            List with a float32 vector or None per text
+        """
+        keys = [self._key(text) for text in texts]
+        vectors = [self.memory.get(key) for key in keys]
+
+        missing = [key for key, vector in zip(keys, vectors) if vector is None]
+        if missing and self.persistent is not None:
+            found = self.persistent.get_many(missing)
+            for i, key in enumerate(keys):
+                if vectors[i] is None and key in found:
+                    vectors[i] = np.frombuffer(found[key], dtype=np.float32)
+                    self.memory.set(key, vectors[i])
+
+        return vectors
+
+    def set(self, text, vector):
+        """
+        Cache an embedding
+
+        Args:
+            text: Embedded text
+            vector: Embedding vector
+        """
+        self.set_many([text], [vector])
+
+    def set_many(self, texts, vectors):
+        """
+        Cache several embeddings (one SQLite transaction)
+
+        Args:
+            texts: List of embedded texts
+            vectors: Embedding vector per text
+        """
+        items = []
+        for text, vector in zip(texts, vectors):
+            key = self._key(text)
+            vector = np.array(vector, dtype=np.float32)
+            self.memory.set(key, vector)
+            items.append((key, vector.tobytes()))
+
+        if self.persistent is not None:
+            self.persistent.set_many(items, namespace=self.model)
+
+    def clear(self):
+        """Remove all cached embeddings"""
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with memory and (optional) persistent tier stats
+        """
+        stats = {"model": self.model, "memory": self.memory.get_stats()}
+        if self.persistent is not None:
+            stats["persistent"] = self.persistent.get_stats()
+        return stats
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.model}\0{self.normalize(text)}".encode("utf-8")).hexdigest()
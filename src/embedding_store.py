@@ -0,0 +1,382 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+class EmbeddingStore:
+    """
+    Versioned on-disk embedding matrix, opened with memory mapping
+
+    Files for base path "data/synthetic_data_embeddings":
+    - .npy       float32 matrix, one L2-normalized row per case
+    - _rows.npy  16-byte hash of the embedded text of each row
+    - .json      metadata: format version, model, dimension, row count and
+                 a content hash of the source CSV
+
+    Opening is instant and the OS shares the pages between worker processes.
+    The metadata tells whether the store still matches the source data; when
+    it does not, rows whose text is unchanged can be reused.
+
+    Large builds are written to a separate build file (.build.npy) with a
+    checkpoint of completed rows (.build.npz) and moved into place when
+    complete, so an interrupted build resumes instead of starting over.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, base_path):
+        """
+        Args:
+            base_path: Path prefix of the store files (without extension)
+        """
+        self.matrix_path = f"{base_path}.npy"
+        self.row_hashes_path = f"{base_path}_rows.npy"
+        self.metadata_path = f"{base_path}.json"
+        self.build_path = f"{base_path}.build.npy"
+        self.checkpoint_path = f"{base_path}.build.npz"
+
+    @staticmethod
+    def file_hash(path):
+        """
+        Content hash of a file
+
+        Args:
+            path: File to hash
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def row_hashes(texts):
+        """
+        Hash the text embedded for each row
+
+        Args:
+            texts: List of strings
+
+        Returns:
+            Array of 16-byte digests (dtype S16)
+        """
+        return np.array(
+            [hashlib.blake2b(str(text).encode('utf-8'), digest_size=16).digest() for text in texts],
+            dtype='S16'
+        )
+
+    def read_metadata(self):
+        """
+        Read the metadata sidecar
+
+        Returns:
+            Metadata dict, or None if the store does not exist or is unreadable
+        """
+        try:
+            with open(self.metadata_path) as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get('version') != self.FORMAT_VERSION:
+            return None
+        return metadata
+
+    def is_current(self, model, source_hash, rows):
+        """
+        Whether the stored matrix was built by this model from this source
+
+        Args:
+            model: Embedding model name
+            source_hash: file_hash of the source CSV
+            rows: Expected number of rows
+
+        Returns:
+            Boolean
+        """
+        metadata = self.read_metadata()
+        return (
+            metadata is not None and
+            metadata['model'] == model and
+            metadata['source_hash'] == source_hash and
+            metadata['rows'] == rows and
+            os.path.exists(self.matrix_path)
+        )
+
+    def open(self):
+        """
+        Open the matrix read-only via memmap
+
+        Returns:
+            np.memmap of shape (rows, dim), dtype float32
+        """
+        return np.load(self.matrix_path, mmap_mode='r')
+
+    def reusable_rows(self, row_hashes, model):
+        """
+        Match rows to rows of the existing store that embed the same text
+
+        Args:
+            row_hashes: row_hashes of the new data
+            model: Embedding model name (nothing is reused across models)
+
+        Returns:
+            Tuple of (new_positions, stored_positions) index arrays
+        """
+        empty = np.array([], dtype=np.intp)
+        metadata = self.read_metadata()
+        if metadata is None or metadata['model'] != model:
+            return empty, empty
+
+        try:
+            stored_hashes = np.load(self.row_hashes_path)
+        except (OSError, ValueError):
+            return empty, empty
+
+        stored_index = {digest: position for position, digest in enumerate(stored_hashes.tolist())}
+        pairs = [
+            (position, stored_index[digest])
+            for position, digest in enumerate(row_hashes.tolist())
+            if digest in stored_index
+        ]
+        if not pairs:
+            return empty, empty
+
+        new_positions, stored_positions = zip(*pairs)
+        return np.array(new_positions, dtype=np.intp), np.array(stored_positions, dtype=np.intp)
+
+    def save(self, matrix, row_hashes, model, source_hash):
+        """
+        Write a new version of the store
+
+        Rows are L2-normalized and stored as float32. Each file is written
+        to a temporary path and renamed into place; the metadata goes last,
+        so an interrupted save is detected as stale on the next start.
+        Processes that still map the old matrix keep reading the old file.
+
+        Args:
+            matrix: Embedding matrix (rows x dim)
+            row_hashes: row_hashes of the embedded texts
+            model: Embedding model name
+            source_hash: file_hash of the source CSV
+        """
+        matrix = self._normalize(matrix)
+
+        directory = os.path.dirname(self.matrix_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._write_npy(self.matrix_path, matrix)
+        self._write_npy(self.row_hashes_path, np.asarray(row_hashes, dtype='S16'))
+
+        metadata = {
+            'version': self.FORMAT_VERSION,
+            'model': model,
+            'dim': int(matrix.shape[1]),
+            'rows': int(matrix.shape[0]),
+            'source_hash': source_hash,
+            'normalized': True
+        }
+        self._write_metadata(metadata)
+
+    def start_build(self, rows, dim, fingerprint):
+        """
+        Create a preallocated build matrix
+
+        Args:
+            rows: Number of rows
+            dim: Embedding dimension
+            fingerprint: Identifies what is being built (model and source)
+
+        Returns:
+            Tuple of (writable float32 memmap, boolean done-mask)
+        """
+        directory = os.path.dirname(self.build_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        matrix = np.lib.format.open_memmap(self.build_path, mode='w+', dtype=np.float32, shape=(rows, dim))
+        done = np.zeros(rows, dtype=bool)
+        self.checkpoint_build(matrix, done, fingerprint)
+        return matrix, done
+
+    def resume_build(self, fingerprint, rows):
+        """
+        Reopen an interrupted build of the same data
+
+        Args:
+            fingerprint: Fingerprint passed to start_build
+            rows: Expected number of rows
+
+        Returns:
+            Tuple of (writable memmap, done-mask), or None if there is no
+            matching build to resume
+        """
+        try:
+            with np.load(self.checkpoint_path) as checkpoint:
+                if str(checkpoint['fingerprint']) != fingerprint or len(checkpoint['done']) != rows:
+                    return None
+                done = checkpoint['done'].copy()
+            matrix = np.load(self.build_path, mmap_mode='r+')
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if matrix.shape[0] != rows:
+            return None
+        return matrix, done
+
+    def checkpoint_build(self, matrix, done, fingerprint):
+        """
+        Persist build progress: rows are flushed before they are marked done
+
+        Args:
+            matrix: Build memmap
+            done: Boolean done-mask
+            fingerprint: Fingerprint passed to start_build
+        """
+        matrix.flush()
+        tmp_path = f"{self.checkpoint_path}.tmp.npz"
+        np.savez(tmp_path, fingerprint=np.array(fingerprint), done=done)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def finish_build(self, matrix, row_hashes, model, source_hash, chunk_size=65536):
+        """
+        Normalize a completed build in place and make it the current store
+
+        Args:
+            matrix: Build memmap with every row embedded
+            row_hashes: row_hashes of the embedded texts
+            model: Embedding model name
+            source_hash: file_hash of the source CSV
+            chunk_size: Rows normalized at a time
+        """
+        for start in range(0, len(matrix), chunk_size):
+            matrix[start:start + chunk_size] = self._normalize(matrix[start:start + chunk_size])
+        matrix.flush()
+
+        os.replace(self.build_path, self.matrix_path)
+        self._write_npy(self.row_hashes_path, np.asarray(row_hashes, dtype='S16'))
+        self._write_metadata({
+            'version': self.FORMAT_VERSION,
+            'model': model,
+            'dim': int(matrix.shape[1]),
+            'rows': int(matrix.shape[0]),
+            'source_hash': source_hash,
+            'normalized': True
+        })
+
+        try:
+            os.remove(self.checkpoint_path)
+        except OSError:
+            pass
+
+    def append(self, rows, row_hashes, source_hash):
+        """
+        Add rows to the end of the store without rewriting existing ones
+
+        The new rows are written after the existing data and the .npy
+        header's shape is updated in place (the header keeps its length; if
+        the new shape does not fit the matrix or the row hashes header,
+        nothing is appended and the store is rewritten with save). Rows past
+        metadata['rows'], left by an interrupted append, are overwritten. An
+        interrupted append leaves the metadata unchanged, so the store is
+        detected as stale and its rows reused on the next start. Processes
+        that still map the old matrix keep seeing the old rows.
+
+        Args:
+            rows: Embeddings of the new rows (n x dim)
+            row_hashes: row_hashes of the new rows' texts
+            source_hash: file_hash of the source CSV including the new rows
+        """
+        metadata = self.read_metadata()
+        rows = self._normalize(rows)
+        row_hashes = np.asarray(row_hashes, dtype='S16')
+
+        length = metadata['rows']
+        # Both headers are checked first, so a failed check never leaves
+        # one file grown and the other not
+        fits = (
+            self._append_npy(self.matrix_path, rows, length, check_only=True) and
+            self._append_npy(self.row_hashes_path, row_hashes, length, check_only=True)
+        )
+        if not fits:
+            matrix = np.concatenate([self.open()[:length], rows])
+            hashes = np.concatenate([np.load(self.row_hashes_path)[:length], row_hashes])
+            self.save(matrix, hashes, metadata['model'], source_hash)
+            return
+
+        self._append_npy(self.matrix_path, rows, length)
+        self._append_npy(self.row_hashes_path, row_hashes, length)
+
+        metadata['rows'] += len(rows)
+        metadata['source_hash'] = source_hash
+        self._write_metadata(metadata)
+
+    @staticmethod
+    def _normalize(matrix):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return np.ascontiguousarray(matrix / norms)
+
+    def _write_metadata(self, metadata):
+        tmp_path = f"{self.metadata_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, self.metadata_path)
+
+    @staticmethod
+    def _append_npy(path, array, length, check_only=False):
+        """
+        Append rows to a C-order .npy file in place
+
+        Args:
+            path: .npy file
+            array: Rows to append
+            length: Rows of the file to keep (any rows after them are overwritten)
+            check_only: Only check that the grown shape fits the header
+
+        Returns:
+            False (file untouched) if the grown shape does not fit the header
+        """
+        with open(path, 'r+b') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            data_start = f.tell()
+
+            if fortran_order or dtype != array.dtype or tuple(shape[1:]) != array.shape[1:]:
+                raise ValueError(f"Cannot append {array.dtype}{array.shape} rows to {path}")
+
+            # Header: magic + version (8 bytes), length field, dict padded with spaces
+            preamble = 10 if version == (1, 0) else 12
+            if length > shape[0]:
+                raise ValueError(f"{path} has {shape[0]} rows, expected at least {length}")
+            new_shape = (length + len(array),) + tuple(shape[1:])
+            header = repr({'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': new_shape})
+            if len(header) + 1 > data_start - preamble:
+                return False
+            if check_only:
+                return True
+
+            # Data first (over any rows left by an interrupted append), then the header
+            f.seek(data_start + length * int(np.prod(shape[1:], dtype=np.int64)) * dtype.itemsize)
+            f.write(array.tobytes())
+            f.truncate()
+            f.seek(preamble)
+            f.write((header.ljust(data_start - preamble - 1) + '\n').encode('latin1'))
+        return True
+
+    @staticmethod
+    def _write_npy(path, array):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
@@ -0,0 +1,177 @@
+import asyncio
+import zlib
+from collections import Counter
+
+import numpy as np
+from openai import OpenAI, AsyncOpenAI
+
+from config.config import Config
+from src.async_runtime import LoopLocal
+from src.text_utils import normalize_message
+
+
+class EmbeddingProvider:
+    """
+    Turns texts into embedding vectors
+
+    model_id identifies the vector space: embeddings from providers with
+    different model_ids must never be compared, so it is part of every
+    embedding store, cache key and index fingerprint.
+    """
+
+    model_id = None
+    dimension = None  # None until known (remote models)
+    remote = False  # Whether embedding makes a network call (worth caching)
+    batch_size = 100
+
+    def embed(self, texts, timeout=None):
+        """
+        Embed a batch of texts
+
+        Args:
+            texts: List of strings
+            timeout: Fail fast after this many seconds, without retrying
+                     (remote providers; None = client defaults)
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        raise NotImplementedError
+
+    async def aembed(self, texts, timeout=None):
+        """Async variant of embed (same arguments and return value; runs in a worker thread)"""
+        return await asyncio.to_thread(self.embed, texts, timeout)
+
+    def get_stats(self):
+        """
+        Get provider details
+
+        Returns:
+            Dict with model_id, dimension and whether it is remote
+        """
+        return {"model_id": self.model_id, "dimension": self.dimension, "remote": self.remote}
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """
+    OpenAI embeddings endpoint
+    """
+
+    remote = True
+
+    def __init__(self, model=None, api_key=None):
+        """
+        Args:
+            model: Embedding model name (default from config)
+            api_key: OpenAI API key (default from config)
+        """
+        self.model_id = model or Config.EMBEDDING_MODEL
+        api_key = api_key or Config.OPENAI_API_KEY
+
+        # Async clients are per event loop
+        self.client = OpenAI(api_key=api_key)
+        self._async_clients = LoopLocal(lambda: AsyncOpenAI(api_key=api_key))
+
+    def embed(self, texts, timeout=None):
+        client = self.client
+        if timeout is not None:
+            client = client.with_options(timeout=timeout, max_retries=0)
+        response = client.embeddings.create(model=self.model_id, input=list(texts))
+        return self._to_matrix(response)
+
+    async def aembed(self, texts, timeout=None):
+        client = self._async_clients.get()
+        if timeout is not None:
+            client = client.with_options(timeout=timeout, max_retries=0)
+        response = await client.embeddings.create(model=self.model_id, input=list(texts))
+        return self._to_matrix(response)
+
+    def _to_matrix(self, response):
+        matrix = np.array([item.embedding for item in response.data], dtype=np.float32)
+        self.dimension = matrix.shape[1]
+        return matrix
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Local CPU embeddings: signed feature hashing of n-grams
+
+    Word unigrams, word bigrams and character trigrams of the normalized
+    text (manuscript IDs masked) are hashed into a fixed number of
+    dimensions with a random sign, which is a sparse random projection of
+    the n-gram count vector. Counts are log-scaled and the result is
+    L2-normalized. Needs no training data and no network, so a query
+    embeds in well under a millisecond; quality is lexical rather than
+    semantic.
+    """
+
+    batch_size = 1000
+
+    # Relative weight of each n-gram family
+    WORD_WEIGHT = 1.0
+    BIGRAM_WEIGHT = 0.7
+    CHAR_WEIGHT = 0.3
+
+    def __init__(self, dimension=None):
+        """
+        Args:
+            dimension: Number of hashed dimensions (default from config)
+        """
+        self.dimension = dimension or Config.LOCAL_EMBEDDING_DIM
+        self.model_id = f"local-hashing-{self.dimension}"
+
+    def embed(self, texts, timeout=None):
+        return np.vstack([self._embed_one(text) for text in texts]) if texts else \
+            np.zeros((0, self.dimension), dtype=np.float32)
+
+    def _embed_one(self, text):
+        normalized, _ = normalize_message(text)
+        words = normalized.split()
+
+        features = [(word, self.WORD_WEIGHT) for word in words]
+        features += [(f"{a} {b}", self.BIGRAM_WEIGHT) for a, b in zip(words, words[1:])]
+        for word in words:
+            padded = f"<{word}>"
+            features += [(f"#{padded[i:i + 3]}", self.CHAR_WEIGHT) for i in range(len(padded) - 2)]
+
+        if not features:
+            return np.zeros(self.dimension, dtype=np.float32)
+
+        counts = Counter(features)
+        hashes = np.array([zlib.crc32(feature.encode("utf-8")) for feature, _ in counts], dtype=np.uint64)
+        family_weights = np.array([weight for _, weight in counts], dtype=np.float64)
+        term_frequency = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float64))
+
+        # Lowest hash bit is the sign, the rest picks the dimension
+        signs = np.where(hashes & np.uint64(1), 1.0, -1.0)
+        vector = np.bincount(
+            (hashes >> np.uint64(1)) % np.uint64(self.dimension),
+            weights=signs * family_weights * term_frequency,
+            minlength=self.dimension
+        )
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.astype(np.float32)
+
+
+PROVIDERS = {
+    "openai": OpenAIEmbeddingProvider,
+    "local": HashingEmbeddingProvider
+}
+
+
+def get_embedding_provider(name=None):
+    """
+    Create the configured embedding provider
+
+    Args:
+        name: "openai" or "local" (default from config)
+
+    Returns:
+        EmbeddingProvider
+    """
+    name = name or Config.EMBEDDING_PROVIDER
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown embedding provider: {name} (choose from {', '.join(PROVIDERS)})")
+    return PROVIDERS[name]()
@@ -0,0 +1,262 @@
+import copy
+import os
+from collections import Counter
+
+import numpy as np
+
+from src.text_utils import normalize_message
+from src.vector_index import top_k
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 scoring
+
+    Postings are stored in CSR layout: for term t, postings[offsets[t]:
+    offsets[t + 1]] are the documents containing it (ascending) and
+    frequencies[...] the term counts. idf and length normalization are
+    applied at query time, so documents can be added without re-weighting
+    existing postings; scoring is a few vectorized operations per query term.
+    """
+
+    def __init__(self, k1=1.5, b=0.75):
+        """
+        Args:
+            k1: Term-frequency saturation
+            b: Document-length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.vocabulary = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.postings = np.array([], dtype=np.int32)
+        self.frequencies = np.array([], dtype=np.float32)
+        self.lengths = np.array([], dtype=np.float32)
+        self.average_length = 0.0
+
+    @property
+    def n_documents(self):
+        return len(self.lengths)
+
+    @staticmethod
+    def tokenize(text):
+        """
+        Split text into index terms
+
+        Args:
+            text: Raw text
+
+        Returns:
+            List of lower-case word tokens (manuscript IDs masked)
+        """
+        normalized, _ = normalize_message(text)
+        return normalized.split()
+
+    def build(self, documents):
+        """
+        Index documents
+
+        Args:
+            documents: List of strings, one per row
+
+        Returns:
+            self
+        """
+        built = BM25Index(self.k1, self.b).add(documents)
+        self.__dict__.update(built.__dict__)
+        return self
+
+    def add(self, documents):
+        """
+        Index documents appended after the existing ones
+
+        Only the new documents are tokenized; their postings are inserted
+        at the end of each term's list in one pass. The original index is
+        left untouched, so searches running concurrently stay consistent.
+
+        Args:
+            documents: List of strings, one per new row
+
+        Returns:
+            New BM25Index covering old and new documents
+        """
+        updated = copy.copy(self)
+        updated.vocabulary = dict(self.vocabulary)
+
+        first_doc = self.n_documents
+        term_ids, doc_ids, frequencies = [], [], []
+        lengths = np.zeros(len(documents), dtype=np.float32)
+
+        for i, text in enumerate(documents):
+            tokens = self.tokenize(text)
+            lengths[i] = len(tokens)
+            for term, count in Counter(tokens).items():
+                term_ids.append(updated.vocabulary.setdefault(term, len(updated.vocabulary)))
+                doc_ids.append(first_doc + i)
+                frequencies.append(count)
+
+        term_ids = np.array(term_ids, dtype=np.int64)
+        doc_ids = np.array(doc_ids, dtype=np.int32)
+        frequencies = np.array(frequencies, dtype=np.float32)
+
+        order = np.lexsort((doc_ids, term_ids))
+        term_ids, doc_ids, frequencies = term_ids[order], doc_ids[order], frequencies[order]
+
+        # New terms start with empty posting lists at the end
+        n_terms = len(updated.vocabulary)
+        offsets = np.concatenate([
+            self.offsets,
+            np.full(n_terms + 1 - len(self.offsets), self.offsets[-1], dtype=np.int64)
+        ])
+
+        insert_at = offsets[term_ids + 1]
+        updated.postings = np.insert(self.postings, insert_at, doc_ids)
+        updated.frequencies = np.insert(self.frequencies, insert_at, frequencies)
+        updated.offsets = offsets + np.concatenate([[0], np.cumsum(np.bincount(term_ids, minlength=n_terms))])
+        updated.lengths = np.concatenate([self.lengths, lengths])
+        updated.average_length = float(updated.lengths.mean()) if len(updated.lengths) else 0.0
+        return updated
+
+    def scores(self, query):
+        """
+        BM25 score of every document for a query
+
+        Args:
+            query: Query text
+
+        Returns:
+            float32 array with one score per document (0 = no term matched)
+        """
+        n_documents = self.n_documents
+        scores = np.zeros(n_documents, dtype=np.float32)
+        average_length = max(self.average_length, 1e-9)
+
+        for term, count in Counter(self.tokenize(query)).items():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.postings[start:end]
+            frequencies = self.frequencies[start:end]
+
+            document_frequency = end - start
+            idf = np.log(1 + (n_documents - document_frequency + 0.5) / (document_frequency + 0.5))
+            length_norm = 1 - self.b + self.b * self.lengths[docs] / average_length
+
+            # A document appears once per term, so the fancy-indexed add is safe
+            scores[docs] += count * idf * frequencies * (self.k1 + 1) / (frequencies + self.k1 * length_norm)
+        return scores
+
+    def save(self, path, fingerprint):
+        """
+        Persist the index
+
+        Args:
+            path: .npz file path
+            fingerprint: Identifies the data the index was built from
+        """
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            fingerprint=np.array(fingerprint),
+            params=np.array([self.k1, self.b], dtype=np.float64),
+            terms=np.array(terms, dtype=str),
+            offsets=self.offsets,
+            postings=self.postings,
+            frequencies=self.frequencies,
+            lengths=self.lengths
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """
+        Load a persisted index
+
+        Args:
+            path: .npz file path
+            fingerprint: Expected fingerprint
+
+        Returns:
+            BM25Index, or None if missing or built from other data
+        """
+        try:
+            stored = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        with stored:
+            if str(stored['fingerprint']) != fingerprint or 'frequencies' not in stored:
+                return None
+
+            k1, b = stored['params']
+            index = cls(float(k1), float(b))
+            index.vocabulary = {term: i for i, term in enumerate(stored['terms'].tolist())}
+            index.offsets = stored['offsets']
+            index.postings = stored['postings']
+            index.frequencies = stored['frequencies']
+            index.lengths = stored['lengths']
+            index.average_length = float(index.lengths.mean()) if len(index.lengths) else 0.0
+
+        return index
+
+    def get_stats(self):
+        """
+        Get index statistics
+
+        Returns:
+            Dict with document, term and posting counts
+        """
+        return {
+            "documents": self.n_documents,
+            "terms": len(self.vocabulary),
+            "postings": len(self.postings)
+        }
+
+
+def reciprocal_rank_fusion(score_lists, k=60):
+    """
+    Fuse several score arrays over the same candidates by rank
+
+    Args:
+        score_lists: List of arrays (same length); -inf means the candidate
+                     was not retrieved by that ranker
+        k: RRF damping constant
+
+    Returns:
+        Array of fused scores
+    """
+    fused = np.zeros(len(score_lists[0]), dtype=np.float64)
+    for scores in score_lists:
+        ranks = np.empty(len(scores), dtype=np.float64)
+        ranks[np.argsort(-scores, kind='stable')] = np.arange(1, len(scores) + 1)
+        fused += np.where(np.isfinite(scores), 1.0 / (k + ranks), 0.0)
+    return fused
+
+
+def max_normalized(scores):
+    """Scale scores into [0, 1] by the maximum (all zeros stay zero)"""
+    top = scores.max() if len(scores) else 0.0
+    return scores / top if top > 0 else np.zeros_like(scores)
+
+
+def bm25_candidates(scores, k, labels=None, label=None):
+    """
+    Top-k documents by BM25 score
+
+    Args:
+        scores: Output of BM25Index.scores
+        k: Number of documents
+        labels: Optional integer label per document
+        label: Only return documents with this label (None = all)
+
+    Returns:
+        Tuple of (row indices, scores), best first; only positive scores
+    """
+    matched = np.flatnonzero(scores > 0)
+    if label is not None:
+        matched = matched[labels[matched] == label]
+
+    positions = top_k(scores[matched], k)
+    return matched[positions], scores[matched[positions]]
@@ -0,0 +1,306 @@
+import asyncio
+import random
+import threading
+import time
+
+import anthropic
+import httpx
+
+from config.config import Config
+from src.metrics import latency_tracker
+from src.async_runtime import LoopLocal
+
+
+# 408/409 are retried by the official SDK too; 529 is Anthropic's "overloaded"
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class LLMError(Exception):
+    """Raised when a Claude call fails permanently or after all retries"""
+
+
+class LLMClient:
+    """
+    Process-wide Claude client with a shared keep-alive connection pool,
+    per-call timeouts, jittered exponential backoff and latency stats
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_retries=None, tracker=None):
+        """
+        Args:
+            api_key: Anthropic API key (default from config)
+            base_url: API base URL, e.g. a local stub server (default from config)
+            max_retries: Retries for 429/5xx/connection errors (default from config)
+            tracker: LatencyTracker receiving per-stage timings
+        """
+        self.max_retries = Config.LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.tracker = tracker or latency_tracker
+        self._api_key = api_key or Config.ANTHROPIC_API_KEY
+        self._base_url = base_url or Config.ANTHROPIC_BASE_URL
+
+        self.http_client = anthropic.DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=Config.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Config.LLM_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            timeout=self._default_timeout()
+        )
+
+        # Retries are handled here so they can be jittered and counted per stage
+        self.client = anthropic.Anthropic(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            http_client=self.http_client,
+            max_retries=0
+        )
+
+        # Async clients are bound to an event loop, so keep one pool per loop
+        self._async_clients = LoopLocal(self._create_async_client)
+
+        self._lock = threading.Lock()
+        self._counters = {"calls": 0, "retries": 0, "errors": 0}
+        self._usage = {}
+
+    def create_message(self, stage="claude", timeout=None, **kwargs):
+        """
+        Call the Messages API with retries
+
+        Args:
+            stage: Stage name used for latency stats (e.g. "triage")
+            timeout: Per-call timeout in seconds (default from config)
+            **kwargs: Arguments for messages.create (model, messages, ...)
+
+        Returns:
+            anthropic Message object
+
+        Raises:
+            LLMError: on a non-retryable error or when retries are exhausted
+        """
+        request_timeout = self._default_timeout() if timeout is None else timeout
+        start = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                message = self.client.messages.create(timeout=request_timeout, **kwargs)
+            except anthropic.APIError as e:
+                if attempt < self.max_retries and self._is_retryable(e):
+                    self._increment("retries")
+                    time.sleep(self._backoff_delay(attempt, e))
+                    continue
+
+                self._increment("errors")
+                self.tracker.record(f"{stage}_failed", time.perf_counter() - start)
+                raise LLMError(str(e)) from e
+
+            self._increment("calls")
+            self._record_usage(stage, message.usage)
+            self.tracker.record(stage, time.perf_counter() - start)
+            return message
+
+    async def acreate_message(self, stage="claude", timeout=None, **kwargs):
+        """
+        Async variant of create_message using the pooled async client
+
+        Args:
+            stage: Stage name used for latency stats (e.g. "triage")
+            timeout: Per-call timeout in seconds (default from config)
+            **kwargs: Arguments for messages.create (model, messages, ...)
+
+        Returns:
+            anthropic Message object
+
+        Raises:
+            LLMError: on a non-retryable error or when retries are exhausted
+        """
+        client = self._async_clients.get()
+        request_timeout = self._default_timeout() if timeout is None else timeout
+        start = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                message = await client.messages.create(timeout=request_timeout, **kwargs)
+            except anthropic.APIError as e:
+                if attempt < self.max_retries and self._is_retryable(e):
+                    self._increment("retries")
+                    await asyncio.sleep(self._backoff_delay(attempt, e))
+                    continue
+
+                self._increment("errors")
+                self.tracker.record(f"{stage}_failed", time.perf_counter() - start)
+                raise LLMError(str(e)) from e
+
+            self._increment("calls")
+            self._record_usage(stage, message.usage)
+            self.tracker.record(stage, time.perf_counter() - start)
+            return message
+
+    def stream_text(self, stage="claude", timeout=None, **kwargs):
+        """
+        Stream text deltas from the Messages API
+
+        Retries only happen before the first token; a failure after text
+        has been yielded is raised instead of silently restarting the reply.
+
+        Args:
+            stage: Stage name used for latency stats (e.g. "response")
+            timeout: Per-call timeout in seconds (default from config)
+            **kwargs: Arguments for messages.stream (model, messages, ...)
+
+        Yields:
+            Text deltas as they arrive
+
+        Raises:
+            LLMError: on a non-retryable error or when retries are exhausted
+        """
+        request_timeout = self._default_timeout() if timeout is None else timeout
+        start = time.perf_counter()
+
+        for attempt in range(self.max_retries + 1):
+            received = False
+            try:
+                with self.client.messages.stream(timeout=request_timeout, **kwargs) as stream:
+                    for text in stream.text_stream:
+                        if not received:
+                            received = True
+                            self.tracker.record(f"{stage}_first_token", time.perf_counter() - start)
+                        yield text
+                    final_message = stream.get_final_message()
+            except anthropic.APIError as e:
+                if not received and attempt < self.max_retries and self._is_retryable(e):
+                    self._increment("retries")
+                    time.sleep(self._backoff_delay(attempt, e))
+                    continue
+
+                self._increment("errors")
+                self.tracker.record(f"{stage}_failed", time.perf_counter() - start)
+                raise LLMError(str(e)) from e
+
+            self._increment("calls")
+            self._record_usage(stage, final_message.usage)
+            self.tracker.record(stage, time.perf_counter() - start)
+            return
+
+    def get_stats(self):
+        """
+        Get client counters and per-stage latency statistics
+
+        Returns:
+            Dict with call/retry/error counts, per-stage token usage
+            (including prompt cache reads/writes) and latency summary
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            counters["usage"] = {stage: dict(usage) for stage, usage in self._usage.items()}
+        counters["latency"] = self.tracker.summary()
+        return counters
+
+    def close(self):
+        """Close pooled connections"""
+        self.http_client.close()
+
+    def _create_async_client(self):
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=Config.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Config.LLM_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            timeout=self._default_timeout()
+        )
+        return anthropic.AsyncAnthropic(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            http_client=http_client,
+            max_retries=0
+        )
+
+    def _record_usage(self, stage, usage):
+        """Accumulate token usage, including prompt cache reads and writes"""
+        if usage is None:
+            return
+        with self._lock:
+            totals = self._usage.setdefault(stage, {
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 0
+            })
+            for field in totals:
+                totals[field] += getattr(usage, field, None) or 0
+
+    def _increment(self, counter, amount=1):
+        with self._lock:
+            self._counters[counter] += amount
+
+    @staticmethod
+    def _default_timeout():
+        return httpx.Timeout(
+            Config.LLM_TIMEOUT_SECONDS,
+            connect=Config.LLM_CONNECT_TIMEOUT_SECONDS
+        )
+
+    @staticmethod
+    def _is_retryable(error):
+        """Connection errors, timeouts, rate limits and server errors are transient"""
+        if isinstance(error, anthropic.APIConnectionError):
+            return True
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return False
+
+    @staticmethod
+    def _backoff_delay(attempt, error=None):
+        """
+        Full-jitter exponential backoff, honouring a Retry-After header if present
+
+        Args:
+            attempt: Zero-based retry attempt
+            error: Exception that triggered the retry
+
+        Returns:
+            Seconds to sleep
+        """
+        ceiling = min(
+            Config.LLM_BACKOFF_MAX_SECONDS,
+            Config.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt)
+        )
+        delay = random.uniform(0, ceiling)
+
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), Config.LLM_BACKOFF_MAX_SECONDS))
+            except ValueError:
+                pass
+
+        return delay
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client():
+    """
+    Get the process-wide LLM client, creating it on first use
+
+    Returns:
+        Shared LLMClient instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient()
+    return _client
+
+
+def reset_llm_client():
+    """Close and drop the shared client (e.g. after changing Config in tests)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
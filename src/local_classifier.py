@@ -0,0 +1,200 @@
+import math
+import re
+from collections import Counter
+
+import pandas as pd
+
+from config.config import Config
+from src.text_utils import normalize_message
+
+
+# Function words ignored when measuring how much of a query the
+# training vocabulary covers
+STOPWORDS = frozenset("""
+a about after again also am an and any are as at be been before being but by can could d did do does
+for from had has have here how i if in into is it its just ll m may me might more most much must my
+no not of on or our out over please re s should so some than that the then there these this those to
+too up us ve very was we were what when where which who whom why will with would you your
+""".split())
+
+
+class LocalTriageClassifier:
+    """
+    Local fast-path triage: TF-IDF word n-grams with nearest-centroid scoring
+
+    One centroid per category and per urgency level is built from the
+    historical cases. Cosine scores are turned into probabilities with a
+    temperature-scaled softmax; the lower of the category and urgency
+    probabilities is the confidence used to decide whether Claude can be
+    skipped.
+
+    The softmax only compares categories, so an off-topic message can still
+    favour one of them strongly. Messages too far from every category
+    centroid, or made mostly of content words never seen in training
+    ("help me with my taxes"), get confidence 0 and go to Claude.
+    """
+
+    def __init__(self, temperature=None, min_similarity=None, min_coverage=None):
+        """
+        Args:
+            temperature: Softmax temperature for confidence (default from config)
+            min_similarity: Minimum cosine to the best category centroid
+                            (default from config)
+            min_coverage: Minimum share of the query's content words seen
+                          in training (default from config)
+        """
+        self.temperature = temperature or Config.LOCAL_TRIAGE_TEMPERATURE
+        self.min_similarity = Config.LOCAL_TRIAGE_MIN_SIMILARITY if min_similarity is None else min_similarity
+        self.min_coverage = Config.LOCAL_TRIAGE_MIN_COVERAGE if min_coverage is None else min_coverage
+        self.idf = {}
+        self.category_centroids = {}
+        self.urgency_centroids = {}
+
+    @classmethod
+    def from_csv(cls, data_path=None, temperature=None):
+        """
+        Train on the knowledge base CSV
+
+        Args:
+            data_path: CSV with query, category and urgency columns
+            temperature: Softmax temperature (default from config)
+
+        Returns:
+            Fitted LocalTriageClassifier
+        """
+        data = pd.read_csv(data_path or Config.SYNTHETIC_DATA_PATH)
+        classifier = cls(temperature)
+        classifier.fit(
+            data['query'].tolist(),
+            data['category'].tolist(),
+            data['urgency'].tolist()
+        )
+        return classifier
+
+    def fit(self, queries, categories, urgencies):
+        """
+        Fit IDF weights and label centroids
+
+        Args:
+            queries: List of customer messages
+            categories: Category label per message
+            urgencies: Urgency label per message
+
+        Returns:
+            self
+        """
+        documents = [self._ngrams(query) for query in queries]
+
+        document_frequency = Counter()
+        for terms in documents:
+            document_frequency.update(set(terms))
+
+        n_documents = len(documents)
+        self.idf = {
+            term: math.log((1 + n_documents) / (1 + df)) + 1
+            for term, df in document_frequency.items()
+        }
+
+        vectors = [self._vectorize_terms(terms) for terms in documents]
+        self.category_centroids = self._centroids(vectors, categories)
+        self.urgency_centroids = self._centroids(vectors, urgencies)
+
+        return self
+
+    def predict(self, query):
+        """
+        Classify a message locally
+
+        Args:
+            query: Customer message
+
+        Returns:
+            Dict with category, urgency, manuscript_id, issue_summary,
+            confidence and source ("local"); confidence is 0 for messages
+            outside the training domain
+        """
+        terms = self._ngrams(query)
+        vector = self._vectorize_terms(terms)
+
+        category, category_probability = self._best(vector, self.category_centroids)
+        urgency, urgency_probability = self._best(vector, self.urgency_centroids)
+
+        confidence = min(category_probability, urgency_probability)
+        if not self._in_domain(terms, vector):
+            confidence = 0.0
+
+        manuscript_id = re.search(r'MS-\d{4}-\d{4}', query, re.IGNORECASE)
+
+        return {
+            "category": category,
+            "urgency": urgency,
+            "manuscript_id": manuscript_id.group(0).upper() if manuscript_id else None,
+            "issue_summary": f"{category.replace('_', ' ').capitalize()} (classified locally)",
+            "confidence": round(confidence, 4),
+            "source": "local"
+        }
+
+    def _in_domain(self, terms, vector):
+        """Whether the message is close enough to the training data to trust the softmax"""
+        similarity = max((self._dot(vector, centroid) for centroid in self.category_centroids.values()), default=0.0)
+        if similarity < self.min_similarity:
+            return False
+
+        content_words = [term for term in terms if " " not in term and term not in STOPWORDS]
+        if not content_words:
+            return False
+        coverage = sum(term in self.idf for term in content_words) / len(content_words)
+        return coverage >= self.min_coverage
+
+    def _best(self, vector, centroids):
+        """Highest-scoring label and its softmax probability"""
+        if not vector or not centroids:
+            return next(iter(centroids), None), 0.0
+
+        scores = {label: self._dot(vector, centroid) for label, centroid in centroids.items()}
+        top = max(scores.values())
+        weights = {
+            label: math.exp((score - top) / self.temperature)
+            for label, score in scores.items()
+        }
+        label = max(weights, key=weights.get)
+
+        return label, weights[label] / sum(weights.values())
+
+    @staticmethod
+    def _ngrams(text):
+        """Word unigrams and bigrams of the normalized, ID-masked text"""
+        normalized, _ = normalize_message(text)
+        tokens = normalized.split()
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def _vectorize_terms(self, terms):
+        """Sublinear TF-IDF vector (L2-normalized sparse dict); unseen terms are ignored"""
+        counts = Counter(term for term in terms if term in self.idf)
+        vector = {
+            term: (1 + math.log(count)) * self.idf[term]
+            for term, count in counts.items()
+        }
+        return self._normalize(vector)
+
+    def _centroids(self, vectors, labels):
+        """L2-normalized mean vector per label"""
+        sums = {}
+        for vector, label in zip(vectors, labels):
+            total = sums.setdefault(label, {})
+            for term, weight in vector.items():
+                total[term] = total.get(term, 0.0) + weight
+        return {label: self._normalize(total) for label, total in sums.items()}
+
+    @staticmethod
+    def _normalize(vector):
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm == 0:
+            return {}
+        return {term: weight / norm for term, weight in vector.items()}
+
+    @staticmethod
+    def _dot(a, b):
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(weight * b.get(term, 0.0) for term, weight in a.items())
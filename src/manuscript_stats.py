@@ -0,0 +1,128 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+def review_days(submission_dates, decision_dates):
+    """
+    Whole days from submission to decision, vectorized
+
+    Args:
+        submission_dates: Sequence of dates (ISO strings or datetimes)
+        decision_dates: Sequence of dates (missing = no decision yet)
+
+    Returns:
+        float array of days; NaN where a date is missing or invalid, or the
+        decision precedes the submission
+    """
+    submitted = pd.to_datetime(pd.Series(submission_dates, dtype=object), errors='coerce')
+    decided = pd.to_datetime(pd.Series(decision_dates, dtype=object), errors='coerce')
+    days = (decided - submitted).dt.days.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(days >= 0, days, np.nan)
+
+
+class ReviewTimeStats:
+    """
+    Review-time statistics per status, maintained incrementally
+
+    Review times are whole days, so each status keeps a histogram (count of
+    manuscripts per number of days). Adding or removing records updates the
+    histograms with one bincount; mean and percentiles are exact and come
+    from the histograms without touching the records. The summary is cached
+    until the next change.
+    """
+
+    PERCENTILES = (50, 90)
+
+    def __init__(self):
+        self.histograms = {}
+        self._summary = None
+        self._lock = threading.Lock()
+
+    def copy(self):
+        """Independent copy (histogram arrays are replaced, never modified, so they are shared)"""
+        with self._lock:
+            duplicate = ReviewTimeStats()
+            duplicate.histograms = dict(self.histograms)
+            duplicate._summary = self._summary
+            return duplicate
+
+    def add(self, statuses, days, counts=None):
+        """
+        Count records (or remove them with negative counts)
+
+        Args:
+            statuses: Status per record
+            days: Review days per record (NaN = no review time, ignored)
+            counts: Optional count per record (default 1; -1 removes)
+        """
+        statuses = np.asarray(statuses, dtype=object)
+        days = np.asarray(days, dtype=np.float64)
+        counts = np.ones(len(days), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+
+        valid = ~np.isnan(days) & pd.notna(statuses)
+        if not valid.any():
+            return
+
+        codes, uniques = pd.factorize(statuses[valid])
+        days = days[valid].astype(np.int64)
+        width = int(days.max()) + 1
+        totals = np.bincount(codes * width + days, weights=counts[valid], minlength=len(uniques) * width)
+        totals = np.rint(totals).astype(np.int64).reshape(len(uniques), width)
+
+        with self._lock:
+            for status, histogram in zip(uniques, totals):
+                current = self.histograms.get(status, np.zeros(0, dtype=np.int64))
+                size = max(len(current), width)
+                updated = np.zeros(size, dtype=np.int64)
+                updated[:len(current)] += current
+                updated[:width] += histogram
+                if updated.any():
+                    self.histograms[status] = updated
+                else:
+                    self.histograms.pop(status, None)
+            self._summary = None
+
+    def remove(self, statuses, days):
+        """Uncount records (same arguments as add)"""
+        self.add(statuses, days, counts=-np.ones(len(days), dtype=np.int64))
+
+    def summary(self):
+        """
+        Review-time statistics
+
+        Returns:
+            Dict with "overall" and "by_status" (status -> stats), each
+            stats dict holding count, mean_days, p50_days and p90_days
+            (overall is None when no manuscript has a decision date)
+        """
+        with self._lock:
+            if self._summary is None:
+                by_status = {
+                    status: self._describe(histogram)
+                    for status, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].sum())
+                }
+                width = max((len(histogram) for histogram in self.histograms.values()), default=0)
+                overall = np.zeros(width, dtype=np.int64)
+                for histogram in self.histograms.values():
+                    overall[:len(histogram)] += histogram
+                self._summary = {
+                    "overall": self._describe(overall) if overall.any() else None,
+                    "by_status": by_status
+                }
+            return self._summary
+
+    @classmethod
+    def _describe(cls, histogram):
+        """Count, mean and nearest-rank percentiles of a day histogram"""
+        count = int(histogram.sum())
+        cumulative = np.cumsum(histogram)
+        stats = {
+            "count": count,
+            "mean_days": round(float(np.dot(np.arange(len(histogram)), histogram) / count), 1)
+        }
+        for percentile in cls.PERCENTILES:
+            rank = max(1, int(np.ceil(percentile / 100 * count)))
+            stats[f"p{percentile}_days"] = int(np.searchsorted(cumulative, rank))
+        return stats
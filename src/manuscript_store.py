@@ -0,0 +1,925 @@
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import quote
+
+import httpx
+import numpy as np
+
+from config.config import Config
+from src.async_runtime import LoopLocal, run_sync
+from src.cache import LRUCache
+from src.manuscript_stats import ReviewTimeStats
+from src.manuscript_table import MANUSCRIPT_COLUMNS, MISSING, ManuscriptFile, ManuscriptTable, normalize_id
+from src.metrics import latency_tracker
+
+
+class ManuscriptStore:
+    """
+    Storage backend of the manuscript status database
+
+    Records are dicts keyed by MANUSCRIPT_COLUMNS. ID lookups are
+    case-insensitive; author and status searches match substrings.
+    """
+
+    name = None
+
+    def lookup(self, manuscript_id):
+        """
+        Look up a manuscript by ID
+
+        Args:
+            manuscript_id: Manuscript identifier (e.g., MS-2024-1234)
+
+        Returns:
+            Record dict or None if not found
+        """
+        raise NotImplementedError
+
+    async def alookup(self, manuscript_id):
+        """
+        Async variant of lookup (same arguments and return value)
+
+        Runs lookup in a worker thread: it may read the disk (SQLite, lazy
+        CSV columns, reloads), which must not hold up the event loop that
+        serves every other conversation.
+        """
+        return await asyncio.to_thread(self.lookup, manuscript_id)
+
+    def lookup_many(self, manuscript_ids):
+        """
+        Look up several manuscripts by ID
+
+        Args:
+            manuscript_ids: List of manuscript identifiers
+
+        Returns:
+            List with a record dict or None per ID (same order)
+        """
+        return [self.lookup(manuscript_id) for manuscript_id in manuscript_ids]
+
+    def exists(self, manuscript_id):
+        """Whether a manuscript with this ID exists"""
+        return self.lookup(manuscript_id) is not None
+
+    def get_by_author(self, author_name, limit=None):
+        """
+        Manuscripts whose author name contains a string (case-insensitive)
+
+        Args:
+            author_name: Full or partial author name
+            limit: Maximum number of records (None = all)
+
+        Returns:
+            List of record dicts, best match first
+        """
+        raise NotImplementedError
+
+    def get_by_status(self, status):
+        """
+        Manuscripts whose status contains a string (case-insensitive)
+
+        Returns:
+            List of record dicts
+        """
+        raise NotImplementedError
+
+    async def aget_by_author(self, author_name, limit=None):
+        """Async variant of get_by_author (runs it in a worker thread)"""
+        return await asyncio.to_thread(self.get_by_author, author_name, limit)
+
+    async def aget_by_status(self, status):
+        """Async variant of get_by_status (runs it in a worker thread)"""
+        return await asyncio.to_thread(self.get_by_status, status)
+
+    def count(self):
+        """Number of manuscripts"""
+        raise NotImplementedError
+
+    def status_counts(self):
+        """
+        Number of manuscripts per status
+
+        Returns:
+            Dict of status -> count, most frequent first
+        """
+        raise NotImplementedError
+
+    def review_time_stats(self):
+        """
+        Days from submission to decision, overall and per status
+
+        Served from aggregates kept up to date as records change, so
+        calling this does not scan the manuscripts.
+
+        Returns:
+            ReviewTimeStats.summary() dict
+        """
+        raise NotImplementedError
+
+    def refresh(self):
+        """
+        Pick up changes made to the underlying data since it was loaded
+
+        Returns:
+            Dict describing the applied change (kind, added, updated,
+            seconds), or None if nothing changed or the backend always
+            reads live data
+        """
+        return None
+
+    def get_refresh_stats(self):
+        """
+        Reload counters (checks, reloads, rows added/updated, last latency)
+
+        Returns:
+            Dict, or None if the backend does not reload
+        """
+        return None
+
+    def get_service_stats(self):
+        """
+        Request counters of a remote backend (requests, retries, errors,
+        coalesced lookups, cache hit rate)
+
+        Returns:
+            Dict, or None for local backends
+        """
+        return None
+
+    def close(self):
+        """Release resources (connections, files, background threads)"""
+
+
+class CSVManuscriptStore(ManuscriptStore):
+    """
+    Whole CSV (or Parquet) file loaded into memory as a ManuscriptTable
+
+    Author search is substring and typo tolerant: substring matches come
+    first, then names within Config.AUTHOR_SEARCH_MIN_SIMILARITY trigram
+    similarity (e.g. "Jonson" finds "Johnson").
+
+    Live updates: refresh() checks the file's modification time and size
+    and, if it changed, re-reads it and diffs it against the loaded table
+    by row content hash. Only new and changed rows are applied (see
+    ManuscriptTable.updated); removed rows, or IDs that are duplicated or
+    missing, fall back to a full rebuild. Either way the new table is
+    built aside and swapped in with one assignment, so lookups in flight
+    keep using the previous version. Write the CSV atomically (write a
+    temporary file, then rename) so a refresh never parses a partial file.
+
+    With refresh_seconds set, reads check the file signature at most that
+    often and, if it changed, reload it on a short-lived background thread
+    (reads never wait for it). An idle store runs no thread, so it is freed
+    like any other object. Use shared() to have every caller in the process
+    use one table per file.
+    """
+
+    name = "csv"
+
+    # Stores handed out by shared(), kept while someone uses them
+    _shared = weakref.WeakValueDictionary()
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, refresh_seconds=0):
+        """
+        Args:
+            path: Path to the manuscript status CSV file (or a .parquet copy)
+            refresh_seconds: Check the file for changes this often, on
+                             access (0 = only on refresh())
+        """
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._reloading = threading.Lock()
+        self._next_check = time.monotonic() + refresh_seconds
+        self._signature = self._file_signature()
+        self.refresh_stats = {
+            "checks": 0,
+            "delta_reloads": 0,
+            "full_reloads": 0,
+            "rows_added": 0,
+            "rows_updated": 0,
+            "last_refresh_ms": None,
+            "last_refresh_at": None
+        }
+
+        try:
+            file = ManuscriptFile(path)
+            print(f"✓ Loaded manuscript database: {len(file.frame)} manuscripts")
+        except FileNotFoundError:
+            print(f"⚠ Warning: Manuscript database not found at {path}")
+            file = ManuscriptFile.empty()
+
+        self.table = ManuscriptTable(file)
+
+    @classmethod
+    def shared(cls, path, refresh_seconds=0):
+        """
+        The store of a file shared by every caller in the process
+
+        Loads the file on first use; later calls with the same path and
+        refresh interval get the same store (and its upserts) while any
+        caller still holds it.
+
+        Args:
+            path: Path to the manuscript status CSV file (or a .parquet copy)
+            refresh_seconds: See __init__
+
+        Returns:
+            CSVManuscriptStore
+        """
+        key = (os.path.abspath(path), refresh_seconds)
+        with cls._shared_lock:
+            store = cls._shared.get(key)
+            if store is None:
+                store = cls(path, refresh_seconds)
+                cls._shared[key] = store
+        return store
+
+    def lookup(self, manuscript_id):
+        table = self._current()
+        row = table.find(manuscript_id)
+        return None if row is None else table.record(row)
+
+    def exists(self, manuscript_id):
+        return self._current().find(manuscript_id) is not None
+
+    def get_by_author(self, author_name, limit=None):
+        table = self._current()
+        rows = table.author_rows(author_name, limit=limit, min_similarity=Config.AUTHOR_SEARCH_MIN_SIMILARITY)
+        return [table.record(row) for row in rows]
+
+    def get_by_status(self, status):
+        table = self._current()
+        needle = str(status).lower()
+        matched = [rows for name, rows in table.status_rows.items() if needle in str(name).lower()]
+        if not matched:
+            return []
+
+        rows = np.sort(np.concatenate(matched)) if len(matched) > 1 else matched[0]
+        return [table.record(row) for row in rows]
+
+    def count(self):
+        return self._current().n_rows
+
+    def status_counts(self):
+        counts = {status: len(rows) for status, rows in self._current().status_rows.items()}
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def review_time_stats(self):
+        return self._current().review_stats.summary()
+
+    def upsert(self, records):
+        """
+        Insert or update manuscripts in memory (the CSV file is not rewritten)
+
+        Args:
+            records: Iterable of record dicts (missing fields are stored as NaN)
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            self.table, added, updated = self.table.updated(records)
+        return added + updated
+
+    def refresh(self):
+        with self._lock:
+            self.refresh_stats["checks"] += 1
+            signature = self._file_signature()
+            if signature is None or signature == self._signature:
+                return None
+
+            start = time.perf_counter()
+            file = ManuscriptFile(self.path)
+            if self._file_signature() != signature:
+                # Still being written: try again on the next check
+                return None
+
+            table = self.table
+            delta = self._delta(table, file)
+            if delta is None:
+                self.table = ManuscriptTable(file)
+                added, updated, kind = len(file.frame), 0, "full"
+            else:
+                positions, file_positions = delta
+                records = file.frame.iloc[positions].to_dict('records')
+                table, added, updated = table.updated(records, file.hashes[positions])
+                # Lazy columns (notes) now read from the new file
+                self.table = table.relinked(file.reader, file_positions)
+                kind = "delta"
+            self._signature = signature
+
+            elapsed = time.perf_counter() - start
+            latency_tracker.record("manuscript_refresh", elapsed)
+            self.refresh_stats[f"{kind}_reloads"] += 1
+            self.refresh_stats["rows_added"] += added
+            self.refresh_stats["rows_updated"] += updated
+            self.refresh_stats["last_refresh_ms"] = round(elapsed * 1000, 1)
+            self.refresh_stats["last_refresh_at"] = datetime.now().isoformat(timespec='seconds')
+
+        print(f"✓ Reloaded manuscript database ({kind}): {added} added, {updated} updated "
+              f"in {elapsed * 1000:.0f}ms")
+        return {"kind": kind, "added": added, "updated": updated, "seconds": elapsed}
+
+    def get_refresh_stats(self):
+        return dict(self.refresh_stats)
+
+    @staticmethod
+    def _delta(table, file):
+        """
+        Rows of a re-read file that are new or changed
+
+        Lazy columns are not compared (they are read from the new file
+        once the table is relinked to it).
+
+        Returns:
+            Tuple of (positions in the file of new or changed rows, file
+            position of every row of the updated table), or None if a full
+            rebuild is needed (columns changed, rows removed, duplicate or
+            missing IDs in either version) or cheaper (most rows changed)
+        """
+        if file.columns != table.names or table.n_keys != table.n_rows:
+            return None
+
+        ids = file.frame['manuscript_id']
+        keys = ids.astype('string').str.strip().str.upper()
+        if ids.isna().any() or keys.duplicated().any():
+            return None
+
+        old_rows = table.find_rows(keys.tolist())
+        found = old_rows >= 0
+        if found.sum() != table.n_rows:
+            return None
+
+        changed = ~found
+        changed[found] = table.row_hashes[old_rows[found]] != file.hashes[found]
+        positions = np.flatnonzero(changed)
+        if len(positions) > len(keys) // 2:
+            # Rebuilding is cheaper than applying most rows one by one
+            return None
+
+        # Existing rows keep their row number; new rows are appended in file order
+        file_positions = np.empty(len(keys), dtype=np.int64)
+        file_positions[old_rows[found]] = np.flatnonzero(found)
+        file_positions[table.n_rows:] = np.flatnonzero(~found)
+        return positions, file_positions
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _current(self):
+        """The loaded table, after starting a reload if a due check finds the file changed"""
+        if self.refresh_seconds > 0 and time.monotonic() >= self._next_check:
+            self._next_check = time.monotonic() + self.refresh_seconds
+            if self._file_signature() != self._signature and self._reloading.acquire(blocking=False):
+                threading.Thread(target=self._reload, name="manuscript-refresh", daemon=True).start()
+        return self.table
+
+    def _reload(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"⚠ Manuscript database refresh failed: {e}")
+        finally:
+            self._reloading.release()
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections shared between threads
+
+    At most `size` connections exist; a thread waits for a free one. The
+    sqlite3 module keeps a per-connection cache of compiled statements, so
+    reusing connections with constant SQL text reuses prepared statements.
+    """
+
+    def __init__(self, db_path, size=8):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            size: Maximum number of open connections
+        """
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection (use as ``with pool.connection() as conn:``)"""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    @property
+    def opened(self):
+        """Number of connections opened so far"""
+        return self._opened
+
+    def _connect(self):
+        # WAL lets readers in other processes continue while one writes
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._opened += 1
+        return conn
+
+
+class SQLiteManuscriptStore(ManuscriptStore):
+    """
+    Manuscripts in a SQLite file, queried on demand
+
+    Nothing is loaded at startup, so memory does not grow with the
+    database, all workers share one file, and updates (upsert, or
+    scripts/import_manuscripts.py) are visible to the next query without a
+    restart. manuscript_id is the case-insensitive primary key; author_name
+    and current_status are indexed (prefix searches and per-status counts).
+
+    Triggers keep a small aggregate table, manuscripts per (status, review
+    days), in step with every insert, update and delete, so status counts
+    and review-time statistics are read without scanning manuscripts.
+    """
+
+    name = "sqlite"
+
+    # Placeholders per lookup_many query (constant SQL text keeps it prepared)
+    LOOKUP_BATCH = 64
+
+    _COLUMNS_SQL = ", ".join(MANUSCRIPT_COLUMNS)
+    _LOOKUP_SQL = f"SELECT {_COLUMNS_SQL} FROM manuscripts WHERE manuscript_id = ?"
+    _LOOKUP_MANY_SQL = (
+        f"SELECT {_COLUMNS_SQL} FROM manuscripts WHERE manuscript_id IN ({', '.join('?' * LOOKUP_BATCH)})"
+    )
+    _EXISTS_SQL = "SELECT 1 FROM manuscripts WHERE manuscript_id = ?"
+    _AUTHOR_SQL = f"SELECT {_COLUMNS_SQL} FROM manuscripts WHERE author_name LIKE ? ESCAPE '\\' LIMIT ?"
+    _STATUS_SQL = f"SELECT {_COLUMNS_SQL} FROM manuscripts WHERE current_status LIKE ? ESCAPE '\\'"
+    _UPSERT_SQL = (
+        f"INSERT INTO manuscripts ({_COLUMNS_SQL}) VALUES ({', '.join('?' * len(MANUSCRIPT_COLUMNS))}) "
+        "ON CONFLICT(manuscript_id) DO UPDATE SET " +
+        ", ".join(f"{column} = excluded.{column}" for column in MANUSCRIPT_COLUMNS[1:])
+    )
+
+    # Whole days from submission to decision of a row (-1 = none yet or invalid)
+    _REVIEW_DAYS_SQL = (
+        "COALESCE(CASE WHEN julianday({row}.decision_date) >= julianday({row}.submission_date) "
+        "THEN CAST(julianday({row}.decision_date) - julianday({row}.submission_date) AS INTEGER) END, -1)"
+    )
+
+    def __init__(self, path, pool_size=8):
+        """
+        Args:
+            path: Path to the SQLite database file (created if missing)
+            pool_size: Maximum number of open connections
+        """
+        self.path = path
+        existed = os.path.exists(path)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.pool = ConnectionPool(path, pool_size)
+        self._create_schema()
+
+        if existed:
+            print(f"✓ Opened manuscript database: {self.count()} manuscripts (SQLite)")
+        else:
+            print(f"⚠ Warning: Manuscript database not found at {path} - created an empty one "
+                  f"(import with scripts/import_manuscripts.py)")
+
+    def _create_schema(self):
+        with self.pool.connection() as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS manuscripts ("
+                "manuscript_id TEXT PRIMARY KEY COLLATE NOCASE, "
+                "author_name TEXT COLLATE NOCASE, "
+                "submission_date TEXT, "
+                "current_status TEXT COLLATE NOCASE, "
+                "reviewer_count INTEGER, "
+                "decision_date TEXT, "
+                "notes TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_manuscripts_author ON manuscripts(author_name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_manuscripts_status ON manuscripts(current_status)")
+
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'manuscript_status_stats'"
+            ).fetchone() is None:
+                self._create_stats_table(conn)
+
+    def _create_stats_table(self, conn):
+        """Aggregate table, its triggers, and a one-off backfill from existing rows"""
+        conn.execute(
+            "CREATE TABLE manuscript_status_stats ("
+            "current_status TEXT NOT NULL COLLATE NOCASE, "
+            "review_days INTEGER NOT NULL, "
+            "n INTEGER NOT NULL, "
+            "PRIMARY KEY (current_status, review_days))"
+        )
+
+        count_new = (
+            "INSERT INTO manuscript_status_stats VALUES "
+            f"(NEW.current_status, {self._REVIEW_DAYS_SQL.format(row='NEW')}, 1) "
+            "ON CONFLICT(current_status, review_days) DO UPDATE SET n = n + 1;"
+        )
+        uncount_old = (
+            "UPDATE manuscript_status_stats SET n = n - 1 "
+            f"WHERE current_status = OLD.current_status AND review_days = {self._REVIEW_DAYS_SQL.format(row='OLD')}; "
+            "DELETE FROM manuscript_status_stats WHERE n <= 0;"
+        )
+        conn.execute(
+            "CREATE TRIGGER manuscripts_stats_insert AFTER INSERT ON manuscripts "
+            f"WHEN NEW.current_status IS NOT NULL BEGIN {count_new} END"
+        )
+        conn.execute(
+            "CREATE TRIGGER manuscripts_stats_delete AFTER DELETE ON manuscripts "
+            f"WHEN OLD.current_status IS NOT NULL BEGIN {uncount_old} END"
+        )
+        conn.execute(
+            "CREATE TRIGGER manuscripts_stats_uncount AFTER UPDATE OF current_status, submission_date, "
+            f"decision_date ON manuscripts WHEN OLD.current_status IS NOT NULL BEGIN {uncount_old} END"
+        )
+        conn.execute(
+            "CREATE TRIGGER manuscripts_stats_count AFTER UPDATE OF current_status, submission_date, "
+            f"decision_date ON manuscripts WHEN NEW.current_status IS NOT NULL BEGIN {count_new} END"
+        )
+
+        conn.execute(
+            "INSERT INTO manuscript_status_stats "
+            f"SELECT current_status, {self._REVIEW_DAYS_SQL.format(row='manuscripts')} AS review_days, COUNT(*) "
+            "FROM manuscripts WHERE current_status IS NOT NULL GROUP BY current_status, review_days"
+        )
+
+    def lookup(self, manuscript_id):
+        if not manuscript_id:
+            return None
+
+        with self.pool.connection() as conn:
+            row = conn.execute(self._LOOKUP_SQL, (str(manuscript_id).strip(),)).fetchone()
+        return self._record(row) if row is not None else None
+
+    def lookup_many(self, manuscript_ids):
+        keys = [normalize_id(manuscript_id) if manuscript_id else None for manuscript_id in manuscript_ids]
+        wanted = sorted({key for key in keys if key})
+        found = {}
+
+        with self.pool.connection() as conn:
+            for start in range(0, len(wanted), self.LOOKUP_BATCH):
+                batch = wanted[start:start + self.LOOKUP_BATCH]
+                batch += [None] * (self.LOOKUP_BATCH - len(batch))
+                for row in conn.execute(self._LOOKUP_MANY_SQL, batch):
+                    found[normalize_id(row['manuscript_id'])] = self._record(row)
+
+        return [found.get(key) if key else None for key in keys]
+
+    def exists(self, manuscript_id):
+        if not manuscript_id:
+            return False
+        with self.pool.connection() as conn:
+            return conn.execute(self._EXISTS_SQL, (str(manuscript_id).strip(),)).fetchone() is not None
+
+    def get_by_author(self, author_name, limit=None):
+        # Substring match only (LIKE scan); typo-tolerant search is CSV-backend only
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                self._AUTHOR_SQL, (f"%{self._escape_like(author_name)}%", -1 if limit is None else limit)
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def get_by_status(self, status):
+        with self.pool.connection() as conn:
+            rows = conn.execute(self._STATUS_SQL, (f"%{self._escape_like(status)}%",)).fetchall()
+        return [self._record(row) for row in rows]
+
+    def count(self):
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM manuscripts").fetchone()[0]
+
+    def status_counts(self):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT current_status, SUM(n) AS total FROM manuscript_status_stats "
+                "GROUP BY current_status ORDER BY total DESC"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def review_time_stats(self):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT current_status, review_days, n FROM manuscript_status_stats WHERE review_days >= 0"
+            ).fetchall()
+
+        stats = ReviewTimeStats()
+        if rows:
+            statuses, days, counts = zip(*rows)
+            stats.add(statuses, days, counts)
+        return stats.summary()
+
+    def upsert(self, records):
+        """
+        Insert or update manuscripts (one transaction)
+
+        Args:
+            records: Iterable of record dicts (missing fields are stored as NULL)
+
+        Returns:
+            Number of records written
+        """
+        rows = [
+            tuple(self._sql_value(record.get(column)) for column in MANUSCRIPT_COLUMNS)
+            for record in records
+        ]
+        with self.pool.connection() as conn, conn:
+            conn.executemany(self._UPSERT_SQL, rows)
+        return len(rows)
+
+    def close(self):
+        self.pool.close()
+
+    @staticmethod
+    def _record(row):
+        """Row -> manuscript dict, NULL -> NaN (missing values as the CSV backend returns them)"""
+        return {column: MISSING if value is None else value for column, value in zip(row.keys(), row)}
+
+    @staticmethod
+    def _escape_like(text):
+        return str(text).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    @staticmethod
+    def _sql_value(value):
+        """NaN (pandas missing values) -> NULL, NumPy scalars -> Python values"""
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+        return value.item() if hasattr(value, 'item') else value
+
+
+class ManuscriptServiceError(Exception):
+    """The editorial system could not be reached or answered with an error"""
+
+
+class HTTPManuscriptStore(ManuscriptStore):
+    """
+    Manuscripts served by the editorial-management system's HTTP API
+
+    Endpoints (scripts/stub_editorial_server.py implements them locally):
+        GET /v1/manuscripts/{id}                      -> record (404 = not found)
+        GET /v1/manuscripts?author=...&limit=...      -> {"manuscripts": [...]}
+        GET /v1/manuscripts?status=...                -> {"manuscripts": [...]}
+        GET /v1/stats -> {"count": n, "status_counts": {...}, "review_time": {...}}
+
+    Requests share one pooled keep-alive httpx.AsyncClient per event loop,
+    with a timeout and retries on connection errors and 5xx responses. ID
+    lookups are cached read-through for a short TTL (not-found answers
+    too), and concurrent lookups of the same ID share one request. The
+    synchronous methods run on the background event loop, so they reuse
+    the same connections; code running on that loop must await the async
+    variants (alookup, aget_by_author, aget_by_status, astats) instead,
+    since a synchronous call there raises RuntimeError rather than wait
+    on itself.
+    """
+
+    name = "http"
+
+    def __init__(self, base_url, api_key=None, timeout=None, max_connections=None, max_retries=None,
+                 cache_ttl=None):
+        """
+        Args:
+            base_url: Base URL of the editorial system API
+            api_key: Bearer token (default from config)
+            timeout: Request timeout in seconds (default from config)
+            max_connections: Pooled connections per event loop (default from config)
+            max_retries: Retries on connection errors and 5xx (default from config)
+            cache_ttl: Seconds a lookup result is reused (default from config)
+        """
+        if not base_url:
+            raise ValueError("The http manuscript backend needs a base URL (set MANUSCRIPT_API_URL)")
+
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key or Config.MANUSCRIPT_API_KEY
+        self.timeout = timeout or Config.MANUSCRIPT_API_TIMEOUT_SECONDS
+        self.max_connections = max_connections or Config.MANUSCRIPT_API_MAX_CONNECTIONS
+        self.max_retries = Config.MANUSCRIPT_API_MAX_RETRIES if max_retries is None else max_retries
+        self.cache = LRUCache(
+            Config.MANUSCRIPT_CACHE_SIZE,
+            ttl_seconds=Config.MANUSCRIPT_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl
+        )
+
+        self._clients = LoopLocal(self._create_client)
+        self._in_flight = LoopLocal(dict)
+        self._counters = {"requests": 0, "retries": 0, "errors": 0, "coalesced": 0}
+        self._lock = threading.Lock()
+
+        print(f"✓ Using editorial system API at {self.base_url}")
+
+    def _create_client(self):
+        headers = {"Accept": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=Config.MANUSCRIPT_API_KEEPALIVE_SECONDS
+            )
+        )
+
+    def lookup(self, manuscript_id):
+        return run_sync(self.alookup(manuscript_id))
+
+    async def alookup(self, manuscript_id):
+        if not manuscript_id:
+            return None
+
+        key = normalize_id(manuscript_id)
+        cached = self.cache.get(key)
+        if cached is None:
+            in_flight = self._in_flight.get()
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._fetch(key))
+                in_flight[key] = task
+                task.add_done_callback(lambda _: in_flight.pop(key, None))
+            else:
+                self._increment("coalesced")
+            # A cancelled caller must not cancel the request others wait for
+            cached = await asyncio.shield(task)
+
+        record = cached[0]
+        return None if record is None else dict(record)
+
+    def lookup_many(self, manuscript_ids):
+        return run_sync(self._alookup_many(manuscript_ids))
+
+    def get_by_author(self, author_name, limit=None):
+        return run_sync(self.aget_by_author(author_name, limit))
+
+    async def aget_by_author(self, author_name, limit=None):
+        params = {"author": author_name}
+        if limit is not None:
+            params["limit"] = limit
+        return (await self._request("/v1/manuscripts", params))["manuscripts"]
+
+    def get_by_status(self, status):
+        return run_sync(self.aget_by_status(status))
+
+    async def aget_by_status(self, status):
+        return (await self._request("/v1/manuscripts", {"status": status}))["manuscripts"]
+
+    def count(self):
+        return self._stats()["count"]
+
+    def status_counts(self):
+        return self._stats()["status_counts"]
+
+    def review_time_stats(self):
+        return self._stats()["review_time"]
+
+    def get_service_stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats["cache"] = self.cache.get_stats()
+        return stats
+
+    def close(self):
+        run_sync(self._aclose())
+
+    async def _aclose(self):
+        # The synchronous methods only use the background loop's client
+        await self._clients.get().aclose()
+
+    async def _fetch(self, key):
+        """Fetch one record and cache the answer; returns (record or None,)"""
+        result = (await self._request(f"/v1/manuscripts/{quote(key, safe='')}", allow_missing=True),)
+        self.cache.set(key, result)
+        return result
+
+    async def _alookup_many(self, manuscript_ids):
+        return await asyncio.gather(*(self.alookup(manuscript_id) for manuscript_id in manuscript_ids))
+
+    def _stats(self):
+        stats = self.cache.get(("stats",))
+        if stats is None:
+            stats = run_sync(self.astats())
+        return stats
+
+    async def astats(self):
+        """
+        Aggregates from the editorial system (cached like records)
+
+        Returns:
+            Dict with count, status_counts and review_time
+        """
+        stats = self.cache.get(("stats",))
+        if stats is None:
+            stats = await self._request("/v1/stats")
+            self.cache.set(("stats",), stats)
+        return stats
+
+    async def _request(self, path, params=None, allow_missing=False):
+        """
+        GET a JSON resource with retries
+
+        Args:
+            path: Path below the base URL
+            params: Optional query parameters
+            allow_missing: Return None on 404 instead of failing
+
+        Returns:
+            Decoded JSON body (None if missing and allow_missing)
+
+        Raises:
+            ManuscriptServiceError: Connection failure, timeout or error response
+        """
+        client = self._clients.get()
+        for attempt in range(self.max_retries + 1):
+            self._increment("requests")
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+                if allow_missing and response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                error = e
+                retryable = e.response.status_code >= 500
+            except httpx.TransportError as e:
+                error = e
+                retryable = True
+            except ValueError as e:
+                error = e
+                retryable = False
+            finally:
+                latency_tracker.record("manuscript_api", time.perf_counter() - start)
+
+            if not retryable or attempt == self.max_retries:
+                break
+            self._increment("retries")
+            await asyncio.sleep(0.1 * 2 ** attempt)
+
+        self._increment("errors")
+        raise ManuscriptServiceError(f"GET {path} failed: {error!r}") from error
+
+    def _increment(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+
+BACKENDS = {
+    CSVManuscriptStore.name: CSVManuscriptStore,
+    SQLiteManuscriptStore.name: SQLiteManuscriptStore,
+    HTTPManuscriptStore.name: HTTPManuscriptStore
+}
+
+
+def create_manuscript_store(backend, path, **params):
+    """
+    Open a manuscript store by backend name
+
+    Args:
+        backend: "csv", "sqlite" or "http"
+        path: CSV file, SQLite database path, or editorial system base URL
+        **params: Constructor parameters of the backend
+
+    Returns:
+        ManuscriptStore
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown manuscript backend: {backend} (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[backend](path, **params)
@@ -0,0 +1,722 @@
+import copy
+import csv
+import io
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.manuscript_stats import ReviewTimeStats, review_days
+from src.trigram_index import TrigramIndex
+
+
+# Fields of a manuscript record, in storage order
+MANUSCRIPT_COLUMNS = (
+    'manuscript_id',
+    'author_name',
+    'submission_date',
+    'current_status',
+    'reviewer_count',
+    'decision_date',
+    'notes'
+)
+
+# Few distinct values: stored once, rows hold integer codes
+CATEGORICAL_COLUMNS = ('author_name', 'current_status')
+DATE_COLUMNS = ('submission_date', 'decision_date')
+# Long free text: read from the file only when a record is materialized
+LAZY_COLUMNS = ('notes',)
+
+MISSING = float('nan')
+
+
+def normalize_id(manuscript_id):
+    """Lookup key of a manuscript ID (case- and whitespace-insensitive)"""
+    return str(manuscript_id).strip().upper()
+
+
+class TextColumn:
+    """
+    Strings packed into one UTF-8 buffer with offsets (the Arrow layout):
+    about 9 bytes per row plus the text, instead of a Python object per row
+    """
+
+    def __init__(self, data, offsets, missing, overrides=None):
+        self.data = data
+        self.offsets = offsets
+        self.missing = missing
+        # Changed values of existing rows (the buffer is append-only)
+        self.overrides = overrides or {}
+
+    @classmethod
+    def from_values(cls, values):
+        """Pack strings (anything else is missing); uses pyarrow's packing when installed"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            pa = None
+        if pa is not None and isinstance(values, pd.Series) and pd.api.types.is_string_dtype(values.dtype):
+            packed = pa.array(values, type=pa.large_string(), from_pandas=True)
+            if isinstance(packed, pa.ChunkedArray):
+                packed = packed.combine_chunks()
+            validity, offsets, data = packed.buffers()
+            offsets = np.frombuffer(offsets, dtype=np.int64)[packed.offset:packed.offset + len(packed) + 1]
+            return cls(
+                data.to_pybytes() if data is not None else b'',
+                offsets.copy(),
+                packed.is_null().to_numpy(zero_copy_only=False)
+            )
+
+        values = list(values)
+        encoded = [value.encode('utf-8') if isinstance(value, str) else b'' for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        missing = np.fromiter((not isinstance(value, str) for value in values), dtype=bool, count=len(values))
+        return cls(b''.join(encoded), offsets, missing)
+
+    def __len__(self):
+        return len(self.missing)
+
+    def get(self, row):
+        if self.overrides and row in self.overrides:
+            return self.overrides[row]
+        if self.missing[row]:
+            return MISSING
+        return self.data[self.offsets[row]:self.offsets[row + 1]].decode('utf-8')
+
+    def with_values(self, rows, values):
+        size = len(self)
+        appended = [value for row, value in zip(rows, values) if row >= size]
+        column = self if not appended else self._concat(TextColumn.from_values(appended))
+        changed = {row: value for row, value in zip(rows, values) if row < size}
+        if changed:
+            column = copy.copy(column)
+            column.overrides = {**self.overrides, **changed}
+        return column
+
+    def nbytes(self):
+        return len(self.data) + self.offsets.nbytes + self.missing.nbytes
+
+    def _concat(self, other):
+        return TextColumn(
+            self.data + other.data,
+            np.concatenate([self.offsets, other.offsets[1:] + self.offsets[-1]]),
+            np.concatenate([self.missing, other.missing]),
+            self.overrides
+        )
+
+
+class CategoryColumn:
+    """Distinct values stored once (interned); rows hold int32 codes (-1 = missing)"""
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+        self._lookup = None
+
+    @classmethod
+    def from_categorical(cls, values):
+        values = pd.Categorical(values)
+        return cls(values.codes.astype(np.int32), list(values.categories))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def get(self, row):
+        code = self.codes[row]
+        return self.categories[code] if code >= 0 else MISSING
+
+    def with_values(self, rows, values):
+        if self._lookup is None:
+            self._lookup = {category: code for code, category in enumerate(self.categories)}
+
+        categories, lookup = self.categories, self._lookup
+        new_codes = []
+        for value in values:
+            if not isinstance(value, str):
+                new_codes.append(-1)
+                continue
+            code = lookup.get(value)
+            if code is None:
+                if categories is self.categories:
+                    categories, lookup = list(categories), dict(lookup)
+                code = lookup[value] = len(categories)
+                categories.append(value)
+            new_codes.append(code)
+
+        codes = _grow(self.codes, max(rows) + 1, -1)
+        codes[rows] = new_codes
+        column = CategoryColumn(codes, categories)
+        column._lookup = lookup
+        return column
+
+    def nbytes(self):
+        return self.codes.nbytes + sum(sys.getsizeof(category) + 8 for category in self.categories)
+
+
+class DateColumn:
+    """Dates as datetime64[D] (8 bytes per row, NaT = missing); read back as ISO strings"""
+
+    def __init__(self, days):
+        self.days = days
+
+    @classmethod
+    def from_values(cls, values):
+        values = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            values = pd.to_datetime(values, errors='coerce')
+        return cls(values.to_numpy().astype('datetime64[D]'))
+
+    def __len__(self):
+        return len(self.days)
+
+    def get(self, row):
+        day = self.days[row]
+        return MISSING if np.isnat(day) else str(day)
+
+    def with_values(self, rows, values):
+        days = _grow(self.days, max(rows) + 1, np.datetime64('NaT'))
+        days[rows] = DateColumn.from_values(values).days
+        return DateColumn(days)
+
+    def nbytes(self):
+        return self.days.nbytes
+
+
+class ValueColumn:
+    """Numbers (or other values) in a NumPy array of the smallest fitting dtype"""
+
+    def __init__(self, values):
+        self.values = values
+
+    @classmethod
+    def from_values(cls, values):
+        values = pd.Series(values)
+        if pd.api.types.is_integer_dtype(values.dtype):
+            values = pd.to_numeric(values, downcast='integer')
+        return cls(values.to_numpy())
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, row):
+        value = self.values[row]
+        return value.item() if hasattr(value, 'item') else value
+
+    def with_values(self, rows, values):
+        new_values = np.asarray(values)
+        dtype = np.result_type(self.values.dtype, new_values.dtype)
+        merged = _grow(self.values.astype(dtype, copy=False), max(rows) + 1, MISSING if dtype.kind == 'f' else 0)
+        merged[rows] = new_values
+        return ValueColumn(merged)
+
+    def nbytes(self):
+        return self.values.nbytes
+
+
+class LazyColumn:
+    """
+    Values left in the file and read per record on demand
+
+    positions[row] is the record's position in the file (-1 = not in the
+    file, e.g. an in-memory upsert, whose value is in overrides).
+    """
+
+    def __init__(self, reader, name, positions, overrides=None):
+        self.reader = reader
+        self.name = name
+        self.positions = positions
+        self.overrides = overrides or {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def get(self, row):
+        if self.overrides and row in self.overrides:
+            return self.overrides[row]
+        return self.reader.value(int(self.positions[row]), self.name)
+
+    def with_values(self, rows, values):
+        return LazyColumn(
+            self.reader, self.name, _grow(self.positions, max(rows) + 1, -1),
+            {**self.overrides, **dict(zip(rows, values))}
+        )
+
+    def nbytes(self):
+        return self.positions.nbytes
+
+
+class CSVRecordReader:
+    """
+    Random access to the records of a CSV file by byte range
+
+    The file stays open, so the table keeps reading the version it was
+    built from even after the path is replaced by a newer file.
+    """
+
+    def __init__(self, path, columns, starts, ends):
+        self.path = path
+        self.field_positions = {column: i for i, column in enumerate(columns)}
+        self.starts = starts
+        self.ends = ends
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path, columns, n_records):
+        """Reader for a file with n_records data rows, or None if the records cannot be located"""
+        starts, ends = cls.record_offsets(path)
+        if len(starts) != n_records:
+            return None
+        return cls(path, columns, starts, ends)
+
+    @staticmethod
+    def record_offsets(path, chunk_size=1 << 24):
+        """
+        Byte ranges of the data records, found with vectorized scans
+
+        A newline ends a record unless it is inside quotes (an odd number
+        of quote characters before it); blank lines are skipped as pandas
+        does.
+
+        Returns:
+            Tuple of (start offsets, end offsets), int64 arrays
+        """
+        boundaries = [np.zeros(1, dtype=np.int64)]
+        inside_quotes = np.uint8(0)
+        position = 0
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                buffer = np.frombuffer(chunk, dtype=np.uint8)
+                parity = np.bitwise_xor.accumulate((buffer == ord('"')).view(np.uint8)) ^ inside_quotes
+                boundaries.append(np.flatnonzero((buffer == ord('\n')) & (parity == 0)) + position + 1)
+                inside_quotes = parity[-1]
+                position += len(chunk)
+
+        boundaries = np.concatenate(boundaries + [np.array([position], dtype=np.int64)])
+        starts, ends = boundaries[1:-1], boundaries[2:]
+
+        # Drop empty tails and blank lines ("\n" or "\r\n")
+        keep = ends - starts > 2
+        with open(path, 'rb') as f:
+            for i in np.flatnonzero(~keep & (ends > starts)):
+                f.seek(starts[i])
+                keep[i] = bool(f.read(ends[i] - starts[i]).strip())
+        return starts[keep], ends[keep]
+
+    def value(self, position, column):
+        if position < 0:
+            return MISSING
+        start, end = int(self.starts[position]), int(self.ends[position])
+        if hasattr(os, 'pread'):
+            raw = os.pread(self._file.fileno(), end - start, start)
+        else:
+            with self._lock:
+                self._file.seek(start)
+                raw = self._file.read(end - start)
+
+        text = raw.decode('utf-8')
+        if '"' in text:
+            fields = next(csv.reader(io.StringIO(text)), [])
+        else:
+            fields = text.rstrip('\r\n').split(',')
+        index = self.field_positions[column]
+        value = fields[index] if index < len(fields) else ''
+        # pandas reads empty fields as missing
+        return value if value != '' else MISSING
+
+
+class ManuscriptFile:
+    """
+    A manuscript file read into a typed DataFrame (lazy columns excluded)
+
+    CSV is parsed with pyarrow when it is installed (multi-threaded, and
+    categorical columns are dictionary-encoded while parsing), otherwise
+    with pandas; lazy columns are skipped and reached through `reader`.
+    Parquet files (*.parquet, needs pyarrow) are read whole.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: CSV or Parquet file
+        """
+        self.path = path
+        if path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+
+            # Parquet has no cheap access to single rows: every column is
+            # loaded (text packed into TextColumn buffers)
+            self.columns = tuple(pq.ParquetFile(path).schema_arrow.names)
+            eager = list(self.columns)
+            frame = pd.read_parquet(path)
+            self.reader = None
+        else:
+            with open(path, newline='', encoding='utf-8') as f:
+                self.columns = tuple(next(csv.reader(f), []))
+            eager = [column for column in self.columns if column not in LAZY_COLUMNS]
+            frame = self._read_csv(path, eager)
+            self.reader = None
+            if len(eager) < len(self.columns):
+                self.reader = CSVRecordReader.open(path, self.columns, len(frame))
+                if self.reader is None:
+                    # Records could not be located: keep the lazy columns in memory
+                    frame = pd.read_csv(path, dtype={
+                        column: 'category' for column in CATEGORICAL_COLUMNS if column in self.columns
+                    })
+                    eager = list(self.columns)
+
+        for column in eager:
+            if column in CATEGORICAL_COLUMNS:
+                frame[column] = frame[column].astype('category').cat.remove_unused_categories()
+            elif column in DATE_COLUMNS:
+                frame[column] = pd.to_datetime(frame[column], errors='coerce')
+        self.frame = frame[eager]
+        # Content hash per row, to find changed rows on reload
+        self.hashes = pd.util.hash_pandas_object(self.frame, index=False).to_numpy()
+
+    @classmethod
+    def empty(cls):
+        """File stand-in with no rows"""
+        file = cls.__new__(cls)
+        file.path = None
+        file.columns = MANUSCRIPT_COLUMNS
+        file.frame = pd.DataFrame({column: pd.Series([], dtype=object) for column in MANUSCRIPT_COLUMNS})
+        file.reader = None
+        file.hashes = np.zeros(0, dtype=np.uint64)
+        return file
+
+    @staticmethod
+    def _read_csv(path, columns):
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return pd.read_csv(
+                path, usecols=columns,
+                dtype={column: 'category' for column in CATEGORICAL_COLUMNS if column in columns}
+            )
+
+        table = pa_csv.read_csv(
+            path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                strings_can_be_null=True,
+                column_types={
+                    column: pa.dictionary(pa.int32(), pa.string())
+                    for column in CATEGORICAL_COLUMNS if column in columns
+                }
+            )
+        )
+        return table.to_pandas()
+
+
+class ManuscriptTable:
+    """
+    In-memory manuscripts with their indexes: one consistent version
+
+    Columns are stored compactly by type: IDs packed in one UTF-8 buffer,
+    authors and statuses as integer codes into interned values, dates as
+    datetime64, counts in the smallest integer dtype, and notes of a CSV
+    file left in the file until a record is materialized. The ID index holds a 64-bit
+    hash per row (sorted, with the row permutation) instead of a dict of
+    strings; a lookup binary-searches the hash and verifies the ID. The
+    first record wins if an ID appears more than once.
+
+    Statuses are indexed status -> sorted row numbers, so a status search
+    matches the few distinct statuses, not every row. Review-time
+    statistics are kept as histograms. Author search runs on the trigram
+    index of the distinct author names and expands matches to their rows.
+
+    A table is not modified once built: updated() returns a new table that
+    shares the unchanged parts, so a reader holding a table never sees a
+    half-applied change.
+    """
+
+    def __init__(self, file):
+        """
+        Args:
+            file: ManuscriptFile
+        """
+        frame = file.frame
+        self.names = file.columns
+        self.n_rows = len(frame)
+        self.row_hashes = file.hashes
+
+        self.columns = {}
+        for name in self.names:
+            if name not in frame.columns:
+                self.columns[name] = LazyColumn(file.reader, name, np.arange(self.n_rows, dtype=np.int64))
+            elif name in CATEGORICAL_COLUMNS:
+                self.columns[name] = CategoryColumn.from_categorical(frame[name])
+            elif name in DATE_COLUMNS:
+                self.columns[name] = DateColumn.from_values(frame[name])
+            elif pd.api.types.is_numeric_dtype(frame[name].dtype):
+                self.columns[name] = ValueColumn.from_values(frame[name])
+            else:
+                self.columns[name] = TextColumn.from_values(frame[name])
+
+        # Same keys as normalize_id, vectorized
+        keys = frame['manuscript_id'].astype('string').str.strip().str.upper()
+        valid = keys.notna().to_numpy()
+        self.key_hashes, self.key_rows = self._key_index(keys[valid].tolist(), np.flatnonzero(valid))
+        self.n_keys = int(keys.nunique())
+
+        # Status -> sorted row numbers, grouped by status code
+        status = self.columns['current_status']
+        order = np.argsort(status.codes, kind='stable')
+        bounds = np.searchsorted(status.codes[order], np.arange(len(status.categories) + 1))
+        self.status_rows = {
+            category: order[bounds[i]:bounds[i + 1]]
+            for i, category in enumerate(status.categories)
+            if bounds[i + 1] > bounds[i]
+        }
+
+        submitted, decided = self.columns['submission_date'].days, self.columns['decision_date'].days
+        days = (decided - submitted).astype(np.float64)
+        days[np.isnat(submitted) | np.isnat(decided) | (days < 0)] = np.nan
+        statuses = np.array(status.categories + [MISSING], dtype=object)[status.codes]
+        self.review_stats = ReviewTimeStats()
+        self.review_stats.add(statuses, days)
+
+        author = self.columns['author_name']
+        self.author_index = TrigramIndex().build(author.categories)
+        self._index_authors()
+
+    def find(self, manuscript_id):
+        """
+        Row of a manuscript ID
+
+        Args:
+            manuscript_id: Manuscript identifier (any case/whitespace)
+
+        Returns:
+            Row number or None
+        """
+        if not manuscript_id:
+            return None
+        key = normalize_id(manuscript_id)
+        key_hash = hash(key)
+        position = int(np.searchsorted(self.key_hashes, key_hash))
+        ids = self.columns['manuscript_id']
+        while position < len(self.key_hashes) and self.key_hashes[position] == key_hash:
+            row = int(self.key_rows[position])
+            if normalize_id(ids.get(row)) == key:
+                return row
+            position += 1
+        return None
+
+    def find_rows(self, keys):
+        """
+        Rows of normalized IDs (vectorized; hash match only)
+
+        Args:
+            keys: Sequence of normalized IDs
+
+        Returns:
+            int64 array with the row per key (-1 = not found)
+        """
+        if not len(self.key_hashes):
+            return np.full(len(keys), -1, dtype=np.int64)
+        hashes = np.fromiter(map(hash, keys), dtype=np.int64, count=len(keys))
+        positions = np.minimum(np.searchsorted(self.key_hashes, hashes), len(self.key_hashes) - 1)
+        return np.where(self.key_hashes[positions] == hashes, self.key_rows[positions], -1).astype(np.int64)
+
+    def record(self, row):
+        """Record dict of a row (lazy columns are read from the file here)"""
+        return {name: column.get(row) for name, column in self.columns.items()}
+
+    def author_rows(self, author_name, limit=None, min_similarity=0.5):
+        """
+        Rows of the authors matching a name, best match first
+
+        Args:
+            author_name: Full or partial author name
+            limit: Maximum number of rows (None = all)
+            min_similarity: Minimum trigram similarity of fuzzy matches
+
+        Returns:
+            Array of row numbers
+        """
+        # Each author has at least one row unless an update moved them all
+        # away, so `limit` authors are usually enough
+        for author_limit in ((limit, None) if limit is not None else (None,)):
+            codes, _ = self.author_index.search(author_name, limit=author_limit, min_similarity=min_similarity)
+            rows = [self.author_order[self.author_bounds[code]:self.author_bounds[code + 1]] for code in codes]
+            rows = np.concatenate(rows) if rows else np.array([], dtype=np.intp)
+            if limit is None or len(rows) >= limit or len(codes) < limit:
+                break
+        return rows[:limit]
+
+    def updated(self, records, row_hashes=None):
+        """
+        Apply inserts and updates to a copy of the table
+
+        Only the changed rows are re-indexed: status index entries move
+        between statuses, review-time histograms are updated by the
+        difference, new IDs are inserted into the ID index and new authors
+        into the trigram index.
+
+        Args:
+            records: Iterable of record dicts (missing fields are stored as NaN)
+            row_hashes: Optional content hash per record (default: unknown)
+
+        Returns:
+            Tuple of (new ManuscriptTable, rows added, rows updated)
+        """
+        # Final values per row; the state before the batch for existing rows
+        final, previous, new_keys = {}, {}, {}
+        for i, record in enumerate(records):
+            if not record.get('manuscript_id'):
+                continue
+            key = normalize_id(record['manuscript_id'])
+            row = new_keys.get(key)
+            if row is None:
+                row = self.find(key)
+            if row is None:
+                row = new_keys[key] = self.n_rows + len(new_keys)
+            elif row < self.n_rows and row not in previous:
+                previous[row] = self.record(row)
+
+            values = {name: record.get(name) for name in self.names}
+            values = {name: MISSING if value is None else value for name, value in values.items()}
+            if row < self.n_rows:
+                # The stored ID keeps its original spelling
+                values['manuscript_id'] = previous[row]['manuscript_id']
+            final[row] = (values, 0 if row_hashes is None else row_hashes[i])
+
+        if not final:
+            return self, 0, 0
+
+        table = copy.copy(self)
+        table.n_rows = self.n_rows + len(new_keys)
+        table.n_keys = self.n_keys + len(new_keys)
+
+        rows = sorted(final)
+        table.columns = {
+            name: column.with_values(rows, [final[row][0][name] for row in rows])
+            for name, column in self.columns.items()
+        }
+
+        table.row_hashes = _grow(self.row_hashes, table.n_rows, 0)
+        table.row_hashes[rows] = np.array([final[row][1] for row in rows], dtype=np.uint64)
+
+        if new_keys:
+            hashes, key_rows = self._key_index(list(new_keys), list(new_keys.values()))
+            positions = np.searchsorted(self.key_hashes, hashes, side='right')
+            table.key_hashes = np.insert(self.key_hashes, positions, hashes)
+            table.key_rows = np.insert(self.key_rows, positions, key_rows)
+
+        table._index_changes(previous, {row: values for row, (values, _) in final.items()})
+        return table, len(new_keys), len(final) - len(new_keys)
+
+    def relinked(self, reader, positions):
+        """
+        Copy whose lazy columns read from another version of the file
+
+        Args:
+            reader: Record reader of the new file
+            positions: File position of every row
+
+        Returns:
+            New ManuscriptTable
+        """
+        table = copy.copy(self)
+        table.columns = {
+            name: LazyColumn(reader, name, positions) if isinstance(column, LazyColumn) else column
+            for name, column in self.columns.items()
+        }
+        return table
+
+    def memory_usage(self):
+        """
+        Approximate memory of the table
+
+        Returns:
+            Dict of part -> bytes (columns, ID index, status, author and
+            change-tracking indexes)
+        """
+        usage = {f"column:{name}": column.nbytes() for name, column in self.columns.items()}
+        usage["id_index"] = self.key_hashes.nbytes + self.key_rows.nbytes
+        usage["status_index"] = sum(rows.nbytes for rows in self.status_rows.values())
+        usage["author_index"] = (
+            self.author_order.nbytes + self.author_bounds.nbytes + self.author_index.postings.nbytes +
+            self.author_index.offsets.nbytes + sum(sys.getsizeof(name) + 8 for name in self.author_index.names)
+        )
+        usage["row_hashes"] = self.row_hashes.nbytes
+        return usage
+
+    @staticmethod
+    def _key_index(keys, rows):
+        """Sorted 64-bit hashes of normalized IDs and their rows"""
+        hashes = np.fromiter(map(hash, keys), dtype=np.int64, count=len(keys))
+        key_rows = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(hashes, kind='stable')
+        return hashes[order], key_rows[order]
+
+    def _index_authors(self):
+        """Rows grouped by author code (CSR: author_order[author_bounds[c]:author_bounds[c + 1]])"""
+        codes = self.columns['author_name'].codes
+        self.author_order = np.argsort(codes, kind='stable')
+        n_authors = len(self.columns['author_name'].categories)
+        self.author_bounds = np.searchsorted(codes[self.author_order], np.arange(n_authors + 1))
+
+    def _index_changes(self, previous, final):
+        """Update statistics, status and author indexes from old and new row values"""
+        old = list(previous.values())
+        new = list(final.values())
+        self.review_stats = self.review_stats.copy()
+        self.review_stats.remove(
+            [values['current_status'] for values in old],
+            review_days([values['submission_date'] for values in old], [values['decision_date'] for values in old])
+        )
+        self.review_stats.add(
+            [values['current_status'] for values in new],
+            review_days([values['submission_date'] for values in new], [values['decision_date'] for values in new])
+        )
+
+        removed, added = {}, {}
+        for row, values in final.items():
+            old_status = previous[row]['current_status'] if row in previous else None
+            if old_status == values['current_status']:
+                continue
+            if isinstance(old_status, str):
+                removed.setdefault(old_status, []).append(row)
+            if isinstance(values['current_status'], str):
+                added.setdefault(values['current_status'], []).append(row)
+
+        # The dict is replaced, not mutated, for concurrent readers
+        status_rows = dict(self.status_rows)
+        for status in set(removed) | set(added):
+            rows = status_rows.get(status, np.array([], dtype=np.intp))
+            if status in removed:
+                rows = np.delete(rows, np.searchsorted(rows, sorted(removed[status])))
+            if status in added:
+                new_rows = sorted(added[status])
+                rows = np.insert(rows, np.searchsorted(rows, new_rows), new_rows)
+            if len(rows):
+                status_rows[status] = rows
+            else:
+                status_rows.pop(status, None)
+        self.status_rows = status_rows
+
+        authors = self.columns['author_name'].categories
+        if len(authors) > len(self.author_index.names):
+            self.author_index = self.author_index.add(authors[len(self.author_index.names):])
+        if any(row not in previous or str(previous[row]['author_name']) != str(values['author_name'])
+               for row, values in final.items()):
+            self._index_authors()
+
+
+def _grow(array, size, fill):
+    """Copy of an array extended to `size` with a fill value"""
+    grown = np.empty(max(size, len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    grown[len(array):] = fill
+    return grown
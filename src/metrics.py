@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyTracker:
+    """
+    Thread-safe per-stage latency statistics (triage, response, lookup, ...)
+    """
+
+    def __init__(self, max_samples=1000):
+        """
+        Args:
+            max_samples: Number of recent samples kept per stage for percentiles
+        """
+        self.max_samples = max_samples
+        self._samples = {}
+        self._counts = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        """
+        Record one latency sample
+
+        Args:
+            stage: Stage name (e.g. "triage")
+            seconds: Elapsed wall-clock time in seconds
+        """
+        with self._lock:
+            if stage not in self._samples:
+                self._samples[stage] = deque(maxlen=self.max_samples)
+                self._counts[stage] = 0
+                self._totals[stage] = 0.0
+            self._samples[stage].append(seconds)
+            self._counts[stage] += 1
+            self._totals[stage] += seconds
+
+    @contextmanager
+    def track(self, stage):
+        """Context manager that records the time spent inside the block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def summary(self):
+        """
+        Get latency statistics for every stage
+
+        Returns:
+            Dict of stage -> {count, mean_ms, p50_ms, p95_ms, max_ms}
+        """
+        with self._lock:
+            snapshot = {
+                stage: (sorted(samples), self._counts[stage], self._totals[stage])
+                for stage, samples in self._samples.items()
+            }
+
+        stats = {}
+        for stage, (samples, count, total) in snapshot.items():
+            if not samples:
+                continue
+            stats[stage] = {
+                "count": count,
+                "mean_ms": round(total / count * 1000, 2),
+                "p50_ms": round(self._percentile(samples, 0.50) * 1000, 2),
+                "p95_ms": round(self._percentile(samples, 0.95) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2)
+            }
+        return stats
+
+    def reset(self):
+        """Clear all recorded samples"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
+
+    @staticmethod
+    def _percentile(sorted_samples, fraction):
+        """Nearest-rank percentile of an already sorted list"""
+        index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+        return sorted_samples[index]
+
+
+# Process-wide tracker shared by the LLM client and the orchestrator
+latency_tracker = LatencyTracker()
@@ -0,0 +1,31 @@
+import re
+import unicodedata
+
+
+MANUSCRIPT_ID_PATTERN = re.compile(r'MS-\d{4}-\d{4}', re.IGNORECASE)
+
+
+def normalize_message(text):
+    """
+    Normalize a customer message and mask its manuscript IDs
+
+    Shared by the triage cache keys, the BM25 tokenizer, the hashing
+    embeddings and the local classifier, so they all see the same text.
+    Changing it changes cache keys and invalidates stored BM25 indexes and
+    hashing embeddings.
+
+    Args:
+        text: Customer message
+
+    Returns:
+        Tuple of (normalized_text, manuscript_ids in order of appearance);
+        each ID is replaced by the token "msid" in normalized_text
+    """
+    text = unicodedata.normalize("NFKC", str(text))
+    manuscript_ids = [match.upper() for match in MANUSCRIPT_ID_PATTERN.findall(text)]
+
+    text = MANUSCRIPT_ID_PATTERN.sub(" msid ", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    text = " ".join(text.split())
+
+    return text, manuscript_ids
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import re
+
+from config.config import Config
+from src.cache import LRUCache, SQLiteCache
+from src.text_utils import normalize_message
+
+
+class TriageCache:
+    """
+    Cache of triage classifications keyed on normalized message text
+
+    Manuscript IDs are masked in the key, so "any update on MS-2024-1234?"
+    and "Any update on MS-2024-5602" share one entry; the cached result is
+    re-filled with the IDs of the current message on a hit.
+
+    Every entry is keyed together with a fingerprint of the triage setup
+    (categories, model, system prompt), so entries made under another
+    configuration are never returned.
+    """
+
+    def __init__(self, max_size=None, ttl_seconds=None, db_path=None):
+        """
+        Args:
+            max_size: In-memory LRU size (default from config)
+            ttl_seconds: Entry lifetime (default from config)
+            db_path: Optional SQLite file shared between workers (default from config)
+        """
+        ttl_seconds = Config.TRIAGE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+
+        self.memory = LRUCache(
+            max_size=max_size or Config.TRIAGE_CACHE_MAX_SIZE,
+            ttl_seconds=ttl_seconds
+        )
+
+        db_path = db_path or Config.TRIAGE_CACHE_DB_PATH
+        self.persistent = None
+        if db_path:
+            self.persistent = SQLiteCache(
+                db_path,
+                table="triage_cache",
+                ttl_seconds=ttl_seconds,
+                max_entries=Config.TRIAGE_CACHE_DB_MAX_ENTRIES
+            )
+
+    def get(self, query, fingerprint):
+        """
+        Get a cached classification
+
+        Args:
+            query: Customer message
+            fingerprint: Current triage fingerprint (see triage_fingerprint)
+
+        Returns:
+            Classification dict or None
+        """
+        key, manuscript_ids = self._key(query, fingerprint)
+
+        stored = self.memory.get(key)
+        if stored is None and self.persistent is not None:
+            blob = self.persistent.get(key)
+            if blob is not None:
+                stored = json.loads(blob)
+                self.memory.set(key, stored)
+
+        if stored is None:
+            return None
+
+        return self._unmask(stored, manuscript_ids)
+
+    def set(self, query, result, fingerprint):
+        """
+        Cache a classification
+
+        Args:
+            query: Customer message
+            result: Classification dict from Claude
+            fingerprint: Current triage fingerprint (see triage_fingerprint)
+        """
+        key, manuscript_ids = self._key(query, fingerprint)
+        stored = self._mask(result, manuscript_ids)
+
+        self.memory.set(key, stored)
+        if self.persistent is not None:
+            self.persistent.set(key, json.dumps(stored).encode("utf-8"), namespace=fingerprint)
+
+    def purge_stale(self, fingerprint):
+        """
+        Drop persisted entries written under another triage fingerprint
+
+        Args:
+            fingerprint: Current triage fingerprint
+        """
+        if self.persistent is not None:
+            self.persistent.purge_other_namespaces(fingerprint)
+
+    def clear(self):
+        """Remove all cached classifications"""
+        self.memory.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with memory and (optional) persistent tier stats
+        """
+        stats = {"memory": self.memory.get_stats()}
+        if self.persistent is not None:
+            stats["persistent"] = self.persistent.get_stats()
+        return stats
+
+    def _key(self, query, fingerprint):
+        normalized, manuscript_ids = normalize_message(query)
+        digest = hashlib.sha256(f"{fingerprint}\0{normalized}".encode("utf-8")).hexdigest()
+        return digest, manuscript_ids
+
+    @staticmethod
+    def _mask(result, manuscript_ids):
+        """Replace the message's manuscript IDs with positional placeholders"""
+        masked = {}
+        for field, value in result.items():
+            if isinstance(value, str):
+                for position, manuscript_id in enumerate(manuscript_ids):
+                    value = re.sub(re.escape(manuscript_id), f"{{MS_ID_{position}}}", value, flags=re.IGNORECASE)
+            masked[field] = value
+        return masked
+
+    @staticmethod
+    def _unmask(stored, manuscript_ids):
+        """Fill positional placeholders with the current message's manuscript IDs"""
+        result = {}
+        for field, value in stored.items():
+            if isinstance(value, str):
+                for position, manuscript_id in enumerate(manuscript_ids):
+                    value = value.replace(f"{{MS_ID_{position}}}", manuscript_id)
+            result[field] = value
+        return result
+
+
+def triage_fingerprint(system_prompt):
+    """
+    Hash everything that changes what the triage step would return
+
+    Args:
+        system_prompt: Triage system prompt
+
+    Returns:
+        Hex digest
+    """
+    parts = [
+        Config.CLAUDE_MODEL,
+        json.dumps(Config.CATEGORIES),
+        json.dumps(Config.URGENCY_LEVELS),
+        system_prompt
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:16]
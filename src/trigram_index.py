@@ -0,0 +1,228 @@
+import copy
+import re
+import unicodedata
+
+import numpy as np
+
+
+class TrigramIndex:
+    """
+    Character-trigram inverted index for substring and fuzzy name search
+
+    Names are normalized (accents, case, punctuation and titles removed) and
+    padded with a space on each side; every distinct trigram maps to the
+    rows containing it (sorted), in CSR layout like BM25Index. Candidates
+    come from the rarest posting lists only (prefix filtering) and their
+    shared trigrams are counted by binary search in each list; if even the
+    rarest lists are long, all postings are counted with one bincount.
+
+    - Substring matches are rows containing every trigram of the query,
+      confirmed with a plain substring test.
+    - Fuzzy matches are scored by the fraction of the query's padded
+      trigrams found in the name, which tolerates typos and transposed
+      letters and works for partial names ("jonson" in "sarah johnson").
+      Ties are broken by Jaccard similarity, so closer names come first.
+    """
+
+    # Removed before indexing so "Dr. Smith" and "Smith" compare equal
+    TITLES = frozenset({"dr", "prof", "professor", "mr", "mrs", "ms", "miss"})
+
+    def __init__(self):
+        self.names = []
+        self.vocabulary = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.postings = np.array([], dtype=np.int32)
+        self.trigram_counts = np.array([], dtype=np.int32)
+
+    @classmethod
+    def normalize(cls, name):
+        """
+        Normalize a name for matching
+
+        Args:
+            name: Raw name (e.g., "Dr. José O'Brien")
+
+        Returns:
+            Lower-case ASCII words without titles (e.g., "jose o brien")
+        """
+        text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii").lower()
+        words = re.sub(r"[^a-z0-9]+", " ", text).split()
+        return " ".join(word for word in words if word not in cls.TITLES)
+
+    @staticmethod
+    def trigrams(text, padded=True):
+        """
+        Distinct trigrams of normalized text
+
+        Args:
+            text: Normalized text
+            padded: Add a space on each side (word-boundary trigrams)
+
+        Returns:
+            Set of 3-character strings
+        """
+        if padded:
+            text = f" {text} "
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def build(self, names):
+        """
+        Index names
+
+        Args:
+            names: List of names, one per row (None/NaN rows never match)
+
+        Returns:
+            self
+        """
+        built = TrigramIndex().add(names)
+        self.__dict__.update(built.__dict__)
+        return self
+
+    def add(self, names):
+        """
+        Index names appended after the existing rows
+
+        New rows are larger than every indexed row, so they are inserted at
+        the end of each trigram's posting list. The original index is left
+        untouched, so searches running concurrently stay consistent.
+
+        Args:
+            names: List of names, one per new row
+
+        Returns:
+            New TrigramIndex covering old and new rows
+        """
+        updated = copy.copy(self)
+        updated.vocabulary = dict(self.vocabulary)
+
+        first_row = len(self.names)
+        new_names = [self.normalize(name) if isinstance(name, str) else "" for name in names]
+
+        trigram_ids, rows = [], []
+        counts = np.zeros(len(new_names), dtype=np.int32)
+        for i, name in enumerate(new_names):
+            if not name:
+                continue
+            grams = self.trigrams(name)
+            counts[i] = len(grams)
+            for gram in grams:
+                trigram_ids.append(updated.vocabulary.setdefault(gram, len(updated.vocabulary)))
+                rows.append(first_row + i)
+
+        trigram_ids = np.array(trigram_ids, dtype=np.int64)
+        rows = np.array(rows, dtype=np.int32)
+        order = np.argsort(trigram_ids, kind='stable')
+        trigram_ids, rows = trigram_ids[order], rows[order]
+
+        # New trigrams start with empty posting lists at the end
+        n_trigrams = len(updated.vocabulary)
+        offsets = np.concatenate([
+            self.offsets,
+            np.full(n_trigrams + 1 - len(self.offsets), self.offsets[-1], dtype=np.int64)
+        ])
+
+        updated.postings = np.insert(self.postings, offsets[trigram_ids + 1], rows)
+        updated.offsets = offsets + np.concatenate([[0], np.cumsum(np.bincount(trigram_ids, minlength=n_trigrams))])
+        updated.trigram_counts = np.concatenate([self.trigram_counts, counts])
+        updated.names = self.names + new_names
+        return updated
+
+    def search(self, query, limit=None, min_similarity=0.5):
+        """
+        Find rows matching a name
+
+        Args:
+            query: Full or partial name
+            limit: Maximum number of rows (None = all matches)
+            min_similarity: Minimum share of query trigrams a fuzzy match
+                            must contain (0-1)
+
+        Returns:
+            Tuple of (row indices, scores): substring matches first, then
+            fuzzy matches, each best first
+        """
+        query = self.normalize(query)
+        empty = (np.array([], dtype=np.intp), np.array([], dtype=np.float32))
+        if not query:
+            return empty
+
+        # Queries too short for a trigram: every name containing them has a
+        # padded trigram containing them
+        if len(query) < 3:
+            lists = [self._postings(gram) for gram in self.vocabulary if query in gram]
+            rows = np.unique(np.concatenate(lists)).astype(np.intp) if lists else empty[0]
+            return rows[:limit], np.ones(len(rows[:limit]), dtype=np.float32)
+
+        padded_grams = self.trigrams(query)
+        padded_lists = sorted((self._postings(gram) for gram in padded_grams), key=len)
+
+        # Substring matches contain every inner trigram: intersect from the rarest list
+        inner_lists = sorted((self._postings(gram) for gram in self.trigrams(query, padded=False)), key=len)
+        substring_rows = inner_lists[0]
+        for postings in inner_lists[1:]:
+            if not len(substring_rows):
+                break
+            substring_rows = substring_rows[self._contains(postings, substring_rows)]
+        if len(inner_lists) > 1:
+            substring_rows = np.array([row for row in substring_rows if query in self.names[row]], dtype=np.intp)
+
+        # A row sharing `needed` trigrams must appear in one of the
+        # len - needed + 1 rarest lists (prefix filtering); when those lists
+        # are long anyway, counting every posting at once is cheaper
+        needed = max(1, int(np.ceil(min_similarity * len(padded_grams))))
+        prefix = padded_lists[:max(0, len(padded_lists) - needed + 1)]
+        prefix_size = sum(len(postings) for postings in prefix)
+        total_size = sum(len(postings) for postings in padded_lists)
+
+        if limit is not None and len(substring_rows) >= limit:
+            # Enough substring matches: fuzzy ones would rank below them
+            candidates = substring_rows.astype(np.intp)
+            shared = np.zeros(len(candidates), dtype=np.int32)
+            for postings in padded_lists:
+                shared += self._contains(postings, candidates)
+        elif prefix_size * len(padded_lists) > 4 * total_size:
+            counts = np.bincount(np.concatenate(padded_lists), minlength=len(self.names))
+            candidates = np.union1d(np.flatnonzero(counts >= needed), substring_rows).astype(np.intp)
+            shared = counts[candidates].astype(np.int32)
+        else:
+            candidates = np.unique(np.concatenate(prefix + [substring_rows])).astype(np.intp)
+            shared = np.zeros(len(candidates), dtype=np.int32)
+            for postings in padded_lists:
+                shared += self._contains(postings, candidates)
+
+        if not len(candidates):
+            return empty
+
+        coverage = (shared / len(padded_grams)).astype(np.float32)
+        jaccard = shared / (len(padded_grams) + self.trigram_counts[candidates] - shared)
+        is_substring = self._contains(substring_rows, candidates)
+
+        # Substring matches rank first; then coverage, then Jaccard
+        keep = is_substring | (coverage >= min_similarity)
+        order = np.lexsort((-jaccard[keep], -coverage[keep], ~is_substring[keep]))[:limit]
+        return candidates[keep][order], coverage[keep][order]
+
+    def get_stats(self):
+        """
+        Get index statistics
+
+        Returns:
+            Dict with name, trigram and posting counts
+        """
+        return {"names": len(self.names), "trigrams": len(self.vocabulary), "postings": len(self.postings)}
+
+    def _postings(self, gram):
+        """Rows containing a trigram (sorted)"""
+        trigram_id = self.vocabulary.get(gram)
+        if trigram_id is None:
+            return np.array([], dtype=np.int32)
+        return self.postings[self.offsets[trigram_id]:self.offsets[trigram_id + 1]]
+
+    @staticmethod
+    def _contains(sorted_rows, rows):
+        """Boolean mask: which of rows are in the sorted array sorted_rows"""
+        if not len(sorted_rows):
+            return np.zeros(len(rows), dtype=bool)
+        positions = np.minimum(np.searchsorted(sorted_rows, rows), len(sorted_rows) - 1)
+        return sorted_rows[positions] == rows
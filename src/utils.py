@@ -1,38 +1,187 @@
-import anthropic
 from config.config import Config
+from src.llm_client import get_llm_client, LLMError
 import json
 
-def call_claude(prompt, system_prompt=None, temperature=None):
+def call_claude(prompt, system_prompt=None, temperature=None, stage="claude", timeout=None):
     """
-    Make a call to Claude API
+    Make a call to Claude API through the shared, pooled client
+    
+    Args:
+        prompt: User prompt/query
+        system_prompt: System instructions for Claude, as a string or a list
+                       of system blocks (see build_system_blocks)
+        temperature: Sampling temperature (default from config)
+        stage: Stage name for latency stats (e.g. "triage", "response")
+        timeout: Per-call timeout in seconds (default from config)
+    
+    Returns:
+        Response text from Claude
+    
+    Raises:
+        LLMError: if the call fails (transient failures were already retried)
+    """
+    message = get_llm_client().create_message(
+        stage=stage,
+        timeout=timeout,
+        **_message_kwargs(prompt, system_prompt, temperature)
+    )
+    
+    return message.content[0].text
+
+
+async def acall_claude(prompt, system_prompt=None, temperature=None, stage="claude", timeout=None):
+    """
+    Async variant of call_claude (same arguments and return value)
     
     Args:
         prompt: User prompt/query
         system_prompt: System instructions for Claude
         temperature: Sampling temperature (default from config)
+        stage: Stage name for latency stats (e.g. "triage", "response")
+        timeout: Per-call timeout in seconds (default from config)
     
     Returns:
         Response text from Claude
+    
+    Raises:
+        LLMError: if the call fails (transient failures were already retried)
     """
-    client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+    message = await get_llm_client().acreate_message(
+        stage=stage,
+        timeout=timeout,
+        **_message_kwargs(prompt, system_prompt, temperature)
+    )
     
-    temp = temperature if temperature is not None else Config.TEMPERATURE
+    return message.content[0].text
+
+
+def call_claude_tool(prompt, tool, system_prompt=None, temperature=None, stage="claude", timeout=None):
+    """
+    Call Claude forcing a single tool call, and return its structured input
+    
+    Used instead of asking for fenced JSON in free text: the API validates
+    the tool input against the tool's JSON schema.
+    
+    Args:
+        prompt: User prompt/query
+        tool: Tool definition dict (name, description, input_schema)
+        system_prompt: System instructions (string or system blocks)
+        temperature: Sampling temperature (default from config)
+        stage: Stage name for latency stats
+        timeout: Per-call timeout in seconds (default from config)
     
+    Returns:
+        Dict with the tool input, or None if the call failed
+    """
     try:
-        message = client.messages.create(
-            model=Config.CLAUDE_MODEL,
-            max_tokens=Config.MAX_TOKENS,
-            temperature=temp,
-            system=system_prompt if system_prompt else "",
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
+        message = get_llm_client().create_message(
+            stage=stage,
+            timeout=timeout,
+            **_message_kwargs(prompt, system_prompt, temperature, tool)
         )
-        
-        return message.content[0].text
     
-    except Exception as e:
-        return f"Error calling Claude API: {str(e)}"
+    except LLMError as e:
+        print(f"Claude tool call failed: {e}")
+        return None
+    
+    return _tool_input(message, tool)
+
+
+async def acall_claude_tool(prompt, tool, system_prompt=None, temperature=None, stage="claude", timeout=None):
+    """
+    Async variant of call_claude_tool (same arguments and return value)
+    """
+    try:
+        message = await get_llm_client().acreate_message(
+            stage=stage,
+            timeout=timeout,
+            **_message_kwargs(prompt, system_prompt, temperature, tool)
+        )
+    
+    except LLMError as e:
+        print(f"Claude tool call failed: {e}")
+        return None
+    
+    return _tool_input(message, tool)
+
+
+def _tool_input(message, tool):
+    """Extract the forced tool call's input from a response"""
+    for block in message.content:
+        if block.type == "tool_use" and block.name == tool["name"]:
+            return dict(block.input)
+    return None
+
+
+def call_claude_stream(prompt, system_prompt=None, temperature=None, stage="claude", timeout=None):
+    """
+    Stream a Claude response as text deltas
+    
+    Args:
+        prompt: User prompt/query
+        system_prompt: System instructions for Claude
+        temperature: Sampling temperature (default from config)
+        stage: Stage name for latency stats (e.g. "response")
+        timeout: Per-call timeout in seconds (default from config)
+    
+    Yields:
+        Text deltas as they arrive from Claude
+    
+    Raises:
+        LLMError: if the call fails, possibly after some deltas were yielded
+    """
+    yield from get_llm_client().stream_text(
+        stage=stage,
+        timeout=timeout,
+        **_message_kwargs(prompt, system_prompt, temperature)
+    )
+
+
+def build_system_blocks(static_prompt):
+    """
+    Build structured system blocks with a cacheable static prefix
+    
+    The prompt carries a cache_control marker so the API can reuse its
+    processed form across requests. Prompts shorter than the model's
+    minimum cacheable length (1024 tokens for most models) are processed
+    normally and not cached; the current triage and response prompts are
+    below it.
+    
+    Args:
+        static_prompt: Instructions identical across requests
+    
+    Returns:
+        List of system blocks, or a plain string if prompt caching is disabled
+    """
+    if not Config.PROMPT_CACHING:
+        return static_prompt
+    
+    return [{
+        "type": "text",
+        "text": static_prompt,
+        "cache_control": {"type": "ephemeral"}
+    }]
+
+
+def _message_kwargs(prompt, system_prompt, temperature, tool=None):
+    """Build the Messages API arguments shared by the sync and async calls"""
+    temp = temperature if temperature is not None else Config.TEMPERATURE
+    
+    kwargs = {
+        "model": Config.CLAUDE_MODEL,
+        "max_tokens": Config.MAX_TOKENS,
+        "temperature": temp,
+        "system": system_prompt if system_prompt else "",
+        "messages": [
+            {"role": "user", "content": prompt}
+        ]
+    }
+    
+    if tool is not None:
+        kwargs["tools"] = [tool]
+        kwargs["tool_choice"] = {"type": "tool", "name": tool["name"]}
+    
+    return kwargs
 
 
 def extract_json_from_response(response_text):
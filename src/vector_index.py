@@ -0,0 +1,479 @@
+import copy
+import os
+
+import numpy as np
+
+
+def top_k(scores, k):
+    """
+    Positions of the k highest scores, best first
+
+    argpartition selects the top k in linear time; only those k are sorted.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of positions to return
+
+    Returns:
+        Array of positions into scores
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+class VectorIndex:
+    """
+    Nearest-neighbour index over the rows of an L2-normalized matrix
+
+    Scores are inner products (cosine similarity for normalized vectors).
+    Each row may carry an integer label (e.g. a category code) that
+    searches can be restricted to.
+    """
+
+    kind = None
+    persistent = False  # Whether save/load are implemented (worth caching on disk)
+
+    def build(self, matrix, labels=None):
+        """
+        Index the rows of a matrix
+
+        Args:
+            matrix: L2-normalized float32 matrix (rows x dim); kept by reference
+            labels: Optional integer label per row
+
+        Returns:
+            self
+        """
+        raise NotImplementedError
+
+    def search(self, query, k, label=None):
+        """
+        Find the rows most similar to a query
+
+        Args:
+            query: L2-normalized float32 query vector
+            k: Number of results
+            label: Only return rows with this label (None = all rows)
+
+        Returns:
+            Tuple of (row indices, scores), best first
+        """
+        raise NotImplementedError
+
+    def add(self, matrix, labels=None):
+        """
+        Index rows appended to the end of the matrix
+
+        The original index is left untouched, so searches running
+        concurrently stay consistent; swap in the returned index.
+
+        Args:
+            matrix: Full matrix, whose first rows are the already indexed ones
+            labels: Optional integer label per new row
+
+        Returns:
+            New index covering all rows of matrix
+        """
+        raise NotImplementedError
+
+    def save(self, path, fingerprint):
+        """Persist the index; fingerprint identifies the data it was built from"""
+
+    @classmethod
+    def load(cls, path, matrix, labels, fingerprint):
+        """Load a persisted index, or return None if missing or built from other data"""
+        return None
+
+    def get_stats(self):
+        """
+        Get index statistics
+
+        Returns:
+            Dict with the index kind and parameters
+        """
+        return {"kind": self.kind}
+
+    @staticmethod
+    def _label_array(matrix, labels):
+        if labels is None:
+            return np.zeros(len(matrix), dtype=np.int32)
+        return np.asarray(labels, dtype=np.int32)
+
+
+class ExactIndex(VectorIndex):
+    """
+    Brute-force search: one matrix-vector product over all (or all labelled) rows
+    """
+
+    kind = "exact"
+
+    def __init__(self):
+        self.matrix = None
+        self.label_rows = {}
+
+    def build(self, matrix, labels=None):
+        self.matrix = matrix
+        labels = self._label_array(matrix, labels)
+        self.label_rows = {int(label): np.flatnonzero(labels == label) for label in np.unique(labels)}
+        return self
+
+    def search(self, query, k, label=None):
+        if label is None:
+            scores = self.matrix @ query
+            positions = top_k(scores, k)
+            return positions, scores[positions]
+
+        rows = self.label_rows.get(label, np.array([], dtype=np.intp))
+        scores = self.matrix[rows] @ query
+        positions = top_k(scores, k)
+        return rows[positions], scores[positions]
+
+    def add(self, matrix, labels=None):
+        first_row = len(self.matrix)
+        new_rows = np.arange(first_row, len(matrix))
+        labels = self._label_array(new_rows, labels)
+
+        label_rows = dict(self.label_rows)
+        for label in np.unique(labels):
+            rows = new_rows[labels == label]
+            label_rows[int(label)] = np.concatenate([label_rows.get(int(label), np.array([], dtype=np.intp)), rows])
+
+        updated = copy.copy(self)
+        updated.matrix = matrix
+        updated.label_rows = label_rows
+        return updated
+
+    def get_stats(self):
+        return {"kind": self.kind, "rows": 0 if self.matrix is None else len(self.matrix)}
+
+
+class IVFFlatIndex(VectorIndex):
+    """
+    Inverted-file index: rows are clustered with spherical k-means and a
+    query only scores the rows of the n_probe closest clusters
+
+    Rows are scored exactly (no compression), so with enough probes the
+    results match ExactIndex. When a label filter leaves fewer than k
+    candidates in the probed clusters, further clusters are probed in
+    order of closeness until k are found.
+    """
+
+    kind = "ivf"
+    persistent = True
+
+    def __init__(self, n_lists=None, n_probe=8, n_iter=10, train_size=50000, seed=0):
+        """
+        Args:
+            n_lists: Number of clusters (default: about 4 * sqrt(rows))
+            n_probe: Clusters scored per query (recall/speed trade-off)
+            n_iter: k-means iterations
+            train_size: Rows sampled to train the clusters
+            seed: Random seed for sampling and initialization
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.train_size = train_size
+        self.seed = seed
+        self.matrix = None
+        self.centroids = None
+        self.order = None
+        self.order_labels = None
+        self.offsets = None
+
+    def build(self, matrix, labels=None):
+        self.matrix = matrix
+        rows = len(matrix)
+        n_lists = self.n_lists or max(1, int(4 * np.sqrt(rows)))
+        n_lists = min(n_lists, rows)
+
+        rng = np.random.default_rng(self.seed)
+        sample = matrix[np.sort(rng.choice(rows, size=min(rows, max(self.train_size, n_lists)), replace=False))]
+        self.centroids = self._kmeans(np.asarray(sample, dtype=np.float32), n_lists, rng)
+
+        self._set_lists(self._assign(matrix, self.centroids), self._label_array(matrix, labels))
+        return self
+
+    def search(self, query, k, label=None):
+        centroid_scores = self.centroids @ query
+        ranked = np.argsort(centroid_scores)[::-1]
+
+        chunks = []
+        found = 0
+        for probed, cluster in enumerate(ranked, 1):
+            start, end = self.offsets[cluster], self.offsets[cluster + 1]
+            rows = self.order[start:end]
+            if label is not None:
+                rows = rows[self.order_labels[start:end] == label]
+            chunks.append(rows)
+            found += len(rows)
+            if probed >= self.n_probe and found >= k:
+                break
+
+        candidates = np.sort(np.concatenate(chunks)) if chunks else np.array([], dtype=np.intp)
+        scores = self.matrix[candidates] @ query
+        positions = top_k(scores, k)
+        return candidates[positions], scores[positions]
+
+    def add(self, matrix, labels=None):
+        """New rows join their closest existing cluster (centroids are not retrained)"""
+        first_row = int(self.offsets[-1])
+        new_rows = np.arange(first_row, len(matrix))
+        labels = self._label_array(new_rows, labels)
+
+        assignments = self._assign(matrix[first_row:], self.centroids)
+        by_cluster = np.argsort(assignments, kind='stable')
+        assignments = assignments[by_cluster]
+
+        # Insert at the end of each cluster's list, keeping the CSR layout
+        insert_at = self.offsets[assignments + 1]
+        counts = np.bincount(assignments, minlength=len(self.centroids))
+
+        updated = copy.copy(self)
+        updated.matrix = matrix
+        updated.order = np.insert(self.order, insert_at, new_rows[by_cluster])
+        updated.order_labels = np.insert(self.order_labels, insert_at, labels[by_cluster])
+        updated.offsets = self.offsets + np.concatenate([[0], np.cumsum(counts)])
+        return updated
+
+    def save(self, path, fingerprint):
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            fingerprint=np.array(fingerprint),
+            params=np.array([self.n_probe, self.n_iter, self.train_size, self.seed]),
+            centroids=self.centroids,
+            order=self.order,
+            order_labels=self.order_labels,
+            offsets=self.offsets
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, matrix, labels, fingerprint):
+        try:
+            stored = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        with stored:
+            if str(stored['fingerprint']) != fingerprint or int(stored['offsets'][-1]) != len(matrix):
+                return None
+
+            n_probe, n_iter, train_size, seed = (int(value) for value in stored['params'])
+            index = cls(len(stored['centroids']), n_probe, n_iter, train_size, seed)
+            index.matrix = matrix
+            index.centroids = stored['centroids']
+            index.order = stored['order']
+            index.offsets = stored['offsets']
+            index.order_labels = cls._label_array(matrix, labels)[index.order]
+
+        return index
+
+    def get_stats(self):
+        sizes = np.diff(self.offsets) if self.offsets is not None else np.array([0])
+        return {
+            "kind": self.kind,
+            "rows": int(sizes.sum()),
+            "n_lists": len(sizes),
+            "n_probe": self.n_probe,
+            "largest_list": int(sizes.max())
+        }
+
+    def _set_lists(self, assignments, labels):
+        """Group row indices by cluster (CSR layout: order + offsets)"""
+        self.order = np.argsort(assignments, kind='stable')
+        self.order_labels = labels[self.order]
+        counts = np.bincount(assignments, minlength=len(self.centroids))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def _kmeans(self, sample, n_lists, rng):
+        """Spherical k-means: centroids are re-normalized after every update"""
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+
+        for _ in range(self.n_iter):
+            assignments = self._assign(sample, centroids)
+            counts = np.bincount(assignments, minlength=n_lists)
+
+            # Per-cluster sums over the sample sorted by cluster
+            sums = np.zeros_like(centroids)
+            filled = np.flatnonzero(counts)
+            starts = np.concatenate([[0], np.cumsum(counts)])[:-1]
+            sums[filled] = np.add.reduceat(sample[np.argsort(assignments, kind='stable')], starts[filled], axis=0)
+
+            # Re-seed empty clusters with random sample rows
+            empty = np.flatnonzero(counts == 0)
+            sums[empty] = sample[rng.choice(len(sample), size=len(empty))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        return centroids
+
+    @staticmethod
+    def _assign(matrix, centroids, chunk_size=65536):
+        """Closest centroid of every row, in chunks to bound memory"""
+        assignments = np.empty(len(matrix), dtype=np.intp)
+        for start in range(0, len(matrix), chunk_size):
+            block = np.asarray(matrix[start:start + chunk_size], dtype=np.float32)
+            assignments[start:start + chunk_size] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+
+class Int8Index(ExactIndex):
+    """
+    Scalar-quantized brute-force search with full-precision re-ranking
+
+    Every row is stored as int8 codes plus one float32 scale (max |value| /
+    127), a quarter of the float32 size. A query is scored against the
+    codes (dequantized in chunks to bound memory), then the best
+    rerank * k rows are re-scored with the full-precision matrix. When the
+    matrix is memory-mapped only those rows are read from disk, so the
+    resident size is the codes.
+    """
+
+    kind = "int8"
+    persistent = True
+
+    def __init__(self, rerank=4, chunk_size=1024):
+        """
+        Args:
+            rerank: Shortlist size as a multiple of k (0 = return the
+                    approximate scores without re-ranking)
+            chunk_size: Rows dequantized at a time (small enough to stay in cache)
+        """
+        super().__init__()
+        self.rerank = rerank
+        self.chunk_size = chunk_size
+        self.codes = None
+        self.scales = None
+
+    def build(self, matrix, labels=None):
+        super().build(matrix, labels)
+        self.codes, self.scales = self.quantize(matrix, self.chunk_size)
+        return self
+
+    def add(self, matrix, labels=None):
+        updated = super().add(matrix, labels)
+        codes, scales = self.quantize(matrix[len(self.codes):], self.chunk_size)
+        updated.codes = np.concatenate([self.codes, codes])
+        updated.scales = np.concatenate([self.scales, scales])
+        return updated
+
+    def search(self, query, k, label=None):
+        rows = None if label is None else self.label_rows.get(label, np.array([], dtype=np.intp))
+        scores = self._approximate_scores(query, rows)
+
+        if self.rerank <= 0:
+            positions = top_k(scores, k)
+            return (positions if rows is None else rows[positions]), scores[positions]
+
+        shortlist = top_k(scores, self.rerank * k)
+        candidates = np.sort(shortlist if rows is None else rows[shortlist])
+        exact = np.asarray(self.matrix[candidates], dtype=np.float32) @ query
+        positions = top_k(exact, k)
+        return candidates[positions], exact[positions]
+
+    def save(self, path, fingerprint):
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            fingerprint=np.array(fingerprint),
+            params=np.array([self.rerank, self.chunk_size]),
+            codes=self.codes,
+            scales=self.scales
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, matrix, labels, fingerprint):
+        try:
+            stored = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        with stored:
+            if str(stored['fingerprint']) != fingerprint or len(stored['scales']) != len(matrix):
+                return None
+
+            rerank, chunk_size = (int(value) for value in stored['params'])
+            index = cls(rerank, chunk_size)
+            ExactIndex.build(index, matrix, labels)
+            index.codes = stored['codes']
+            index.scales = stored['scales']
+
+        return index
+
+    def get_stats(self):
+        return {
+            "kind": self.kind,
+            "rows": 0 if self.codes is None else len(self.codes),
+            "rerank": self.rerank,
+            "code_bytes": 0 if self.codes is None else int(self.codes.nbytes + self.scales.nbytes)
+        }
+
+    @staticmethod
+    def quantize(matrix, chunk_size=65536):
+        """
+        Quantize rows to int8 with a per-row scale
+
+        Args:
+            matrix: float matrix (rows x dim)
+            chunk_size: Rows converted at a time
+
+        Returns:
+            Tuple of (int8 codes, float32 scales); row ~= codes * scale
+        """
+        codes = np.empty(matrix.shape, dtype=np.int8)
+        scales = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), chunk_size):
+            block = np.asarray(matrix[start:start + chunk_size], dtype=np.float32)
+            scale = np.abs(block).max(axis=1) / 127 if block.size else np.ones(len(block), dtype=np.float32)
+            scale[scale == 0] = 1.0
+            codes[start:start + chunk_size] = np.rint(block / scale[:, None])
+            scales[start:start + chunk_size] = scale
+        return codes, scales
+
+    def _approximate_scores(self, query, rows=None):
+        """Inner products with the dequantized rows (all rows, or the given ones)"""
+        n_rows = len(self.codes) if rows is None else len(rows)
+        scores = np.empty(n_rows, dtype=np.float32)
+        buffer = np.empty((self.chunk_size, self.codes.shape[1]), dtype=np.float32)
+        for start in range(0, n_rows, self.chunk_size):
+            end = min(start + self.chunk_size, n_rows)
+            selected = slice(start, end) if rows is None else rows[start:end]
+            block = buffer[:end - start]
+            np.copyto(block, self.codes[selected], casting='unsafe')
+            np.matmul(block, query, out=scores[start:end])
+            scores[start:end] *= self.scales[selected]
+        return scores
+
+
+INDEX_TYPES = {
+    ExactIndex.kind: ExactIndex,
+    IVFFlatIndex.kind: IVFFlatIndex,
+    Int8Index.kind: Int8Index
+}
+
+
+def create_index(kind, **params):
+    """
+    Create an (unbuilt) index by name
+
+    Args:
+        kind: "exact", "ivf" or "int8"
+        **params: Constructor parameters of the index type
+
+    Returns:
+        VectorIndex
+    """
+    if kind not in INDEX_TYPES:
+        raise ValueError(f"Unknown vector index: {kind} (choose from {', '.join(INDEX_TYPES)})")
+    return INDEX_TYPES[kind](**params)
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from config.config import Config
+from src.agents.kb_agent import KnowledgeBaseAgent
+from src.agents.triage_agent import TriageAgent
+from src.async_runtime import run_sync
+from src.embeddings import get_embedding_provider
+from src.manuscript_store import CSVManuscriptStore
+
+
+DELAY = 0.2
+
+
+def slow(result):
+    def blocking(*args, **kwargs):
+        time.sleep(DELAY)
+        return result
+    return blocking
+
+
+def concurrent_seconds(make_call, count=4):
+    """Run count calls at once on the shared background loop"""
+    async def run():
+        start = time.perf_counter()
+        await asyncio.gather(*(make_call() for _ in range(count)))
+        return time.perf_counter() - start
+
+    return run_sync(run())
+
+
+class SlowClassifier:
+    predict = staticmethod(slow({"category": "status_inquiry", "urgency": "low", "confidence": 1.0}))
+
+
+def test_triage_fast_path_does_not_block_the_loop():
+    agent = TriageAgent(local_classifier=SlowClassifier())
+    agent.cache = None
+
+    assert concurrent_seconds(lambda: agent.aclassify("Any news on my manuscript?")) < 2 * DELAY
+
+
+def test_kb_ranking_does_not_block_the_loop(monkeypatch):
+    kb = KnowledgeBaseAgent(embedder=get_embedding_provider("local"))
+    monkeypatch.setattr(kb, "rank", slow([]))
+    monkeypatch.setattr(kb, "rank_lexical", slow([]))
+
+    assert concurrent_seconds(lambda: kb.asearch("Any news?", mode="vector")) < 2 * DELAY
+    assert concurrent_seconds(lambda: kb.asearch("Any news?", mode="lexical")) < 2 * DELAY
+
+
+def test_manuscript_lookup_does_not_block_the_loop(monkeypatch):
+    store = CSVManuscriptStore(f"{Config.DATA_DIR}/manuscript_status_db.csv")
+    monkeypatch.setattr(store, "lookup", slow(None))
+
+    assert concurrent_seconds(lambda: store.alookup("MS-2024-1234")) < 2 * DELAY
+
+
+def test_local_embeddings_do_not_block_the_loop(monkeypatch):
+    embedder = get_embedding_provider("local")
+    monkeypatch.setattr(embedder, "embed", slow(np.zeros((1, 4), dtype=np.float32)))
+
+    assert concurrent_seconds(lambda: embedder.aembed(["Any news?"])) < 2 * DELAY
+
+
+def test_run_sync_on_the_background_loop_raises():
+    async def nested():
+        return run_sync(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="deadlock"):
+        run_sync(nested(), timeout=5)
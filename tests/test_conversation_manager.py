@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+
+from config.config import Config
+from src.conversation_manager import ConversationManager
+from src.orchestrator import CustomerServiceOrchestrator
+
+
+ANSWER = "Manuscript MS-2024-1234 is under review; reviews are due on November 20."
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Config, "EMBEDDING_PROVIDER", "local")
+        yield CustomerServiceOrchestrator(concurrent=False, mode="two_call")
+
+
+@pytest.fixture
+def offline(orchestrator, monkeypatch):
+    """Replace the Claude and embedding calls with fixed results"""
+    async def aclassify(query):
+        return {"category": "status_inquiry", "urgency": "medium",
+                "manuscript_id": None, "issue_summary": query}
+
+    async def asearch(query, category=None, top_k=3):
+        return []
+
+    async def agenerate(*args):
+        return ANSWER, 0.9
+
+    monkeypatch.setattr(orchestrator.triage_agent, "aclassify", aclassify)
+    monkeypatch.setattr(orchestrator.kb_agent, "asearch", asearch)
+    monkeypatch.setattr(orchestrator, "_agenerate_response_from_real_data", agenerate)
+    monkeypatch.setattr(Config, "KB_LEARN_FROM_CONVERSATIONS", False)
+    return orchestrator
+
+
+def test_case_from_ask_for_id_flow(offline):
+    conversation = ConversationManager()
+    offline.process_message("What is the status of my manuscript?", conversation, verbose=False)
+    offline.process_message("It is MS-2024-1234", conversation, verbose=False)
+    offline.process_message("Thanks, that helps!", conversation, verbose=False)
+
+    case = conversation.to_case()
+
+    assert case["query"] == "What is the status of my manuscript? It is MS-2024-1234"
+    assert case["resolution"] == ANSWER
+    assert case["category"] == "status_inquiry"
+    assert case["manuscript_id"] == "MS-2024-1234"
+
+
+def test_no_case_without_generated_answer():
+    conversation = ConversationManager()
+    conversation.add_message('customer', "What is the status of my manuscript?")
+    conversation.add_message('bot', "Please provide your manuscript ID.")
+    conversation.update_context(category='status_inquiry')
+    conversation.context['closed'] = True
+
+    assert conversation.to_case() is None
+
+
+def test_no_case_from_escalated_conversation(offline):
+    conversation = ConversationManager()
+    offline.process_message("Thanks, what is the status of MS-2024-1234?", conversation, verbose=False)
+    conversation.mark_escalated("Customer frustration")
+
+    assert conversation.to_case() is None
+
+
+def test_case_dates_and_tags():
+    conversation = ConversationManager()
+    conversation.add_message('customer', "When will I get a decision on MS-2024-1234?")
+    conversation.add_message('bot', ANSWER, metadata={'triage': {'category': 'decision_timeline'}})
+    conversation.update_context(category='decision_timeline', manuscript_id='MS-2024-1234')
+    conversation.context['closed'] = True
+    conversation.created_at = datetime(2024, 5, 1, 9, 0)
+    conversation.last_updated = datetime(2024, 5, 1, 10, 30)
+
+    case = conversation.to_case()
+
+    assert case["created_date"] == "2024-05-01"
+    assert case["resolution_time_hours"] == 1.5
+    assert case["urgency"] == "medium"
+    assert case["tags"] == ["from_conversation"]
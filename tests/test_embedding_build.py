@@ -0,0 +1,31 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.embedding_build import EmbeddingBuilder
+
+
+def test_failed_run_checkpoints_batches_finished_alongside_the_failure():
+    started = threading.Event()
+
+    def embed(batch):
+        if batch[0] == "0":
+            # Fail while the other batch is still running
+            started.wait(5)
+            raise RuntimeError("provider down")
+        started.set()
+        time.sleep(0.2)
+        return [[1.0, 0.0]] * len(batch)
+
+    matrix = np.zeros((4, 2), dtype=np.float32)
+    done = np.zeros(4, dtype=bool)
+    checkpointed = []
+
+    builder = EmbeddingBuilder(embed, batch_size=2, workers=2, checkpoint_seconds=3600)
+    with pytest.raises(RuntimeError):
+        builder.run(["0", "1", "2", "3"], matrix, done, checkpoint=lambda: checkpointed.append(done.copy()))
+
+    assert checkpointed[-1].tolist() == [False, False, True, True]
+    assert matrix[2:, 0].tolist() == [1.0, 1.0]
@@ -0,0 +1,62 @@
+import struct
+
+import numpy as np
+
+from src.embedding_store import EmbeddingStore
+
+
+def write_tight_npy(path, array):
+    """Write a .npy file whose header has no room for a longer shape"""
+    header = repr({'descr': np.lib.format.dtype_to_descr(array.dtype), 'fortran_order': False,
+                   'shape': array.shape}) + '\n'
+    with open(path, 'wb') as f:
+        f.write(np.lib.format.magic(1, 0) + struct.pack('<H', len(header)) + header.encode('latin1'))
+        f.write(array.tobytes())
+
+
+def make_store(tmp_path, rows):
+    rng = np.random.default_rng(0)
+    store = EmbeddingStore(str(tmp_path / "cases_embeddings"))
+    texts = [f"case {i}" for i in range(rows)]
+    store.save(rng.normal(size=(rows, 8)), EmbeddingStore.row_hashes(texts), "test-model", "hash-1")
+    return store, texts
+
+
+def test_append_grows_both_files(tmp_path):
+    store, texts = make_store(tmp_path, 9)
+
+    store.append(np.ones((2, 8)), EmbeddingStore.row_hashes(["new 1", "new 2"]), "hash-2")
+
+    assert store.open().shape == (11, 8)
+    assert len(np.load(store.row_hashes_path)) == 11
+    assert store.read_metadata()['rows'] == 11
+
+
+def test_append_rewrites_store_when_row_hashes_header_is_full(tmp_path):
+    store, texts = make_store(tmp_path, 9)
+    # (9,) -> (10,) no longer fits; the matrix header still has room
+    write_tight_npy(store.row_hashes_path, EmbeddingStore.row_hashes(texts))
+    before = np.array(store.open())
+
+    new_rows = np.ones((1, 8), dtype=np.float32)
+    store.append(new_rows, EmbeddingStore.row_hashes(["new"]), "hash-2")
+
+    matrix = store.open()
+    hashes = np.load(store.row_hashes_path)
+    assert matrix.shape == (10, 8)
+    assert len(hashes) == 10
+    assert store.read_metadata()['rows'] == 10
+    np.testing.assert_allclose(matrix[:9], before, rtol=1e-6)
+    np.testing.assert_allclose(matrix[9], new_rows[0] / np.linalg.norm(new_rows[0]), rtol=1e-6)
+    assert hashes[9] == EmbeddingStore.row_hashes(["new"])[0]
+
+
+def test_append_overwrites_rows_left_by_an_interrupted_append(tmp_path):
+    store, texts = make_store(tmp_path, 9)
+    # Matrix grown, but the append stopped before the row hashes and metadata
+    EmbeddingStore._append_npy(store.matrix_path, np.zeros((3, 8), dtype=np.float32), 9)
+
+    store.append(np.ones((1, 8)), EmbeddingStore.row_hashes(["new"]), "hash-2")
+
+    assert store.open().shape == (10, 8)
+    assert len(np.load(store.row_hashes_path)) == 10
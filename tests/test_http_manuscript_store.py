@@ -0,0 +1,130 @@
+import asyncio
+import time
+
+import pytest
+
+from scripts.stub_editorial_server import start_stub_server
+from src.agents.manuscript_lookup_agent import ManuscriptLookupAgent
+from src.async_runtime import run_sync
+from src.manuscript_store import HTTPManuscriptStore, ManuscriptServiceError
+
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def editorial():
+    server, url = start_stub_server()
+    yield server, url
+    stop(server)
+
+
+def test_lookup_retries_server_errors():
+    server, url = start_stub_server(fail_first=2, fail_status=503)
+    try:
+        store = HTTPManuscriptStore(url, max_retries=2)
+        record = store.lookup("MS-2024-1234")
+    finally:
+        stop(server)
+
+    assert record["author_name"] == "Dr. John Smith"
+    assert server.state.requests == 3
+    assert store.get_service_stats()["retries"] == 2
+
+
+def test_lookup_fails_once_retries_are_used_up():
+    server, url = start_stub_server(fail_first=10, fail_status=503)
+    try:
+        store = HTTPManuscriptStore(url, max_retries=1)
+        with pytest.raises(ManuscriptServiceError, match="503"):
+            store.lookup("MS-2024-1234")
+    finally:
+        stop(server)
+
+    assert server.state.requests == 2
+    assert store.get_service_stats()["errors"] == 1
+
+
+def test_client_errors_are_not_retried(editorial):
+    server, url = editorial
+    store = HTTPManuscriptStore(url, max_retries=2)
+
+    with pytest.raises(ManuscriptServiceError):
+        run_sync(store._request("/v1/unknown"))
+
+    assert server.state.requests == 1
+
+
+def test_lookups_are_cached_until_the_ttl_expires(editorial):
+    server, url = editorial
+    store = HTTPManuscriptStore(url, cache_ttl=0.2)
+
+    first = store.lookup("MS-2024-1234")
+    assert store.lookup("ms-2024-1234") == first
+    assert store.lookup("MS-2099-0000") is None
+    assert store.lookup("MS-2099-0000") is None
+    assert server.state.lookups == {"MS-2024-1234": 1, "MS-2099-0000": 1}
+
+    time.sleep(0.25)
+    store.lookup("MS-2024-1234")
+
+    assert server.state.lookups["MS-2024-1234"] == 2
+
+
+def test_concurrent_lookups_of_one_id_share_a_request():
+    server, url = start_stub_server(latency=0.1)
+    try:
+        store = HTTPManuscriptStore(url)
+
+        async def burst():
+            return await asyncio.gather(*(store.alookup("MS-2024-1234") for _ in range(10)))
+
+        records = run_sync(burst())
+    finally:
+        stop(server)
+
+    assert all(record == records[0] for record in records)
+    assert server.state.lookups == {"MS-2024-1234": 1}
+    assert store.get_service_stats()["coalesced"] == 9
+
+
+def test_stats_report_server_errors():
+    server, url = start_stub_server(fail_first=10, fail_status=503)
+    try:
+        stats = ManuscriptLookupAgent(db_path=url, backend="http").get_stats()
+    finally:
+        stop(server)
+
+    assert "503" in stats["error"]
+    assert stats["service"]["errors"] == 1
+
+
+def test_async_variants_run_on_the_background_loop(editorial):
+    server, url = editorial
+    store = HTTPManuscriptStore(url)
+
+    async def dashboard():
+        return (
+            await store.aget_by_author("Smith"),
+            await store.aget_by_status("Under Review"),
+            await store.astats()
+        )
+
+    by_author, by_status, stats = run_sync(dashboard())
+
+    assert by_author == store.get_by_author("Smith")
+    assert by_status == store.get_by_status("Under Review")
+    assert stats["count"] == store.count()
+
+
+def test_sync_call_from_the_background_loop_raises_instead_of_deadlocking(editorial):
+    server, url = editorial
+    store = HTTPManuscriptStore(url)
+
+    async def misuse():
+        return store.get_by_author("Smith")
+
+    with pytest.raises(RuntimeError, match="async variant"):
+        run_sync(misuse(), timeout=5)
@@ -0,0 +1,127 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from config.config import Config
+from src.agents.kb_agent import KnowledgeBaseAgent
+from src.embeddings import get_embedding_provider
+from src.vector_index import ExactIndex, Int8Index, IVFFlatIndex
+
+
+CASE = {
+    "query": "Can I add a co-author after acceptance?",
+    "category": "revision_submission",
+    "urgency": "low",
+    "resolution": "Author changes after acceptance need the editor's approval."
+}
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = tmp_path / "cases.csv"
+    shutil.copy(Config.SYNTHETIC_DATA_PATH, path)
+    return str(path)
+
+
+def load(data_path):
+    return KnowledgeBaseAgent(data_path=data_path, embedder=get_embedding_provider("local"))
+
+
+def test_add_cases_appends_to_disk(data_path):
+    kb = load(data_path)
+    rows = len(kb.data)
+
+    assert kb.add_cases([CASE]) == 1
+
+    assert len(pd.read_csv(data_path)) == rows + 1
+    assert len(load(data_path).embeddings) == rows + 1
+
+
+def test_add_cases_refuses_stale_knowledge_base(data_path):
+    # Two processes sharing one knowledge base: the second one's copy is stale
+    # once the first has added a case
+    first, second = load(data_path), load(data_path)
+    first.add_cases([CASE])
+
+    with pytest.raises(RuntimeError):
+        second.add_cases([{**CASE, "query": "Who pays the open access fee?"}])
+
+    assert pd.read_csv(data_path)["query"].tolist()[-1] == CASE["query"]
+
+
+@pytest.mark.parametrize("mode", ["vector", "lexical", "hybrid"])
+def test_added_case_is_found_by_search(data_path, mode):
+    kb = load(data_path)
+    kb.add_cases([{**CASE, "id": "CONV_NEW"}])
+
+    results = kb.search(CASE["query"], category=CASE["category"], top_k=3, mode=mode)
+
+    assert results[0]["id"] == "CONV_NEW"
+    assert results[0]["resolution"] == CASE["resolution"]
+
+
+def test_tag_lists_are_stored_like_the_generated_data(data_path):
+    kb = load(data_path)
+    kb.add_cases([{**CASE, "tags": ["from_conversation"]}])
+
+    tags = pd.read_csv(data_path)["tags"]
+
+    assert tags.iloc[0] == "['initial_review', 'timeline_query']"
+    assert tags.iloc[-1] == "['from_conversation']"
+    assert kb.search(CASE["query"], top_k=1)[0]["tags"] == "['from_conversation']"
+
+
+@pytest.mark.parametrize("kind", ["ivf", "int8"])
+def test_kb_index_config_selects_persisted_index(data_path, monkeypatch, kind):
+    monkeypatch.setattr(Config, "KB_INDEX", kind)
+    monkeypatch.setattr(Config, "KB_IVF_LISTS", 4)
+    monkeypatch.setattr(Config, "KB_IVF_PROBES", 4)
+    monkeypatch.setattr(Config, "KB_INT8_RERANK", 8)
+    kb = load(data_path)
+
+    index_type = {"ivf": IVFFlatIndex, "int8": Int8Index}[kind]
+    assert isinstance(kb.index, index_type)
+    assert os.path.exists(kb._index_path())
+    if kind == "ivf":
+        assert (kb.index.n_lists, kb.index.n_probe) == (4, 4)
+    else:
+        assert kb.index.rerank == 8
+
+    # Reloaded from disk; probing every list / re-ranking matches exact search
+    reloaded = load(data_path)
+    monkeypatch.setattr(Config, "KB_INDEX", "exact")
+    exact = load(data_path)
+    assert isinstance(exact.index, ExactIndex) and not isinstance(exact.index, Int8Index)
+    for query in ["When will I get reviewer comments?", "How do I pay the APC?"]:
+        assert [r["id"] for r in reloaded.search(query, top_k=3, mode="vector")] == \
+            [r["id"] for r in exact.search(query, top_k=3, mode="vector")]
+
+
+@pytest.mark.parametrize("mode", ["vector", "lexical", "hybrid"])
+def test_search_many_matches_search_per_query(data_path, mode):
+    kb = load(data_path)
+    # Several blocks per category group
+    kb.SEARCH_MANY_BLOCK_ELEMENTS = 2 * len(kb.matrix)
+    queries = [
+        "When will I get the reviewer comments?",
+        "How do I withdraw my manuscript?",
+        "My paper has been under review for months",
+        "Can I upload a revised figure?",
+        "When will the editor decide?",
+        "What is the status of MS-2024-1234?",
+    ]
+    categories = [None, "withdrawal_request", "review_delay", None, "decision_timeline", "review_delay"]
+
+    results = kb.search_many(queries, categories, top_k=3, mode=mode)
+
+    assert len(results) == len(queries)
+    for query, category, found in zip(queries, categories, results):
+        expected = kb.search(query, category=category, top_k=3, mode=mode)
+        assert [r["id"] for r in found] == [r["id"] for r in expected]
+        assert [r["relevance_score"] for r in found] == pytest.approx(
+            [r["relevance_score"] for r in expected], rel=1e-5
+        )
+        if category is not None:
+            assert {r["category"] for r in found} == {category}
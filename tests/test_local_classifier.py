@@ -0,0 +1,46 @@
+import pytest
+
+from config.config import Config
+from src.local_classifier import LocalTriageClassifier
+
+
+OFF_TOPIC_QUERIES = [
+    "Can you help me with my taxes?",
+    "Can you help me with my car insurance claim?",
+    "What's the weather tomorrow?",
+    "I need a refund for my hotel booking",
+    "How do I reset my password for my bank?",
+    "Tell me a joke",
+    "Hello"
+]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return LocalTriageClassifier.from_csv()
+
+
+@pytest.mark.parametrize("query", OFF_TOPIC_QUERIES)
+def test_off_topic_queries_are_left_to_claude(classifier, query):
+    assert classifier.predict(query)["confidence"] < Config.LOCAL_TRIAGE_THRESHOLD
+
+
+def test_off_topic_query_gets_zero_confidence(classifier):
+    # The category softmax alone gives this query 0.87
+    assert classifier.predict("Can you help me with my taxes?")["confidence"] == 0.0
+
+
+def test_in_domain_query_is_classified_locally(classifier):
+    result = classifier.predict("My manuscript has been under review for months, any update?")
+
+    assert result["confidence"] >= Config.LOCAL_TRIAGE_THRESHOLD
+    assert result["category"] in Config.CATEGORIES
+    assert result["source"] == "local"
+
+
+def test_floors_can_be_disabled():
+    classifier = LocalTriageClassifier.from_csv()
+    classifier.min_similarity = 0.0
+    classifier.min_coverage = 0.0
+
+    assert classifier.predict("Can you help me with my taxes?")["confidence"] > 0.5
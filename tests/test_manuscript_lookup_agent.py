@@ -0,0 +1,33 @@
+import pytest
+
+from config.config import Config
+from scripts.stub_editorial_server import start_stub_server
+from src.agents.manuscript_lookup_agent import ManuscriptLookupAgent
+
+
+@pytest.fixture
+def no_retries(monkeypatch):
+    monkeypatch.setattr(Config, "MANUSCRIPT_API_MAX_RETRIES", 0)
+
+
+def test_stats_from_editorial_system():
+    server, url = start_stub_server()
+    try:
+        stats = ManuscriptLookupAgent(db_path=url, backend="http").get_stats()
+    finally:
+        server.shutdown()
+
+    assert "error" not in stats
+    assert stats["total_manuscripts"] > 0
+
+
+def test_stats_report_editorial_system_outage(no_retries):
+    server, url = start_stub_server()
+    server.shutdown()
+    server.server_close()
+
+    stats = ManuscriptLookupAgent(db_path=url, backend="http").get_stats()
+
+    assert "failed" in stats["error"]
+    assert stats["backend"] == "http"
+    assert stats["service"]["errors"] == 1
@@ -0,0 +1,153 @@
+import gc
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from config.config import Config
+from src.manuscript_store import MANUSCRIPT_COLUMNS, ConnectionPool, CSVManuscriptStore, SQLiteManuscriptStore
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "manuscripts.csv"
+    shutil.copy(os.path.join(Config.DATA_DIR, "manuscript_status_db.csv"), path)
+    return str(path)
+
+
+@pytest.fixture
+def sqlite_store(csv_path, tmp_path):
+    """SQLite database imported from the same CSV (as scripts/import_manuscripts.py does)"""
+    store = SQLiteManuscriptStore(str(tmp_path / "manuscripts.db"), pool_size=2)
+    store.upsert(pd.read_csv(csv_path)[list(MANUSCRIPT_COLUMNS)].to_dict('records'))
+    yield store
+    store.close()
+
+
+def refresh_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "manuscript-refresh"]
+
+
+def test_shared_store_is_loaded_once_per_file(csv_path):
+    first = CSVManuscriptStore.shared(csv_path, refresh_seconds=5)
+
+    assert CSVManuscriptStore.shared(csv_path, refresh_seconds=5) is first
+
+
+def test_unused_stores_are_freed_without_threads(csv_path):
+    store = CSVManuscriptStore.shared(csv_path, refresh_seconds=0.01)
+    store.lookup("MS-2024-1234")
+    del store
+    gc.collect()
+
+    assert not refresh_threads()
+    assert (os.path.abspath(csv_path), 0.01) not in CSVManuscriptStore._shared
+
+
+def test_file_changes_are_picked_up_on_access(csv_path):
+    store = CSVManuscriptStore(csv_path, refresh_seconds=0.01)
+    assert store.lookup("MS-2024-1234")["current_status"] == "Under Review"
+
+    db = pd.read_csv(csv_path)
+    db.loc[db["manuscript_id"] == "MS-2024-1234", "current_status"] = "Accepted"
+    db.to_csv(f"{csv_path}.tmp", index=False)
+    os.replace(f"{csv_path}.tmp", csv_path)
+    time.sleep(0.02)
+
+    # The due check starts the reload; reads keep the old table meanwhile
+    store.lookup("MS-2024-1234")
+    for thread in refresh_threads():
+        thread.join()
+
+    assert store.lookup("MS-2024-1234")["current_status"] == "Accepted"
+
+
+def test_sqlite_lookups_match_csv(csv_path, sqlite_store):
+    csv_store = CSVManuscriptStore(csv_path)
+    ids = pd.read_csv(csv_path)["manuscript_id"].tolist()
+
+    for manuscript_id in ids:
+        assert sqlite_store.lookup(manuscript_id) == csv_store.lookup(manuscript_id)
+        assert sqlite_store.lookup(manuscript_id.lower()) == csv_store.lookup(manuscript_id)
+    assert sqlite_store.lookup("MS-1999-0000") is None
+    assert sqlite_store.lookup_many(ids + ["MS-1999-0000"]) == csv_store.lookup_many(ids + ["MS-1999-0000"])
+
+
+def test_sqlite_status_and_author_queries_match_csv(csv_path, sqlite_store):
+    csv_store = CSVManuscriptStore(csv_path)
+    data = pd.read_csv(csv_path)
+
+    def ids(manuscripts):
+        return sorted(m["manuscript_id"] for m in manuscripts)
+
+    def csv_substring_ids(author):
+        # The CSV backend lists substring matches first, then typo-tolerant ones
+        matches = [m for m in csv_store.get_by_author(author) if author.lower() in m["author_name"].lower()]
+        return ids(matches)
+
+    for status in data["current_status"].unique():
+        assert ids(sqlite_store.get_by_status(status)) == ids(csv_store.get_by_status(status))
+        assert ids(sqlite_store.get_by_status(status.upper())) == ids(csv_store.get_by_status(status))
+    for author in data["author_name"].unique():
+        for name in (author, author.split()[-1], author.split()[-1].upper()):
+            assert ids(sqlite_store.get_by_author(name)) == csv_substring_ids(name)
+
+    assert sqlite_store.count() == csv_store.count()
+    assert sqlite_store.status_counts() == csv_store.status_counts()
+    assert sqlite_store.review_time_stats() == csv_store.review_time_stats()
+
+
+def test_sqlite_upsert_updates_rows_and_aggregates(sqlite_store):
+    record = sqlite_store.lookup("MS-2024-1234")
+    counts = sqlite_store.status_counts()
+
+    sqlite_store.upsert([{**record, "current_status": "Accepted"}])
+
+    assert sqlite_store.lookup("MS-2024-1234")["current_status"] == "Accepted"
+    assert sqlite_store.status_counts()["Accepted"] == counts["Accepted"] + 1
+    assert sqlite_store.count() == sum(counts.values())
+
+
+def test_connection_pool_waits_when_exhausted(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2)
+    borrowed = threading.Event()
+
+    def borrow():
+        with pool.connection():
+            borrowed.set()
+
+    with pool.connection(), pool.connection():
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        assert not borrowed.wait(0.2)
+    assert borrowed.wait(2)
+    thread.join()
+
+    # The waiting thread reused a returned connection
+    assert pool.opened == 2
+    pool.close()
+
+
+def test_sqlite_store_never_opens_more_than_pool_size(sqlite_store):
+    ids = [m["manuscript_id"] for m in sqlite_store.get_by_status("Under Review")]
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(50):
+                for manuscript_id in ids:
+                    assert sqlite_store.lookup(manuscript_id)["manuscript_id"] == manuscript_id
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sqlite_store.pool.opened <= 2
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from config.config import Config
+from src.triage_cache import TriageCache, triage_fingerprint
+
+
+RESULT = {
+    "category": "status_inquiry",
+    "urgency": "medium",
+    "manuscript_id": "MS-2024-1234",
+    "issue_summary": "Author asks about MS-2024-1234 and ms-2024-5678"
+}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "triage.db")
+
+
+def test_ids_are_masked_in_keys_and_unmasked_on_hit(db_path):
+    cache = TriageCache(db_path=db_path)
+    fingerprint = triage_fingerprint("prompt")
+    cache.set("Any update on MS-2024-1234 and MS-2024-5678?", RESULT, fingerprint)
+
+    hit = cache.get("any update on ms-2023-0001 and MS-2023-0002", fingerprint)
+
+    assert hit["manuscript_id"] == "MS-2023-0001"
+    assert hit["issue_summary"] == "Author asks about MS-2023-0001 and MS-2023-0002"
+    assert hit["category"] == "status_inquiry"
+
+
+def test_round_trip_through_the_sqlite_tier(db_path):
+    fingerprint = triage_fingerprint("prompt")
+    TriageCache(db_path=db_path).set("Status of MS-2024-1234?", RESULT, fingerprint)
+
+    # A new instance has an empty memory tier, as another worker would
+    hit = TriageCache(db_path=db_path).get("Status of MS-2024-9999?", fingerprint)
+
+    assert hit["manuscript_id"] == "MS-2024-9999"
+    assert TriageCache(db_path=db_path).get("Status of MS-2024-1234?", fingerprint)["manuscript_id"] == "MS-2024-1234"
+
+
+def test_fingerprint_change_invalidates_entries(db_path):
+    old, new = triage_fingerprint("old prompt"), triage_fingerprint("new prompt")
+    cache = TriageCache(db_path=db_path)
+    cache.set("Status of MS-2024-1234?", RESULT, old)
+
+    assert old != new
+    assert cache.get("Status of MS-2024-1234?", new) is None
+
+    cache.purge_stale(new)
+    assert TriageCache(db_path=db_path).get("Status of MS-2024-1234?", old) is None
+
+
+def test_sqlite_entries_expire_after_the_ttl(db_path):
+    fingerprint = triage_fingerprint("prompt")
+    TriageCache(db_path=db_path, ttl_seconds=0.2).set("Status of MS-2024-1234?", RESULT, fingerprint)
+
+    assert TriageCache(db_path=db_path, ttl_seconds=0.2).get("Status of MS-2024-1234?", fingerprint) is not None
+    time.sleep(0.3)
+    assert TriageCache(db_path=db_path, ttl_seconds=0.2).get("Status of MS-2024-1234?", fingerprint) is None
+
+
+def test_fingerprint_changes_with_categories(monkeypatch):
+    before = triage_fingerprint("prompt")
+    monkeypatch.setattr(Config, "CATEGORIES", Config.CATEGORIES + ["refund"])
+
+    assert triage_fingerprint("prompt") != before
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from src.vector_index import ExactIndex, Int8Index, IVFFlatIndex, create_index
+
+
+def normalize(matrix):
+    return (matrix / np.linalg.norm(matrix, axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def data():
+    """Clustered, normalized rows with labels, and queries near random rows"""
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(40, 32))
+    matrix = normalize(centers[rng.integers(40, size=4000)] + 0.4 * rng.normal(size=(4000, 32)))
+    labels = rng.integers(5, size=4000)
+    queries = normalize(matrix[rng.integers(4000, size=50)] + 0.2 * rng.normal(size=(50, 32)))
+    return matrix, labels, queries
+
+
+def recall(index, exact, queries, k, label=None):
+    found = [
+        len(set(index.search(query, k, label)[0]) & set(exact.search(query, k, label)[0])) / k
+        for query in queries
+    ]
+    return float(np.mean(found))
+
+
+def test_ivf_recall_against_exact(data):
+    matrix, labels, queries = data
+    exact = ExactIndex().build(matrix, labels)
+    ivf = IVFFlatIndex(n_lists=64, n_probe=8).build(matrix, labels)
+
+    assert recall(ivf, exact, queries, k=10) >= 0.9
+    assert recall(ivf, exact, queries, k=10, label=3) >= 0.9
+
+
+def test_ivf_probing_every_list_matches_exact_order(data):
+    matrix, labels, queries = data
+    exact = ExactIndex().build(matrix, labels)
+    ivf = IVFFlatIndex(n_lists=64, n_probe=64).build(matrix, labels)
+
+    for query in queries[:10]:
+        for label in (None, 2):
+            indices, scores = ivf.search(query, 10, label)
+            exact_indices, exact_scores = exact.search(query, 10, label)
+            np.testing.assert_array_equal(indices, exact_indices)
+            np.testing.assert_allclose(scores, exact_scores, rtol=1e-5)
+
+
+def test_ivf_label_filter_returns_k_rows_of_the_label(data):
+    matrix, labels, queries = data
+    ivf = IVFFlatIndex(n_lists=64, n_probe=1).build(matrix, labels)
+
+    indices, _ = ivf.search(queries[0], 10, label=4)
+
+    assert len(indices) == 10
+    assert set(labels[indices]) == {4}
+
+
+def test_ivf_add_indexes_new_rows(data):
+    matrix, labels, queries = data
+    ivf = IVFFlatIndex(n_lists=64, n_probe=8).build(matrix[:3000], labels[:3000])
+
+    grown = ivf.add(matrix, labels[3000:])
+    exact = ExactIndex().build(matrix, labels)
+
+    assert recall(grown, exact, queries, k=10) >= 0.9
+    assert ivf.search(matrix[3500], 1)[0][0] != 3500
+    assert grown.search(matrix[3500], 1)[0][0] == 3500
+
+
+@pytest.mark.parametrize("label", [None, 1])
+def test_int8_rerank_matches_exact_top_k(data, label):
+    matrix, labels, queries = data
+    exact = ExactIndex().build(matrix, labels)
+    int8 = Int8Index(rerank=4, chunk_size=512).build(matrix, labels)
+
+    for query in queries:
+        indices, scores = int8.search(query, 10, label)
+        exact_indices, exact_scores = exact.search(query, 10, label)
+        np.testing.assert_array_equal(indices, exact_indices)
+        # Re-ranked scores are the full-precision ones
+        np.testing.assert_allclose(scores, exact_scores, rtol=1e-6)
+
+
+def test_create_index_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        create_index("hnsw")